@@ -0,0 +1,6 @@
+"""Performance benchmarks for Pyndemic.
+
+Every benchmark is a standalone module, run it from the repository root:
+
+    python3 -m benchmark.bench_outbreak
+"""
@@ -0,0 +1,38 @@
+"""Map compilation cost: building the topology from the settings sections
+versus loading it from the on-disk board cache.
+"""
+import tempfile
+
+from pyndemic import config
+from pyndemic.topology import Topology, load_compiled
+
+from .common import measure, report
+
+
+LOADS = 1000
+
+
+def main():
+    settings = config.get_settings()
+
+    def compile_topologies():
+        for _ in range(LOADS):
+            Topology.from_settings(settings)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        load_compiled(settings, cache_dir)
+
+        def load_topologies():
+            for _ in range(LOADS):
+                load_compiled(settings, cache_dir)
+
+        seconds = measure(compile_topologies)
+        report('Compile the stock map from settings', seconds, LOADS,
+               unit='map')
+        seconds = measure(load_topologies)
+        report('Load the stock map from the board cache', seconds, LOADS,
+               unit='map')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Game snapshots: cloning a started game and playing out an infect phase
+on every clone, as a search or what-if analysis would.
+"""
+from .common import new_started_controller, measure, report
+
+
+CLONES = 10_000
+
+
+def bench_clones(game):
+    def clone_all():
+        for _ in range(CLONES):
+            game.clone()
+
+    return measure(clone_all)
+
+
+def bench_rollouts(game):
+    def roll_out_all():
+        for _ in range(CLONES):
+            game.clone().infect_city_phase()
+
+    return measure(roll_out_all)
+
+
+def main():
+    controller = new_started_controller(
+        outbreak_death_level=10 ** 9, max_resistance=10 ** 9)
+    game = controller.game
+
+    report(f'Clone a started game ({len(game.cities)} cities)',
+           bench_clones(game), CLONES, unit='clone')
+    report('Clone and run an infect phase',
+           bench_rollouts(game), CLONES, unit='clone')
+
+
+if __name__ == '__main__':
+    main()
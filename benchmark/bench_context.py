@@ -0,0 +1,77 @@
+"""Game object construction cost: attaching new objects to the active
+context variable compared to the former lookup that walked the interpreter
+stack for the nearest caller holding a context.
+"""
+import inspect
+
+from pyndemic.card import InfectCard
+from pyndemic.core.context import game_context
+
+from .common import new_started_controller, measure, report
+
+
+OBJECTS = 100_000
+
+
+def search_context_by_frames():
+    """The former context lookup, kept here for comparison."""
+    frame = inspect.currentframe()
+    try:
+        while frame is not None:
+            if 'self' not in frame.f_locals:
+                frame = frame.f_back
+                continue
+
+            calling_object = frame.f_locals['self']
+            if hasattr(calling_object, '_ctx'):
+                return calling_object._ctx
+
+            frame = frame.f_back
+    finally:
+        del frame
+
+    return None
+
+
+def construct_by_frames(cls, *args):
+    """Imitates the former object construction of the game entity
+    metaclass.
+    """
+    obj = cls.__new__(cls)
+    obj.__init__(*args)
+    obj._ctx = search_context_by_frames()
+
+    return obj
+
+
+class CardFactory:
+    """Imitates a deck creating its cards, the common case for the former
+    lookup as the context holder is the direct caller.
+    """
+    def __init__(self, ctx):
+        self._ctx = ctx
+
+    def create_cards_by_frames(self):
+        for _ in range(OBJECTS):
+            construct_by_frames(InfectCard, 'London', 'Blue')
+
+    def create_cards(self):
+        with game_context(self._ctx):
+            for _ in range(OBJECTS):
+                InfectCard('London', 'Blue')
+
+
+def main():
+    controller = new_started_controller()
+    factory = CardFactory(controller._ctx)
+
+    report('Create cards, stack frame lookup',
+           measure(factory.create_cards_by_frames), OBJECTS, unit='card')
+    report('Create cards, context variable',
+           measure(factory.create_cards), OBJECTS, unit='card')
+    report('Create a started game',
+           measure(new_started_controller, repeat=20), 1, unit='game')
+
+
+if __name__ == '__main__':
+    main()
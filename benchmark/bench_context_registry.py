@@ -0,0 +1,64 @@
+"""Context registry stress test: many threads create and drop context
+holders (the way a server hosts short game lifetimes) and look contexts up
+by id. Reports the throughput and checks that no id collided and that every
+context was unregistered.
+"""
+import gc
+import threading
+import time
+
+from pyndemic.core.context import (ContextRegistrationMeta, get_context,
+                                   _ContextManager)
+
+from .common import report
+
+
+LIFETIMES = 200_000
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+
+
+class Holder(metaclass=ContextRegistrationMeta, ctx_name='holder'):
+    pass
+
+
+def run_lifetimes(count, errors):
+    try:
+        for _ in range(count):
+            holder = Holder()
+            get_context(holder._ctx['id'])
+            del holder
+    except Exception as e:
+        errors.append(e)
+
+
+def stress(thread_count):
+    errors = []
+    per_thread = LIFETIMES // thread_count
+    threads = [threading.Thread(target=run_lifetimes,
+                                args=(per_thread, errors))
+               for _ in range(thread_count)]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    return elapsed, per_thread * thread_count, errors
+
+
+def main():
+    for thread_count in THREAD_COUNTS:
+        seconds, lifetimes, errors = stress(thread_count)
+        report(f'Context lifetimes, {thread_count} threads',
+               seconds, lifetimes, unit='ctx')
+        if errors:
+            print(f'  {len(errors)} errors, first: {errors[0]!r}')
+        if _ContextManager._contexts:
+            print(f'  {len(_ContextManager._contexts)} contexts leaked')
+
+
+if __name__ == '__main__':
+    main()
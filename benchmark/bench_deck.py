@@ -0,0 +1,78 @@
+"""Deck micro-benchmarks: top and bottom draws and discard reshuffles."""
+import random
+
+from pyndemic.card import InfectCard
+from pyndemic.deck import InfectDeck
+
+from .common import measure, report
+
+
+DECK_SIZE = 100_000
+RESHUFFLES = 1000
+RESHUFFLED_CARDS = 10
+
+
+def new_deck(size):
+    deck = InfectDeck(rng=random.Random(42))
+    for i in range(size):
+        deck.add_card(InfectCard(f'City{i}', 'Blue'))
+
+    return deck
+
+
+def bench_top_draws(deck, cards):
+    def draw_all():
+        deck.cards.extend(cards)
+        for _ in range(len(cards)):
+            deck.draw_card(None, on_draw=False)
+
+    return measure(draw_all)
+
+
+def bench_bottom_draws(deck, cards):
+    def draw_all():
+        deck.cards.extend(cards)
+        for _ in range(len(cards)):
+            deck.take_bottom_card()
+
+    return measure(draw_all)
+
+
+def bench_batch_draws(deck, cards, batch_size):
+    def draw_all():
+        deck.cards.extend(cards)
+        for _ in range(len(cards) // batch_size):
+            deck.take_top_cards(batch_size)
+
+    return measure(draw_all)
+
+
+def bench_reshuffles(deck):
+    def reshuffle():
+        for _ in range(RESHUFFLES):
+            for _ in range(RESHUFFLED_CARDS):
+                deck.add_discard(deck.take_top_card(), on_discard=False)
+            deck.shuffle_discard_to_top()
+
+    return measure(reshuffle)
+
+
+def main():
+    deck = new_deck(DECK_SIZE)
+    cards = list(deck.cards)
+    deck.cards.clear()
+    report(f'Draw from top ({DECK_SIZE} cards)',
+           bench_top_draws(deck, cards), DECK_SIZE, unit='card')
+    report(f'Take from bottom ({DECK_SIZE} cards)',
+           bench_bottom_draws(deck, cards), DECK_SIZE, unit='card')
+    report(f'Take 4 from top ({DECK_SIZE} cards)',
+           bench_batch_draws(deck, cards, 4), DECK_SIZE, unit='card')
+
+    deck = new_deck(DECK_SIZE)
+    report(f'Reshuffle {RESHUFFLED_CARDS} discards to top '
+           f'({DECK_SIZE} cards)',
+           bench_reshuffles(deck), RESHUFFLES, unit='reshuffle')
+
+
+if __name__ == '__main__':
+    main()
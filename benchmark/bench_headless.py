@@ -0,0 +1,54 @@
+"""Full game sessions in interactive versus headless mode.
+
+Every session is a complete game on the stock map driven through the
+controller request API, where all characters pass their turns until the game
+is lost. Logging stays configured as in `settings.cfg`, like in a regular
+interactive session.
+"""
+import logging
+
+from pyndemic.controller import GameController
+from pyndemic.core import api
+
+from .common import PLAYERS, measure, report
+
+
+GAMES = 50
+PASS_REQUEST = {'type': api.RequestTypes.COMMAND, 'command': 'pass',
+                'args': {}}
+
+
+def play_game(random_state, **settings):
+    controller = GameController(players=PLAYERS, random_state=random_state,
+                                **settings)
+    with controller:
+        while True:
+            response = controller.send(PASS_REQUEST)
+            if response['type'] == api.ResponseTypes.TERMINATION:
+                break
+
+
+def play_games(**settings):
+    for random_state in range(GAMES):
+        play_game(random_state, **settings)
+
+
+def main():
+    logging.disable(logging.NOTSET)
+
+    interactive = measure(play_games, repeat=3)
+    report('Interactive game', interactive, GAMES, unit='game')
+
+    headless = measure(lambda: play_games(headless=True), repeat=3)
+    report('Headless game', headless, GAMES, unit='game')
+
+    batched = measure(
+        lambda: play_games(headless=True, batch_infect_phase=True), repeat=3)
+    report('Headless game, batched infect phase', batched, GAMES, unit='game')
+
+    print(f'Headless speed-up: {interactive / headless:.1f}x '
+          f'({interactive / batched:.1f}x with batched infect phase)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Card-by-card versus batched infect phase on the stock map."""
+from .common import new_started_controller, measure, report
+
+
+PHASES = 2000
+
+
+def run_phases(controller, batched):
+    game = controller.game
+    game.batch_infect_phase = batched
+    initial_levels = game.board.snapshot()
+    initial_health = {colour: disease.public_health
+                      for colour, disease in game.diseases.items()}
+
+    for _ in range(PHASES):
+        game.infect_city_phase()
+        game.infect_deck.shuffle_discard_to_top()
+        game.board.restore(initial_levels)
+        for colour, disease in game.diseases.items():
+            disease.public_health = initial_health[colour]
+        game.outbreak_count = 0
+        controller.signals.clear()
+
+
+def main():
+    controller = new_started_controller(
+        outbreak_death_level=10 ** 9, max_resistance=10 ** 9)
+
+    for batched in (False, True):
+        seconds = measure(lambda: run_phases(controller, batched))
+        title = 'Batched infect phase' if batched else 'Card-by-card infect phase'
+        report(f'{title} (rate {controller.game.infection_rate})',
+               seconds, PHASES, unit='phase')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Backtracking with the action journal: undoing and redoing whole turns
+compared to taking a full game copy before each turn.
+"""
+from .common import new_started_controller, measure, report
+
+
+TURNS = 20
+PASS_COMMAND = {'command': 'pass', 'args': {}}
+
+
+def bench_undo_redo(game):
+    def undo_redo_all():
+        for _ in range(TURNS):
+            game.undo()
+        for _ in range(TURNS):
+            game.redo()
+
+    return measure(undo_redo_all)
+
+
+def bench_copies(game):
+    def copy_all():
+        for _ in range(TURNS):
+            game.clone()
+
+    return measure(copy_all)
+
+
+def main():
+    controller = new_started_controller(
+        journal=True, outbreak_death_level=10 ** 9, max_resistance=10 ** 9)
+    for _ in range(TURNS):
+        controller.run_single_command(PASS_COMMAND)
+    game = controller.game
+    changes = sum(len(action) for action in game.journal.done)
+
+    report(f'Undo and redo a turn ({changes // TURNS} changes on average)',
+           bench_undo_redo(game), TURNS, unit='turn')
+    report('Copy the game before a turn',
+           bench_copies(game), TURNS, unit='turn')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Legal action enumeration for the active character: repeated calls with an
+unchanged game state hit the cache, the cold case lists the actions again.
+"""
+from .common import new_started_controller, measure, report
+
+
+CALLS = 10_000
+
+
+def bench_cached(character):
+    def list_all():
+        for _ in range(CALLS):
+            character.legal_actions()
+
+    return measure(list_all)
+
+
+def bench_cold(character):
+    def list_all():
+        for _ in range(CALLS):
+            character._legal_actions = None
+            character.legal_actions()
+
+    return measure(list_all)
+
+
+def main():
+    controller = new_started_controller()
+    character = controller.current_character
+    actions = character.legal_actions()
+
+    report(f'Cached legal actions ({len(actions)} actions)',
+           bench_cached(character), CALLS, unit='call')
+    report(f'Listed legal actions ({len(actions)} actions)',
+           bench_cold(character), CALLS, unit='call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Game throughput with the file log on: a synchronous rotating file
+handler, as the log was set up before, compared to the queue-based writer
+thread, and to no file log at all.
+
+The queued log times include the final flush of the queue. On a single core
+machine the writer thread cannot run in parallel with the game, so most of
+the gain there comes from the batched writes; an INFO level log also skips
+creating the debug records.
+"""
+import logging
+import os.path as op
+import tempfile
+from logging.handlers import RotatingFileHandler
+
+from pyndemic import log
+from pyndemic.core import api
+
+from .common import new_started_controller, measure, report
+
+
+GAMES = 30
+PASS_REQUEST = {'type': api.RequestTypes.COMMAND, 'command': 'pass',
+                'args': {}}
+
+
+def play_games():
+    """Play games passing every turn until they are lost; return the number
+    of commands sent.
+    """
+    commands = 0
+    for random_state in range(GAMES):
+        controller = new_started_controller(random_state=random_state)
+        controller.run()
+        while True:
+            commands += 1
+            response = controller.send(PASS_REQUEST)
+            if response['type'] == api.ResponseTypes.TERMINATION:
+                break
+        controller.stop()
+
+    return commands
+
+
+def run_with_synchronous_log(filename):
+    handler = RotatingFileHandler(filename, backupCount=4, delay=True)
+    handler.setFormatter(log.formatter)
+    log.logger.addHandler(handler)
+    try:
+        return play_games()
+    finally:
+        log.logger.removeHandler(handler)
+        handler.close()
+
+
+def run_with_queue_log(filename, level='DEBUG'):
+    log.start_file_log(filename, level)
+    try:
+        return play_games()
+    finally:
+        log.stop_file_log()
+
+
+def run_with_level(level, function):
+    previous_level = log.logger.level
+    log.logger.setLevel(level)
+    try:
+        return function()
+    finally:
+        log.logger.setLevel(previous_level)
+
+
+def main():
+    logging.disable(logging.NOTSET)
+    log.stop_file_log()
+    commands = play_games()
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = op.join(directory, 'game.log')
+        cases = [
+            ('no file log', play_games),
+            ('synchronous file log',
+             lambda: run_with_synchronous_log(filename)),
+            ('queued file log', lambda: run_with_queue_log(filename)),
+            ('queued INFO file log', lambda: run_with_level(
+                'INFO', lambda: run_with_queue_log(filename, 'INFO'))),
+        ]
+        for title, function in cases:
+            report(f'Pass-only games, {title}',
+                   measure(function), commands, unit='command')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Map loading: a settings file with the map sections versus a JSON map
+file (see `pyndemic.map_format`), on the stock map and on a synthetic map
+of 100k cities.
+"""
+import os.path as op
+import tempfile
+
+from pyndemic import config
+from pyndemic.map_format import dump_map, load_map
+from pyndemic.map_generator import generate_map
+from pyndemic.topology import Topology
+
+from .common import measure, report
+
+
+def load_settings_map(filename):
+    settings = config.GameSettings.from_config(config.read_config(filename))
+    return Topology.from_settings(settings)
+
+
+def run(title, settings, directory, repeat):
+    settings_filename = op.join(directory, 'map.cfg')
+    json_filename = op.join(directory, 'map.json')
+    with open(settings_filename, 'w') as settings_file:
+        settings.write(settings_file)
+    dump_map(load_settings_map(settings_filename), json_filename)
+
+    seconds = measure(lambda: load_settings_map(settings_filename), repeat)
+    report(f'{title}: settings file', seconds, 1, unit='map')
+    seconds = measure(lambda: load_map(json_filename), repeat)
+    report(f'{title}: JSON map file', seconds, 1, unit='map')
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        run('48 cities', config.read_config(), directory, repeat=20)
+        run('100000 cities', generate_map(100000, seed=0), directory,
+            repeat=3)
+
+
+if __name__ == '__main__':
+    main()
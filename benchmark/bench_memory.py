@@ -0,0 +1,113 @@
+"""Memory held by concurrent games: started games kept alive at once, as in
+a multi-session server, and game clones, as in a search. The map topology
+is compiled by a warm-up game first, so only the per-game memory is counted.
+
+The city layouts are also compared on their own: the former one, a `City`
+object with its own dict, neighbour list and infection level view per city
+and an OrderedDict of them by name, against the `BoardCity` views, before
+and after their infection levels and neighbours are first used.
+"""
+import gc
+import tracemalloc
+from collections import OrderedDict
+
+from pyndemic import config
+from pyndemic.city import BoardCity, City, CityMap
+from pyndemic.controller import GameController
+from pyndemic.map_generator import generate_settings
+
+from .common import PLAYERS
+
+
+GAMES = 200
+CLONES = 1000
+
+
+def new_game(settings):
+    controller = GameController()
+    controller.settings = settings.replace(players=PLAYERS, random_state=42)
+    controller.start_game()
+    controller.signals.clear()
+
+    return controller
+
+
+def dict_cities(game):
+    """Build the cities of a game in the former layout."""
+    topology = game.topology
+    cities = []
+    for city_id, city_name in enumerate(topology.names):
+        city = City(city_name, topology.colours[city_id], ctx=game._ctx)
+        city.bind_board(game.board, city_id)
+        cities.append(city)
+    for city_id, city in enumerate(cities):
+        for neighbour_id in topology.neighbours_of(city_id):
+            city.add_connection(cities[neighbour_id])
+
+    return cities, OrderedDict((city.name, city) for city in cities)
+
+
+def board_cities(game):
+    cities = BoardCity.for_game(game)
+    return cities, CityMap(game.city_ids, cities)
+
+
+def used_board_cities(game):
+    cities, city_map = board_cities(game)
+    for city in cities:
+        city.infection_levels
+        city.connected_cities
+
+    return cities, city_map
+
+
+def bytes_per_item(create, count):
+    """Return the traced memory held by `count` items made by `create`,
+    divided by `count`.
+    """
+    items = [create()]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items.extend(create() for _ in range(count))
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+
+    return (after - before) / count
+
+
+def report_bytes(title, size, unit):
+    print(f'{title:<48} {size:>12.0f} bytes/{unit}')
+
+
+def main():
+    maps = [('stock map', config.get_settings()),
+            ('1000 cities', generate_settings(1000, seed=1))]
+    for name, settings in maps:
+        controllers = []
+
+        def create_game():
+            controller = new_game(settings)
+            controllers.append(controller)
+            return controller
+
+        report_bytes(f'Started game ({name})',
+                     bytes_per_item(create_game, GAMES), 'game')
+
+        game = controllers[0].game
+        report_bytes(f'Game clone ({name})',
+                     bytes_per_item(game.clone, CLONES), 'clone')
+
+        layouts = (('dict cities', dict_cities),
+                   ('board cities', board_cities),
+                   ('board cities, used', used_board_cities))
+        for layout, create_cities in layouts:
+            report_bytes(f'City layout: {layout} ({name})',
+                         bytes_per_item(lambda: create_cities(game), GAMES),
+                         'game')
+
+
+if __name__ == '__main__':
+    main()
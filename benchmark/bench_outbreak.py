@@ -0,0 +1,40 @@
+"""Worst-case outbreak cascades on the stock `settings.cfg` map.
+
+Every city is filled up to the maximum level of one disease, so infecting any
+city starts a chain that breaks out in every city reachable from it.
+"""
+from .common import new_started_controller, measure, report
+
+
+def saturate(game, colour):
+    for city in game.cities:
+        city.infection_levels[colour] = 3
+    game.outbreak_stack.clear()
+    game.outbreak_count = 0
+
+
+def run_cascades(game, colour):
+    chain_lengths = []
+    for city in game.cities:
+        saturate(game, colour)
+        game.infect_city(city.name, colour)
+        chain_lengths.append(game.outbreak_count)
+        game._ctx['controller']().signals.clear()
+
+    return chain_lengths
+
+
+def main():
+    controller = new_started_controller(
+        outbreak_death_level=10 ** 9, max_resistance=10 ** 9)
+    game = controller.game
+
+    for colour in game.diseases:
+        chain_lengths = run_cascades(game, colour)
+        seconds = measure(lambda: run_cascades(game, colour))
+        report(f'Full-map cascade ({colour}, chain of {max(chain_lengths)})',
+               seconds, len(chain_lengths), unit='cascade')
+
+
+if __name__ == '__main__':
+    main()
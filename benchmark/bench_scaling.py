@@ -0,0 +1,75 @@
+"""Scaling of the engine phases with the map size, on the stock map and on
+synthetic maps of 1k, 10k and 100k cities (see `pyndemic.map_generator`).
+
+Games run headless, so the figures show the engine work without the cost of
+building signals.
+"""
+from pyndemic import config
+from pyndemic.controller import GameController
+from pyndemic.core.context import game_context
+from pyndemic.formatter import BaseFormatter
+from pyndemic.map_generator import generate_settings
+from pyndemic.topology import Topology
+
+from .common import PLAYERS, measure, report
+
+
+SIZES = (1000, 10000, 100000)
+COLOUR = 'Blue'
+
+
+def new_controller(settings):
+    controller = GameController()
+    controller.settings = settings.replace(
+        players=PLAYERS, random_state=42, headless=True,
+        outbreak_death_level=10 ** 9, max_resistance=10 ** 9)
+    return controller
+
+
+def full_map_cascade(game):
+    width = game.board.width
+    column = game.board.colour_ids[COLOUR]
+    levels = game.board.levels
+    levels[column::width] = bytes([3]) * len(game.cities)
+    game.outbreak_stack.clear()
+    game.outbreak_count = 0
+    game.infect_city(game.cities[0].name, COLOUR)
+
+
+def run_phases(title, settings):
+    repeat = 1 if len(settings['Cities']) > 10000 else 5
+
+    seconds = measure(lambda: Topology.from_settings(settings), repeat)
+    report(f'{title}: compile map', seconds, 1, unit='map')
+
+    controller = new_controller(settings)
+    controller.start_game()
+    game = controller.game
+
+    seconds = measure(lambda: new_controller(settings).start_game(), repeat)
+    report(f'{title}: set up and start game', seconds, 1, unit='game')
+
+    def prepare_decks():
+        with game_context(game._ctx):
+            game.get_new_decks()
+            game.shuffle_decks()
+
+    seconds = measure(prepare_decks, repeat)
+    report(f'{title}: prepare decks', seconds, 1, unit='game')
+
+    seconds = measure(lambda: full_map_cascade(game), repeat)
+    report(f'{title}: outbreak cascade (chain of {game.outbreak_count})',
+           seconds, 1, unit='cascade')
+
+    seconds = measure(lambda: BaseFormatter.game_to_dict(game), repeat)
+    report(f'{title}: game_to_dict', seconds, 1, unit='call')
+
+
+def main():
+    run_phases('48 cities', config.get_settings())
+    for size in SIZES:
+        run_phases(f'{size} cities', generate_settings(size, seed=0))
+
+
+if __name__ == '__main__':
+    main()
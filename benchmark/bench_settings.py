@@ -0,0 +1,38 @@
+"""Settings cost per game: creating a controller with per-game options,
+alone and with the setup of its game.
+"""
+from pyndemic import config
+from pyndemic.controller import GameController
+
+from .common import PLAYERS, measure, report
+
+
+CONTROLLERS = 1000
+GAMES = 100
+
+
+def create_controllers():
+    for random_state in range(CONTROLLERS):
+        GameController(players=PLAYERS, random_state=random_state)
+
+
+def set_up_games():
+    for random_state in range(GAMES):
+        controller = GameController(players=PLAYERS,
+                                    random_state=random_state)
+        controller.start_game()
+
+
+def main():
+    config.get_settings()
+
+    seconds = measure(create_controllers)
+    report('Controller creation with overrides', seconds, CONTROLLERS,
+           unit='game')
+    seconds = measure(set_up_games)
+    report('Controller creation and game setup', seconds, GAMES,
+           unit='game')
+
+
+if __name__ == '__main__':
+    main()
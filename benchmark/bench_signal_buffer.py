@@ -0,0 +1,54 @@
+"""Memory of a long session that never reads its signals: the unbounded
+signal buffer compared to bounded buffers with each overflow policy.
+"""
+import tracemalloc
+
+from .common import new_started_controller, measure, report
+
+
+PHASES = 2000
+
+
+def new_controller(**settings):
+    controller = new_started_controller(
+        outbreak_death_level=10 ** 9, max_resistance=10 ** 9, **settings)
+    controller.signals.clear()
+
+    return controller
+
+
+def grow_signals(controller):
+    """Run infect phases without ever reading the signals."""
+    game = controller.game
+    initial_levels = game.board.snapshot()
+
+    for _ in range(PHASES):
+        game.infect_city_phase()
+        game.infect_deck.shuffle_discard_to_top()
+        game.board.restore(initial_levels)
+
+
+def main():
+    cases = [
+        ('unbounded', {}),
+        ('drop oldest', dict(signal_buffer_size=1000,
+                             signal_overflow='drop_oldest')),
+        ('coalesce', dict(signal_buffer_size=1000,
+                          signal_overflow='coalesce')),
+    ]
+
+    for title, settings in cases:
+        controller = new_controller(**settings)
+        tracemalloc.start()
+        seconds = measure(lambda: grow_signals(controller), repeat=1)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        report(f'Infect phase, {title} buffer', seconds, PHASES, unit='phase')
+        print(f'    {len(controller.signals)} events kept, '
+              f'{controller.response_sink.dropped} dropped, '
+              f'peak memory {peak / 1024:.0f} KiB')
+
+
+if __name__ == '__main__':
+    main()
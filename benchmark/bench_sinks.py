@@ -0,0 +1,38 @@
+"""Card-by-card infect phases with the default sinks of a controller
+compared to sinks subscribed to a few event types only, when most signals
+are not wanted by anyone.
+"""
+from pyndemic.core.events import EventTypes
+from pyndemic.core.sinks import CounterSink
+
+from .common import new_started_controller, measure, report
+from .bench_infect_phase import PHASES, run_phases
+
+
+def new_controller(*sinks):
+    controller = new_started_controller(
+        outbreak_death_level=10 ** 9, max_resistance=10 ** 9)
+    if sinks:
+        controller.sinks.unsubscribe(controller.response_sink)
+        controller.sinks.unsubscribe(controller.log_sink)
+        for sink in sinks:
+            controller.sinks.subscribe(sink)
+
+    return controller
+
+
+def main():
+    cases = [
+        ('default sinks', new_controller()),
+        ('outbreak and epidemic counter', new_controller(
+            CounterSink(types=[EventTypes.OUTBREAK, EventTypes.EPIDEMIC]))),
+        ('counter of all events', new_controller(CounterSink())),
+    ]
+
+    for title, controller in cases:
+        seconds = measure(lambda: run_phases(controller, batched=False))
+        report(f'Infect phase, {title}', seconds, PHASES, unit='phase')
+
+
+if __name__ == '__main__':
+    main()
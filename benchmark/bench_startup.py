@@ -0,0 +1,75 @@
+"""Startup cost: the import time of the controller module reported by
+`python -X importtime` and the time until the console client shows its
+first prompt.
+"""
+import os.path as op
+import subprocess
+import sys
+import time
+
+from .common import report
+
+
+ROOT_DIR = op.join(op.dirname(__file__), op.pardir)
+RUNS = 10
+PROMPT = 'Waiting for command...'
+
+
+def import_time(module):
+    """Return the cumulative import time of the module in seconds."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1e6
+
+    raise ValueError(f'No import time reported for {module}.')
+
+
+def first_prompt_time():
+    """Return the time from launching the console client to its first
+    prompt.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, 'pyndemic.py', '42'], cwd=ROOT_DIR,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL, text=True)
+    try:
+        for line in process.stdout:
+            if line.startswith(PROMPT):
+                elapsed = time.perf_counter() - start
+                break
+        else:
+            raise RuntimeError('The client has exited without a prompt.')
+        process.communicate('quit\n')
+    finally:
+        process.kill()
+        process.wait()
+
+    return elapsed
+
+
+def interpreter_time():
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'pass'], check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    for module in ('pyndemic', 'pyndemic.controller'):
+        seconds = min(import_time(module) for _ in range(RUNS))
+        report(f'Import {module}', seconds, 1, unit='run')
+
+    seconds = min(interpreter_time() for _ in range(RUNS))
+    report('Bare interpreter start', seconds, 1, unit='run')
+    seconds = min(first_prompt_time() for _ in range(RUNS))
+    report('Console client, time to first prompt', seconds, 1,
+           unit='run')
+
+
+if __name__ == '__main__':
+    main()
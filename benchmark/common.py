@@ -0,0 +1,41 @@
+"""Helpers shared by the benchmark modules."""
+import logging
+import time
+
+from pyndemic.controller import GameController
+
+
+logging.disable(logging.CRITICAL)
+
+PLAYERS = ['Alpha', 'Bravo', 'Charlie', 'Delta']
+
+
+def new_started_controller(**settings):
+    """Create a controller with a started game on the stock map."""
+    settings.setdefault('players', PLAYERS)
+    settings.setdefault('random_state', 42)
+    controller = GameController(**settings)
+    controller.start_game()
+    controller.signals.clear()
+
+    return controller
+
+
+def measure(function, repeat=5):
+    """Run `function` several times and return the best wall time."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def report(title, seconds, operations, unit='op'):
+    per_operation = seconds / operations * 1e6
+    rate = operations / seconds
+    print(f'{title:<48} {per_operation:>10.2f} us/{unit} '
+          f'{rate:>12.0f} {unit}/s')
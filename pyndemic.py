@@ -8,7 +8,7 @@
 def main(args):
     random_state = int(args[0]) if args else None
 
-    controller = GameController(random_state=random_state)
+    controller = GameController(random_state=random_state, journal=True)
     ui = ConsoleUI(controller=controller)
 
     ui.run()
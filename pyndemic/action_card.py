@@ -1,4 +1,6 @@
 from .card import ActionCard
+from .core import events
+from .journal import set_state
 
 
 class GovernmentGrantActionCard(ActionCard):
@@ -10,19 +12,18 @@ def __init__(self):
         super().__init__()
         self.name = "Government Grant"
 
-    def check_playable(self, city_name):
-        game = self._ctx['controller']().game
+    def check_playable(self, game, city_name):
         if city_name not in game.city_map:
             return False
         return not game.city_map[city_name].has_lab
 
-    def on_play(self, city_name):
-        game = self._ctx['controller']().game
-        if self.check_playable(city_name):
+    def list_plays(self, game):
+        return [(city.name,) for city in game.cities if not city.has_lab]
+
+    def on_play(self, game, city_name):
+        if self.check_playable(game, city_name):
             game.city_map[city_name].build_lab()
-            self.emit_signal(
-                f'Action: Built a lab in {city_name}.',
-            )
+            game.emit_signal(events.LabBuilt, None, city_name)
             return True
         else:
             return False
@@ -37,12 +38,14 @@ def __init__(self):
         super().__init__()
         self.name = "Quiet Night"
 
-    def check_playable(self):
+    def check_playable(self, game):
         return True
 
-    def on_play(self):
-        game = self._ctx['controller']().game
-        game.skip_infect_phase = True
+    def list_plays(self, game):
+        return [()]
+
+    def on_play(self, game):
+        set_state(game, 'skip_infect_phase', True)
 
 
 # repeats are in order to take physical space in the deck
@@ -0,0 +1,97 @@
+from collections.abc import MutableMapping
+
+
+class InfectionBoard:
+    """Infection levels of all cities kept in one contiguous matrix.
+
+    The matrix has a row per city and a column per disease colour, stored
+    row by row in a single byte array, so whole-board queries and copies are
+    plain array operations. The laboratories of the cities are kept in the
+    `labs` byte array, one byte per city.
+    """
+    def __init__(self, city_count, colours):
+        self.colours = tuple(colours)
+        self.colour_ids = {colour: i for i, colour in enumerate(self.colours)}
+        self.width = len(self.colours)
+        self.levels = bytearray(city_count * self.width)
+        self.labs = bytearray(city_count)
+
+    def __len__(self):
+        return len(self.labs)
+
+    def index(self, city_id, colour):
+        return city_id * self.width + self.colour_ids[colour]
+
+    def get_level(self, city_id, colour):
+        return self.levels[self.index(city_id, colour)]
+
+    def set_level(self, city_id, colour, level):
+        self.levels[self.index(city_id, colour)] = level
+
+    def city_levels(self, city_id):
+        """Return a mutable colour => level view of a single city row."""
+        return InfectionLevels(self, city_id)
+
+    def total_level(self, colour):
+        """Sum of the levels of a disease over the whole board."""
+        return sum(self.levels[self.colour_ids[colour]::self.width])
+
+    def cities_at_level(self, colour, level):
+        """Ids of the cities that have exactly `level` of a disease."""
+        column = self.levels[self.colour_ids[colour]::self.width]
+        return [city_id for city_id, value in enumerate(column)
+                if value == level]
+
+    def clear(self):
+        self.levels[:] = bytes(len(self.levels))
+
+    def copy(self):
+        board = InfectionBoard.__new__(InfectionBoard)
+        board.colours = self.colours
+        board.colour_ids = self.colour_ids
+        board.width = self.width
+        board.levels = self.levels[:]
+        board.labs = self.labs[:]
+
+        return board
+
+    def snapshot(self):
+        return bytes(self.levels)
+
+    def restore(self, snapshot):
+        self.levels[:] = snapshot
+
+
+class InfectionLevels(MutableMapping):
+    """Dict-like colour => level view onto one city row of a board."""
+    __slots__ = ('board', 'offset')
+
+    def __init__(self, board, city_id):
+        self.board = board
+        self.offset = city_id * board.width
+
+    def __getitem__(self, colour):
+        return self.board.levels[self.offset + self.board.colour_ids[colour]]
+
+    def __setitem__(self, colour, level):
+        self.board.levels[self.offset + self.board.colour_ids[colour]] = level
+
+    def __delitem__(self, colour):
+        raise TypeError('Disease colours cannot be removed from a board.')
+
+    def __contains__(self, colour):
+        return colour in self.board.colour_ids
+
+    def __iter__(self):
+        return iter(self.board.colours)
+
+    def __len__(self):
+        return self.board.width
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def copy(self):
+        board = self.board
+        row = board.levels[self.offset:self.offset + board.width]
+        return dict(zip(board.colours, row))
@@ -1,4 +1,4 @@
-from .core import GameEntity
+from .core import GameEntity, events
 
 
 class Card(GameEntity):
@@ -22,8 +22,8 @@ def on_discard(self, *args, **kwargs):
 class PlayerCard(Card):
     def on_draw(self, character_drawing):
         character_drawing.add_card(self)
-        self.emit_signal(
-            f'{character_drawing} drew {self}.',
+        character_drawing.emit_signal(
+            events.DrewCard, character_drawing.name, self.name,
         )
 
 
@@ -37,37 +37,42 @@ def __init__(self):
         self.colour = None
 
     def on_draw(self, character_drawing):
-        self.emit_signal(
-            f'{character_drawing} drew Epidemic!',
+        character_drawing.emit_signal(
+            events.DrewCard, character_drawing.name, self.name,
         )
 
-        game = self._ctx['controller']().game
-        game.epidemic_phase()
+        character_drawing.game.epidemic_phase()
 
 
 class ActionCard(PlayerCard):
     """
     Action Cards can be played anytime, even during the other player's turn.
     Playing the card does not take any action points.
+    The game the card is played in is passed to its methods, so that the same
+    card object can be used by several copies of a game.
     """
 
     def __init__(self):
         self.name = None
         self.colour = None
 
-    def check_playable(self, *args):
+    def check_playable(self, game, *args):
         pass
 
+    def list_plays(self, game):
+        """Return a list of argument tuples the card can be played with."""
+        return []
+
     def __str__(self):
         return f'Action Card "{self.name}"'
 
 
 class InfectCard(Card):
-    def on_draw(self, character_drawing):
-        self.on_play(character_drawing)
+    """Infect cards are drawn by the game itself rather than by a character."""
+    def on_draw(self, game):
+        self.on_play(game)
 
-    def on_play(self, character_playing):
-        game = self._ctx['controller']().game
+    def on_play(self, game):
         game.infect_city(self.name, self.colour)
         game.outbreak_stack.clear()
         game.infect_deck.add_discard(self)
@@ -1,7 +1,12 @@
-import logging
+from collections import defaultdict
+from itertools import combinations
+from operator import attrgetter
 
 from .exceptions import GameCrisisException
-from .core import GameEntity
+from .core import GameEntity, events
+from .card import ActionCard
+from .journal import set_state
+from .log import logger
 
 
 class LastDiseaseCuredException(GameCrisisException):
@@ -16,8 +21,9 @@ def __init__(self, name):
         self.action_count = 0
         self.hand = []
         self.name = name
-        logging.debug(
-            f'Created {self}')
+        self._legal_actions = None
+        logger.debug(
+            'Created %s', self)
 
     def __str__(self):
         return f'Character "{self.name}"'
@@ -37,9 +43,10 @@ def get_card(self, card_name):
             f"No such card in {self.name} character's hand: {card_name}.")
 
     def set_location(self, new_location):
-        self.location = self.game.city_map[new_location]
-        logging.debug(
-            f'{self}: changed location to {new_location}.')
+        set_state(self, 'location', self.game.city_map[new_location])
+        if not self.headless:
+            logger.debug(
+                '%s: changed location to %s.', self, new_location)
 
     def check_charter_flight(self, location):
         if self.action_count > 0 and self.location.name == location:
@@ -51,10 +58,10 @@ def charter_flight(self, location, destination):
         if self.check_charter_flight(location):
             self.discard_card(location)
             self.set_location(destination)
-            self.action_count -= 1
+            set_state(self, 'action_count', self.action_count - 1)
             self.emit_signal(
-                (f'{self}: Performed charter flight from {location} to '
-                 f'{destination}.'),
+                events.Moved,
+                self.name, 'charter flight', location, destination,
             )
             return True
         return False
@@ -69,10 +76,10 @@ def direct_flight(self, location, destination):
         if self.check_direct_flight(location, destination):
             self.discard_card(destination)
             self.set_location(destination)
-            self.action_count -= 1
+            set_state(self, 'action_count', self.action_count - 1)
             self.emit_signal(
-                (f'{self}: Performed direct flight from {location} to '
-                 f'{destination}.'),
+                events.Moved,
+                self.name, 'direct flight', location, destination,
             )
             return True
         return False
@@ -87,10 +94,8 @@ def build_lab(self):
         if self.check_build_lab():
             self.discard_card(self.location.name)
             self.location.build_lab()
-            self.action_count -= 1
-            self.emit_signal(
-                f'{self}: Built laboratory in {self.location}.',
-            )
+            set_state(self, 'action_count', self.action_count - 1)
+            self.emit_signal(events.LabBuilt, self.name, self.location.name)
             return True
         return False
 
@@ -104,10 +109,10 @@ def check_shuttle_flight(self, location, destination):
     def shuttle_flight(self, location, destination):
         if self.check_shuttle_flight(location, destination):
             self.set_location(destination)
-            self.action_count -= 1
+            set_state(self, 'action_count', self.action_count - 1)
             self.emit_signal(
-                (f'{self}: Performed shuttle flight from {location} to '
-                 f'{destination}.'),
+                events.Moved,
+                self.name, 'shuttle flight', location, destination,
             )
             return True
         return False
@@ -120,24 +125,18 @@ def check_treat_disease(self, colour):
 
     def treat_disease(self, colour):
         if self.check_treat_disease(colour):
-            if self.game.diseases[colour].cured:
+            effective = self.game.diseases[colour].cured
+            if effective:
                 level_reduction = self.location.nullify_infection_level(colour)
                 self.game.diseases[colour].increase_resistance(level_reduction)
-                self.emit_signal(
-                    (f'{self}: Treated {colour} disease in {self.location} '
-                     f'(effectively).'),
-                )
             else:
                 self.location.decrease_infection_level(colour)
                 self.game.diseases[colour].increase_resistance(1)
-                self.emit_signal(
-                    f'{self}: Treated {colour} disease in {self.location}.',
-                    log_level=logging.INFO)
-            self.action_count -= 1
+            set_state(self, 'action_count', self.action_count - 1)
             self.emit_signal(
-                (f'Now {self.location} has '
-                 f'{self.location.infection_levels[colour]} '
-                 f'level of {colour} disease.'),
+                events.Treated,
+                self.name, self.location.name, colour,
+                self.location.infection_levels[colour], effective,
             )
 
             return True
@@ -157,13 +156,13 @@ def check_cure_disease(self, card1, card2, card3, card4, card5):
     def cure_disease(self, card1, card2, card3, card4, card5):
         if self.check_cure_disease(card1, card2, card3, card4, card5):
             colour = self.get_card(card1).colour
-            self.game.diseases[colour].cured = True
+            set_state(self.game.diseases[colour], 'cured', True)
             card_list = [card1, card2, card3, card4, card5]
             for card in card_list:
                 self.discard_card(card)
-            self.action_count -= 1
+            set_state(self, 'action_count', self.action_count - 1)
             self.emit_signal(
-                f'{self}: Cured {colour} disease in {self.location}.',
+                events.Cured, self.name, self.location.name, colour,
             )
 
             if self.game.all_diseases_cured():
@@ -196,13 +195,14 @@ def share_knowledge(self, card_name, other_character):
                 transfer_forward = False
             if transfer_forward:
                 other_character.add_card(held_card)
-                self.hand.remove(held_card)
+                self.remove_card(held_card)
             else:
                 self.add_card(held_card)
-                other_character.hand.remove(held_card)
-            self.action_count -= 1
+                other_character.remove_card(held_card)
+            set_state(self, 'action_count', self.action_count - 1)
             self.emit_signal(
-                f'{self}: Shared knowledge {held_card} with {other_character}.',
+                events.Shared,
+                self.name, held_card.name, other_character.name,
             )
 
             return True
@@ -210,38 +210,139 @@ def share_knowledge(self, card_name, other_character):
 
     def add_card(self, new_card):
         self.hand.append(new_card)
-        logging.debug(
-            f'{self}: Received new {new_card}.')
+        journal = self.journal
+        if journal is not None:
+            journal.record_insert(self.hand, len(self.hand) - 1, new_card)
+        if not self.headless:
+            logger.debug(
+                '%s: Received new %s.', self, new_card)
 
     def discard_card(self, to_discard):
         if self.hand_contains(to_discard):
             card_to_discard = self.get_card(to_discard)
-            self.hand.remove(card_to_discard)
+            self.remove_card(card_to_discard)
             self.game.player_deck.add_discard(card_to_discard)
             self.emit_signal(
-                f'{self}: discarded {card_to_discard}.',
+                events.Discarded, self.name, card_to_discard.name,
             )
 
             return True
         return False
 
+    def remove_card(self, card):
+        index = self.hand.index(card)
+        del self.hand[index]
+        journal = self.journal
+        if journal is not None:
+            journal.record_remove(self.hand, index, card)
+
+    def legal_actions(self):
+        """Return every command the character can perform now as a list of
+        command dicts in the API format, e.g.
+        `{'command': 'move', 'args': {'destination': 'Paris'}}`.
+        The list is cached until the state it depends on changes, so it must
+        not be modified.
+        """
+        key = self._legal_actions_key()
+        if self._legal_actions is None or self._legal_actions[0] != key:
+            self._legal_actions = (key, self._list_legal_actions())
+
+        return self._legal_actions[1]
+
+    def _legal_actions_key(self):
+        location = self.location
+        if location is None:
+            return None, tuple(card.name for card in self.hand)
+
+        partners = tuple(
+            (other.name, other.hand_contains(location.name))
+            for other in self.game.characters
+            if other is not self and other.location is location)
+        labs = bytes(self.game.board.labs)
+
+        return (location.name, self.action_count,
+                tuple(map(_card_name, self.hand)),
+                tuple(location.infection_levels.copy().items()), partners,
+                labs)
+
+    def _list_legal_actions(self):
+        game = self.game
+        location = self.location
+        actions = []
+        if self.action_count > 0 and location is not None:
+            city_cards = [name for name in dict.fromkeys(
+                card.name for card in self.hand) if name in game.city_map]
+            has_location_card = location.name in city_cards
+
+            topology = game.topology
+            for neighbour_id in topology.neighbours_of(
+                    topology.ids[location.name]):
+                actions.append(_command(
+                    'move', destination=topology.names[neighbour_id]))
+
+            for name in city_cards:
+                actions.append(_command('fly', destination=name))
+
+            if has_location_card:
+                for name in game.city_map:
+                    actions.append(_command('charter', destination=name))
+
+            if location.has_lab:
+                for city_id, has_lab in enumerate(game.board.labs):
+                    if has_lab:
+                        actions.append(_command(
+                            'shuttle', destination=topology.names[city_id]))
+            elif has_location_card:
+                actions.append(_command('build'))
+
+            for colour, level in location.infection_levels.items():
+                if level > 0:
+                    actions.append(_command('treat', colour=colour))
+
+            if location.has_lab:
+                cards_by_colour = defaultdict(list)
+                for name in city_cards:
+                    cards_by_colour[game.city_map[name].colour].append(name)
+                for names in cards_by_colour.values():
+                    for cards in combinations(names, 5):
+                        actions.append(_command('cure', cards=list(cards)))
+
+            for other in game.characters:
+                if other is self or other.location is not location:
+                    continue
+                if has_location_card or other.hand_contains(location.name):
+                    actions.append(_command(
+                        'share', card=location.name, player=other.name))
+
+        action_cards = {card.name: card for card in self.hand
+                        if isinstance(card, ActionCard)}
+        for card in action_cards.values():
+            for card_args in card.list_plays(game):
+                actions.append(_command(
+                    'play', card=card.name, card_args=list(card_args)))
+
+        actions.append(_command('pass'))
+
+        return actions
+
     def hand_contains(self, card_name):
         return any(card.name == card_name for card in self.hand)
 
     def check_standard_move(self, location, destination):
         if self.action_count > 0 and self.location.name == location:
-            destination_city = self.game.city_map[destination]
-            if destination_city in self.location.connected_cities:
+            topology = self.game.topology
+            if topology.are_connected(topology.ids[location],
+                                      topology.ids[destination]):
                 return True
         return False
 
     def standard_move(self, location, destination):
         if self.check_standard_move(location, destination):
             self.set_location(destination)
-            self.action_count -= 1
+            set_state(self, 'action_count', self.action_count - 1)
             self.emit_signal(
-                (f'{self}: Performed standard move from {location} to '
-                 f'{destination}.'),
+                events.Moved,
+                self.name, 'standard move', location, destination,
             )
 
             return True
@@ -249,15 +350,22 @@ def standard_move(self, location, destination):
 
     def check_action_card(self, card_name, *args):
         card = self.get_card(card_name)
-        return card.check_playable(*args)
+        return card.check_playable(self.game, *args)
 
     def play_action_card(self, card_name, *args):
         if self.check_action_card(card_name, *args):
             self.emit_signal(
-                f'{self}: Playing {card_name}.')
+                events.PlayedCard, self.name, card_name, args)
             card = self.get_card(card_name)
-            card.on_play(*args)
+            card.on_play(self.game, *args)
             #TODO check if fails
             self.discard_card(card_name)
             return True
         return False
+
+
+_card_name = attrgetter('name')
+
+
+def _command(command, **args):
+    return {'command': command, 'args': args}
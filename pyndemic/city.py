@@ -1,7 +1,9 @@
-import logging
+from collections.abc import Mapping
 
 from .exceptions import GameException
-from .core import GameEntity
+from .core import BaseGameEntity
+from .journal import set_state
+from .log import logger
 
 
 class NoDiseaseInCityException(GameException):
@@ -13,15 +15,12 @@ def __str__(self):
         return f'No {self.colour} disease found in {self.city.name}!'
 
 
-class City(GameEntity):
-    def __init__(self, name, colour):
-        self.name = name
-        self.has_lab = False
-        self.colour = colour
-        self.infection_levels = {}
-        self.connected_cities = []
-        logging.debug(
-            f'Created location {self}.')
+class AbstractCity(BaseGameEntity):
+    """Behaviour shared by all cities. The subclasses provide the `name`,
+    `colour`, `has_lab`, `infection_levels` and `connected_cities`
+    attributes.
+    """
+    __slots__ = ()
 
     def __str__(self):
         return f'City {self.name} ({self.colour})'
@@ -33,41 +32,164 @@ def info(self):
 
         return result
 
-    def init_colours(self, disease_colours):
-        for colour in disease_colours:
-            self.infection_levels[colour] = 0
+    def set_infection_level(self, colour, level):
+        infection_levels = self.infection_levels
+        journal = self.journal
+        if journal is not None:
+            journal.record_item(infection_levels, colour,
+                                infection_levels[colour], level)
+        infection_levels[colour] = level
 
     def decrease_infection_level(self, colour):
         if not self.infection_levels[colour]:
             raise NoDiseaseInCityException(self, colour)
-        self.infection_levels[colour] -= 1
-        logging.debug(
-            f'{colour} disease infection in {self} went one level down.')
+        self.set_infection_level(colour, self.infection_levels[colour] - 1)
+        if not self.headless:
+            logger.debug(
+                '%s disease infection in %s went one level down.',
+                colour, self)
 
     def increase_infection_level(self, colour):
-        self.infection_levels[colour] += 1
-        logging.debug(
-            f'{colour} disease infection in {self} went one level up.')
+        self.set_infection_level(colour, self.infection_levels[colour] + 1)
+        if not self.headless:
+            logger.debug(
+                '%s disease infection in %s went one level up.', colour, self)
 
     def build_lab(self):
         if self.has_lab:
             return False
-        self.has_lab = True
-        logging.debug(
-            f'Built laboratory in {self}.')
+        set_state(self, 'has_lab', True)
+        if not self.headless:
+            logger.debug(
+                'Built laboratory in %s.', self)
 
         return True
 
-    def add_connection(self, new_city):
-        self.connected_cities.append(new_city)
-
     # TODO redesign this method
     def nullify_infection_level(self, colour):
         if not self.infection_levels[colour]:
             raise NoDiseaseInCityException(self, colour)
         level_reduction = self.infection_levels[colour]
-        self.infection_levels[colour] = 0
-        logging.debug(
-            f'{colour} disease infection in {self} dropped to zero level.')
+        self.set_infection_level(colour, 0)
+        if not self.headless:
+            logger.debug(
+                '%s disease infection in %s dropped to zero level.',
+                colour, self)
 
         return level_reduction
+
+
+class City(AbstractCity):
+    """Standalone city keeping its own state and connections."""
+    def __init__(self, name, colour):
+        self.name = name
+        self.has_lab = False
+        self.colour = colour
+        self.infection_levels = {}
+        self.connected_cities = []
+        logger.debug(
+            'Created location %s.', self)
+
+    def bind_board(self, board, city_id):
+        """Keep infection levels in a row of a shared infection board instead
+        of a city-owned dict.
+        """
+        self.infection_levels = board.city_levels(city_id)
+
+    def init_colours(self, disease_colours):
+        for colour in disease_colours:
+            self.infection_levels[colour] = 0
+
+    def add_connection(self, new_city):
+        self.connected_cities.append(new_city)
+
+
+class BoardCity(AbstractCity):
+    """City of a game, a small view of one city of the map topology.
+
+    The map topology is shared by all the games in the process, so the name,
+    colour and connections of the city are read from it, while its infection
+    levels and laboratory are kept on the board of its game. A game holds
+    just one such object per city, without an instance dict; its infection
+    level view and neighbour tuple are made on first use and kept.
+    """
+    __slots__ = ('game', 'city_id', '_infection_levels', '_connected_cities')
+
+    @classmethod
+    def for_game(cls, game):
+        """Return the list of the cities of a game, indexed by city id.
+        The cities get the game context directly, without the context search
+        of regular object creation.
+        """
+        ctx = game._ctx
+        cities = []
+        for city_id in range(len(game.topology)):
+            city = object.__new__(cls)
+            city._ctx = ctx
+            city.game = game
+            city.city_id = city_id
+            cities.append(city)
+
+        return cities
+
+    @property
+    def name(self):
+        return self.game.topology.names[self.city_id]
+
+    @property
+    def colour(self):
+        return self.game.topology.colours[self.city_id]
+
+    @property
+    def has_lab(self):
+        return bool(self.game.board.labs[self.city_id])
+
+    @has_lab.setter
+    def has_lab(self, has_lab):
+        self.game.board.labs[self.city_id] = bool(has_lab)
+
+    @property
+    def infection_levels(self):
+        try:
+            return self._infection_levels
+        except AttributeError:
+            self._infection_levels = self.game.board.city_levels(self.city_id)
+            return self._infection_levels
+
+    @property
+    def connected_cities(self):
+        try:
+            return self._connected_cities
+        except AttributeError:
+            cities = self.game.cities
+            self._connected_cities = tuple(
+                cities[neighbour_id] for neighbour_id
+                in self.game.topology.neighbours_of(self.city_id))
+            return self._connected_cities
+
+    def add_connection(self, new_city):
+        raise TypeError('Connections of a game city come from the map '
+                        'topology.')
+
+
+class CityMap(Mapping):
+    """Read-only name => city mapping of the cities of a game, looking the
+    names up in the city ids of the shared map topology.
+    """
+    __slots__ = ('ids', 'cities')
+
+    def __init__(self, ids, cities):
+        self.ids = ids
+        self.cities = cities
+
+    def __getitem__(self, name):
+        return self.cities[self.ids[name]]
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
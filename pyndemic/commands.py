@@ -1,4 +1,5 @@
-from .core import GameEntity
+from .core import GameEntity, events
+from .journal import set_state
 
 
 class Command(GameEntity):
@@ -179,6 +180,25 @@ def execute(self, command):
         return success
 
 
+class PlayCommand(Command):
+    command = 'play'
+    min_arguments = 1
+
+    def check_arguments(self, args):
+        card_name = args['card']
+        if not self.character.hand_contains(card_name):
+            return False
+        return True
+
+    def execute(self, command):
+        character = self.character
+        card_name = command['args']['card']
+        card_args = command['args'].get('card_args', [])
+
+        success = character.play_action_card(card_name, *card_args)
+        return success
+
+
 class PassCommand(Command):
     command = 'pass'
 
@@ -187,11 +207,9 @@ def check_arguments(self, args):
 
     def execute(self, command):
         character = self.character
-        character.action_count = 0
+        set_state(character, 'action_count', 0)
 
-        self.emit_signal(
-            f'{character}: made magic pass.',
-        )
+        self.emit_signal(events.Passed, character.name)
 
         return True
 
@@ -205,5 +223,6 @@ def execute(self, command):
     TreatCommand,
     CureCommand,
     ShareCommand,
+    PlayCommand,
     PassCommand,
 ]
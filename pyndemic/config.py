@@ -1,5 +1,6 @@
 import os
-from copy import deepcopy
+import hashlib
+from collections.abc import Mapping
 from configparser import ConfigParser
 
 
@@ -7,26 +8,234 @@
 WORK_DIR = os.path.dirname(__file__)
 SETTINGS_DEFAULT_LOCATION = os.path.join(WORK_DIR, 'settings.cfg')
 
+DEFAULT_PLAYERS = 'Alpha Bravo Charlie Delta'
+
 _CACHED_SETTINGS = None
 
 
-def get_settings(settings_location=None, *, refresh=False):
-    global _CACHED_SETTINGS
+class SettingsError(ValueError):
+    pass
 
-    if refresh or _CACHED_SETTINGS is None:
-        refresh_settings(settings_location)
 
-    app_config = deepcopy(_CACHED_SETTINGS)
-    return app_config
+class SettingsSection(Mapping):
+    """Read-only section of game settings: a mapping of option names to raw
+    string values with the typed getters of `configparser` sections.
+    Like in `configparser`, option names are case-insensitive.
+    """
+    __slots__ = ('name', '_options', '_digest')
 
+    def __init__(self, name, options):
+        self.name = name
+        self._options = {option.lower(): value
+                         for option, value in options.items()}
+        self._digest = None
 
-def refresh_settings(settings_location=None):
-    global _CACHED_SETTINGS
+    def __getitem__(self, option):
+        return self._options[option.lower()]
+
+    def __iter__(self):
+        return iter(self._options)
+
+    def __len__(self):
+        return len(self._options)
+
+    def get(self, option, fallback=None):
+        return self._options.get(option.lower(), fallback)
+
+    def digest(self):
+        """Return the hash of the section content, computed once."""
+        if self._digest is None:
+            self._digest = section_digest(self._options)
+        return self._digest
+
+    def getint(self, option, fallback=None):
+        return self._get(option, int, fallback)
+
+    def getfloat(self, option, fallback=None):
+        return self._get(option, float, fallback)
+
+    def getboolean(self, option, fallback=None):
+        return self._get(option, _to_boolean, fallback)
+
+    def _get(self, option, convert, fallback):
+        value = self._options.get(option.lower())
+        if value is None or value == '':
+            return fallback
+        try:
+            return convert(value)
+        except ValueError:
+            raise SettingsError(
+                f'Invalid value of "{option}" in [{self.name}] settings: '
+                f'{value!r}.') from None
+
+
+def section_digest(options):
+    """Return the SHA-256 hex digest of a mapping of settings options."""
+    content = hashlib.sha256()
+    for option, value in options.items():
+        content.update(repr((option.lower(), value)).encode('utf-8'))
+    return content.hexdigest()
+
+
+def _to_boolean(value):
+    try:
+        return ConfigParser.BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(value) from None
+
+
+def _to_option(value):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (list, tuple)):
+        return ' '.join(map(str, value))
+    return str(value)
+
+
+class GameSettings:
+    """Immutable game settings, parsed and validated once.
+
+    The sections keep the raw option strings (e.g. `settings['Cities']`)
+    and the options used during a game are available as typed attributes.
+    Settings are shared by all the games that use them, and per-game
+    options are set by `replace`, which creates new settings sharing
+    everything but the [Other] section.
+    """
+    __slots__ = (
+        '_sections', 'diseases', 'log_enabled', 'log_level', 'players',
+        'random_state', 'headless', 'journal', 'initial_city', 'epidemics',
+        'infection_rates', 'max_resistance', 'min_players', 'max_players',
+        'max_player_actions', 'outbreak_initial_level',
+        'outbreak_death_level', 'batch_infect_phase', 'signal_buffer_size',
+        'signal_overflow', 'signal_block_timeout', 'event_log',
+        'event_log_max_bytes', 'trace', 'board_cache', 'map_file',
+    )
+
+    def __init__(self, sections):
+        sections = {
+            name: section if isinstance(section, SettingsSection)
+            else SettingsSection(name, section)
+            for name, section in sections.items()
+        }
+        for name in ('Diseases', 'Log', 'Other'):
+            sections.setdefault(name, SettingsSection(name, {}))
+        set_value = super().__setattr__
+        set_value('_sections', sections)
+
+        diseases = sections['Diseases']
+        set_value('diseases', tuple(diseases[key] for key in diseases))
 
+        log_settings = sections['Log']
+        set_value('log_enabled',
+                  log_settings.getboolean('enable_log', fallback=False))
+        set_value('log_level', log_settings.get('level') or 'DEBUG')
+
+        other = sections['Other']
+        set_value('players', tuple(
+            (other.get('players') or DEFAULT_PLAYERS).split()))
+        set_value('random_state', other.getint('random_state'))
+        set_value('headless', other.getboolean('headless', fallback=False))
+        set_value('journal', other.getboolean('journal', fallback=False))
+        set_value('initial_city', other.get('initial_city'))
+        set_value('epidemics', other.getint('epidemics'))
+        set_value('infection_rates', self._parse_rates(other.get('rate')))
+        set_value('max_resistance', other.getint('max_resistance'))
+        set_value('min_players', other.getint('min_players'))
+        set_value('max_players', other.getint('max_players'))
+        set_value('max_player_actions', other.getint('max_player_actions'))
+        set_value('outbreak_initial_level',
+                  other.getint('outbreak_initial_level'))
+        set_value('outbreak_death_level',
+                  other.getint('outbreak_death_level'))
+        set_value('batch_infect_phase',
+                  other.getboolean('batch_infect_phase', fallback=False))
+        set_value('signal_buffer_size',
+                  other.getint('signal_buffer_size', fallback=0))
+        set_value('signal_overflow',
+                  other.get('signal_overflow') or 'drop_oldest')
+        set_value('signal_block_timeout',
+                  other.getfloat('signal_block_timeout'))
+        set_value('event_log', other.get('event_log') or '')
+        set_value('event_log_max_bytes',
+                  other.getint('event_log_max_bytes'))
+        set_value('trace', other.get('trace') or '')
+        set_value('board_cache', other.get('board_cache') or '')
+        set_value('map_file', other.get('map_file') or '')
+
+    @classmethod
+    def from_config(cls, config_parser):
+        return cls({name: config_parser[name]
+                    for name in config_parser.sections()})
+
+    @staticmethod
+    def _parse_rates(rates):
+        if not rates:
+            return ()
+        if not rates.isdigit():
+            raise SettingsError(
+                f'Invalid value of "rate" in [Other] settings: {rates!r}, '
+                'expected a digit per epidemic count.')
+        return tuple(map(int, rates))
+
+    def __getitem__(self, section):
+        return self._sections[section]
+
+    def __contains__(self, section):
+        return section in self._sections
+
+    def sections(self):
+        return list(self._sections)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Game settings are immutable, use replace().')
+
+    def __delattr__(self, name):
+        raise AttributeError('Game settings are immutable, use replace().')
+
+    def __reduce__(self):
+        return type(self), ({name: dict(section) for name, section
+                             in self._sections.items()},)
+
+    def replace(self, **options):
+        """Return settings with the given [Other] options replaced, e.g.
+        `settings.replace(players=['A', 'B'], random_state=42)`.
+        None values are ignored; lists are joined with spaces.
+        """
+        other = dict(self._sections['Other'])
+        for option, value in options.items():
+            if value is not None:
+                other[option] = _to_option(value)
+
+        sections = dict(self._sections)
+        sections['Other'] = SettingsSection('Other', other)
+
+        return type(self)(sections)
+
+
+def read_config(settings_location=None):
+    """Return the `ConfigParser` of the settings file."""
     if settings_location is None:
         settings_location = SETTINGS_DEFAULT_LOCATION
 
     app_config = ConfigParser()
     app_config.read(settings_location)
 
-    _CACHED_SETTINGS = app_config
+    return app_config
+
+
+def get_settings(settings_location=None, *, refresh=False):
+    """Return the game settings. The settings file is parsed on the first
+    call (or with `refresh`) and the same immutable settings are returned
+    by the next calls.
+    """
+    if refresh or _CACHED_SETTINGS is None:
+        refresh_settings(settings_location)
+
+    return _CACHED_SETTINGS
+
+
+def refresh_settings(settings_location=None):
+    global _CACHED_SETTINGS
+
+    _CACHED_SETTINGS = GameSettings.from_config(
+        read_config(settings_location))
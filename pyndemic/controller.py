@@ -1,17 +1,24 @@
 import itertools as its
-import random
 import logging
 from collections import deque
 
 from .game import Game, GameCrisisException
 from .city import NoDiseaseInCityException
 from .character import LastDiseaseCuredException, Character
-from . import log
+from . import log, tracing
 from .commands import COMMANDS
 from .formatter import BaseFormatter
 from .core import api
-from .core.context import ContextRegistrationMeta
+from .core.sinks import (SignalDispatcher, BufferSink, LogSink, CounterSink,
+                         OverflowPolicies)
+from .core.context import (ContextRegistrationMeta, within_context,
+                           discard_context)
 from . import config
+from .journal import set_state
+from .log import logger
+from .event_log import (EventLogSink, open_writer, release_writer,
+                        new_game_id, DEFAULT_MAX_BYTES)
+from .metrics import Metrics
 
 
 class AbstractController(metaclass=ContextRegistrationMeta,
@@ -21,6 +28,11 @@ class AbstractController(metaclass=ContextRegistrationMeta,
     """
     def __init__(self):
         self.signals = deque()
+        self.sinks = SignalDispatcher()
+        self.response_sink = self.sinks.subscribe(BufferSink(self.signals))
+        self.log_sink = self.sinks.subscribe(LogSink())
+        self.signal_counter = self.sinks.subscribe(CounterSink())
+        self.metrics = Metrics()
 
     def __enter__(self):
         self.run()
@@ -28,6 +40,7 @@ def __enter__(self):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.stop()
+        discard_context(self._ctx['id'])
 
     def run(self):
         """Launch the controller so it can receive requests and send responses
@@ -51,22 +64,25 @@ def throw(self, exception):
         """Handle an exception that is sent from outside."""
         raise NotImplementedError
 
-    def emit_signal(self, message, log_level=logging.INFO):
-        if isinstance(message, str):
-            signal = api.message_response(message)
-        else:
-            signal = message
-
-        if log_level is not None:
-            logging.log(log_level, signal)
+    def emit_signal(self, message, *args, log_level=logging.INFO):
+        if self._ctx.get('headless') and \
+                (log_level is None or log_level < logging.WARNING):
+            return
 
-        self.signals.append(signal)
+        self.sinks.emit(message, args, log_level)
 
     def _flush_signals(self):
-        message_block = '\n'.join(signal['message'] for signal in self.signals)
-        self.signals.clear()
+        """Return the list of events emitted since the last flush."""
+        return self.response_sink.drain()
+
+
+def _command_span_name(command):
+    name = command['command']
+    return f'command: {getattr(name, "value", name)}'
+
 
-        return message_block
+def _command_span_args(command):
+    return {'args': command.get('args')}
 
 
 class GameController(AbstractController):
@@ -78,27 +94,22 @@ def __init__(self, **settings):
         self.current_character = None
         self.name_cycle = None
         self._loop = None
+        self.event_log_sink = None
         self.settings = config.get_settings()
+        log.setup_logging(self.settings)
 
         if settings:
             self.setup(settings)
 
     def setup(self, settings):
-        manual_settings = self.settings['Other']
-
-        for key, value in settings.items():
-            if key == 'players':
-                value = ' '.join(value)
-            if value is not None:
-                manual_settings[key] = str(value)
-
-        if 'players' not in manual_settings:
-            manual_settings['players'] = 'Alpha Bravo Charlie Delta'
+        """Override [Other] settings options for this game only."""
+        self.settings = self.settings.replace(**settings)
 
     @property
     def character_names(self):
         return self.characters.keys()
 
+    @within_context
     def run(self):
         self.start_game()
         self._loop = self.game_loop()
@@ -106,29 +117,36 @@ def run(self):
 
     def stop(self):
         self._loop.close()
+        self.close_event_log()
+        self.close_trace()
 
     def throw(self, exception):
         self._loop.throw(exception)
 
+    @within_context
     def start_game(self):
-        manual_settings = self.settings['Other']
-        character_names = manual_settings['players'].split()
+        settings = self.settings
+        self._ctx['headless'] = settings.headless
+        self._ctx['metrics'] = self.metrics
+        self.setup_signal_buffer()
+        self.setup_event_log()
+        self.setup_tracing()
+
+        character_names = settings.players
         self.emit_signal(
-            f'Starting game for {len(character_names)} players.',
+            'Starting game for %s players.', len(character_names),
         )
 
-        self.random_state = manual_settings.getint('random_state')
+        self.random_state = settings.random_state
         if self.random_state is not None:
-            # TODO thread-safe random seeding
-            random.seed(self.random_state)
             self.emit_signal(
-                f'Random state is fixed ({self.random_state})',
+                'Random state is fixed (%s)', self.random_state,
             )
 
         self.characters = {name: Character(name) for name in character_names}
         self.name_cycle = its.cycle(self.character_names)
 
-        self.game = Game()
+        self.game = Game(random_state=self.random_state)
         for character in self.characters.values():
             self.game.add_character(character)
 
@@ -136,18 +154,85 @@ def start_game(self):
         self.game.start_game()
         self._switch_character()
 
+        if settings.journal:
+            self.game.enable_journal()
+
+    def setup_signal_buffer(self):
+        """Bound the buffer of the signals waiting for a response if the
+        "signal_buffer_size" setting is positive.
+        The buffer is drained by the responses, which are made in the thread
+        that emits the signals, so the "block" overflow policy requires
+        "signal_block_timeout": without it the game would wait forever.
+        """
+        settings = self.settings
+        if settings.signal_buffer_size > 0:
+            overflow = OverflowPolicies(settings.signal_overflow)
+            if overflow is OverflowPolicies.BLOCK and \
+                    settings.signal_block_timeout is None:
+                raise config.SettingsError(
+                    'The "block" signal overflow policy requires '
+                    '"signal_block_timeout" to be set.')
+            self.response_sink.maxlen = settings.signal_buffer_size
+            self.response_sink.overflow = overflow
+            self.response_sink.timeout = settings.signal_block_timeout
+
+    def setup_event_log(self):
+        """Write the game events to the JSON lines file given by the
+        "event_log" setting, if any. The games of the process that log to
+        the same file share its writer.
+        """
+        filename = self.settings.event_log
+        if not filename or self.event_log_sink is not None:
+            return
+
+        max_bytes = self.settings.event_log_max_bytes
+        if max_bytes is None:
+            max_bytes = DEFAULT_MAX_BYTES
+        writer = open_writer(filename, max_bytes=max_bytes)
+        self.event_log_sink = self.sinks.subscribe(
+            EventLogSink(writer, new_game_id(), self._turn_number))
+
+    def close_event_log(self):
+        if self.event_log_sink is not None:
+            self.sinks.unsubscribe(self.event_log_sink)
+            release_writer(self.event_log_sink.writer)
+            self.event_log_sink = None
+
+    def setup_tracing(self):
+        """Trace the game phases if the "trace" setting names the file to
+        export the trace to, see `tracing`.
+        """
+        if self.settings.trace:
+            tracing.enable_tracing(self._ctx, f'game {self._ctx["id"]}')
+
+    def close_trace(self):
+        """Stop tracing the game and export the trace in Chrome trace event
+        format to the file given by the "trace" setting, if any.
+        """
+        tracer = tracing.disable_tracing(self._ctx)
+        if tracer is not None and self.settings.trace:
+            tracer.export(self.settings.trace)
+
+    def _turn_number(self):
+        return self.game.turn_number if self.game is not None else None
+
+    @within_context
     def send(self, request):
         if request['type'] == api.RequestTypes.TERMINATION:
             return api.final_response('---<<< That\'s all! >>>---')
 
+        if request['type'] == api.RequestTypes.STATS:
+            return api.stats_response(self.stats())
+
         if request['type'] == api.RequestTypes.CHECK:
-            response = api.message_response(self._flush_signals())
-            response['game_data'] = BaseFormatter.game_to_dict(self.game)
+            response = api.event_response(self._flush_signals())
+            response['game_data'] = self._game_data()
+            response['legal_actions'] = self.game.legal_actions()
             return response
 
         try:
             response = self._loop.send(request)
-            response['game_data'] = BaseFormatter.game_to_dict(self.game)
+            response['game_data'] = self._game_data()
             return response
         except LastDiseaseCuredException as e:
             self.emit_signal(str(e), log_level=logging.WARNING)
@@ -157,11 +242,30 @@ def send(self, request):
             self.emit_signal('Game lost!', log_level=logging.WARNING)
 
         self.emit_signal('---<<< That\'s all! >>>---')
-        final_message = self._flush_signals()
-        response = api.final_response(final_message)
-        response['game_data'] = BaseFormatter.game_to_dict(self.game)
+        response = api.final_response(events=self._flush_signals())
+        response['game_data'] = self._game_data()
         return response
 
+    def _game_data(self):
+        with self.metrics.timer('formatter'):
+            return BaseFormatter.game_to_dict(self.game)
+
+    def stats(self):
+        """Return the runtime metrics of the game: the counters, the
+        histograms of command durations (named "command.<command>"),
+        formatter durations and outbreak chain lengths, and the numbers of
+        emitted signals by event type.
+        """
+        stats = self.metrics.to_dict()
+        counts = self.signal_counter.counts
+        stats['signals'] = {
+            'total': sum(counts.values()),
+            'types': {event_type.value: count
+                      for event_type, count in counts.items()},
+        }
+
+        return stats
+
     def game_loop(self):
         response = None
         while True:
@@ -171,12 +275,30 @@ def game_loop(self):
                 continue
 
             self.run_single_command(command)
-            response = api.message_response(self._flush_signals())
+            response = api.event_response(self._flush_signals())
 
+    @within_context
+    @tracing.traced(_command_span_name, 'command', _command_span_args)
     def run_single_command(self, command):
-        logging.debug(
-            f'Character action: {command}.')
+        if not self._ctx.get('headless'):
+            logger.debug(
+                'Character action: %s.', command)
+
+        with self.metrics.timer(_command_metric(command['command'])):
+            if command['command'] in (api.GameplayCommands.UNDO,
+                                      api.GameplayCommands.REDO):
+                self.revert_command(command['command'])
+                return
+
+            journal = self.game.journal
+            if journal is None:
+                self.run_game_command(command)
+                return
 
+            with journal.action():
+                self.run_game_command(command)
+
+    def run_game_command(self, command):
         for executor_class in COMMANDS:
             executor = executor_class(self.game, self.current_character, self)
             if executor.check_valid_command(command):
@@ -202,17 +324,58 @@ def run_single_command(self, command):
             self._switch_character()
         else:
             self.emit_signal(
-                f'Actions left: {self.current_character.action_count}',
+                'Actions left: %s', self.current_character.action_count,
             )
 
+    def revert_command(self, command_name):
+        """Undo or redo the last character command using the game action
+        journal.
+        """
+        if command_name == api.GameplayCommands.UNDO:
+            success = self.game.undo()
+        else:
+            success = self.game.redo()
+        command_name = getattr(command_name, 'value', command_name)
+
+        if not success:
+            self.emit_signal(
+                'There is nothing to %s.', command_name,
+                log_level=logging.ERROR)
+            return
+
+        self._restore_current_character()
+        self.emit_signal(
+            'Performed %s. Active player: %s',
+            command_name, self.current_character.name,
+        )
+        self.emit_signal(
+            'Actions left: %s', self.current_character.action_count,
+        )
+
+    def _restore_current_character(self):
+        names = list(self.character_names)
+        position = names.index(self.game.active_character)
+        self.current_character = self.characters[names[position]]
+        self.name_cycle = its.islice(its.cycle(names), position + 1, None)
+
     def _switch_character(self):
         self.current_character = self.characters[next(self.name_cycle)]
-        self.game.active_character = self.current_character.name
+        set_state(self.game, 'active_character', self.current_character.name)
         self.emit_signal(
-            f'Active player: {self.current_character.name}',
+            'Active player: %s', self.current_character.name,
         )
 
         self.game.start_turn(self.current_character)
         self.emit_signal(
-            f'Actions left: {self.current_character.action_count}',
+            'Actions left: %s', self.current_character.action_count,
         )
+
+
+def _command_metric(command_name):
+    """Return the metric name of a command; all the unknown commands share
+    one metric, so client input cannot add metrics without limit.
+    """
+    try:
+        return f'command.{api.GameplayCommands(command_name).value}'
+    except (ValueError, TypeError):
+        return 'command.unknown'
@@ -1,2 +1,3 @@
-from .game_entity import GameEntity
+from .game_entity import BaseGameEntity, GameEntity
 from . import api
+from . import events
@@ -7,12 +7,14 @@ class RequestTypes(StringEnum):
     COMMAND = 'command'
     MESSAGE = 'message'
     TERMINATION = 'termination'
+    STATS = 'stats'
 
 
 class ResponseTypes(StringEnum):
     EMPTY = 'empty'
     MESSAGE = 'message'
     TERMINATION = 'termination'
+    STATS = 'stats'
 
 
 class GameplayCommands(StringEnum):
@@ -24,7 +26,10 @@ class GameplayCommands(StringEnum):
     TREAT = 'treat'
     CURE = 'cure'
     SHARE = 'share'
+    PLAY = 'play'
     PASS = 'pass'
+    UNDO = 'undo'
+    REDO = 'redo'
 
 
 def termination_request():
@@ -34,6 +39,13 @@ def termination_request():
     return request
 
 
+def stats_request():
+    request = {
+        'type': RequestTypes.STATS,
+    }
+    return request
+
+
 def empty_response():
     response = {
         'type': ResponseTypes.EMPTY,
@@ -41,11 +53,13 @@ def empty_response():
     return response
 
 
-def final_response(message=None):
+def final_response(message=None, events=None):
     response = {
         'type': ResponseTypes.TERMINATION,
         'message': message,
     }
+    if events is not None:
+        response['events'] = events
 
     return response
 
@@ -57,3 +71,32 @@ def message_response(message):
     }
 
     return response
+
+
+def event_response(events):
+    """Response carrying a list of game events (see `core.events`)."""
+    response = {
+        'type': ResponseTypes.MESSAGE,
+        'events': events,
+    }
+
+    return response
+
+
+def stats_response(stats):
+    """Response carrying the runtime metrics of the game."""
+    response = {
+        'type': ResponseTypes.STATS,
+        'stats': stats,
+    }
+
+    return response
+
+
+def response_text(response):
+    """Return the text of the response, rendering its events if needed."""
+    lines = [str(event) for event in response.get('events', ())]
+    if response.get('message'):
+        lines.insert(0, response['message'])
+
+    return '\n'.join(lines)
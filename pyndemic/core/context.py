@@ -1,10 +1,12 @@
-import random
-import string
-import inspect
+import itertools
+import threading
 import weakref
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 
-_ISOLATED_RANDOM = random.Random()
+_CURRENT_CONTEXT = ContextVar('game_context', default=None)
 
 
 class ContextError(Exception):
@@ -16,22 +18,35 @@ class ContextNotFoundError(ContextError):
 
 
 class _ContextManager:
+    """Process-wide registry of game contexts by their ids.
+    All changes are made under the lock, which is reentrant because contexts
+    are also unregistered from weakref callbacks, and those can run in any
+    thread at any allocation, including one that already holds the lock.
+    """
     _contexts = {}
+    _lock = threading.RLock()
+    _ids = itertools.count(1)
 
 
 def register_context(context_id, context):
-    if context_id in _ContextManager._contexts:
-        raise ContextError(
-            f'Such context is already present: {context_id}')
-    _ContextManager._contexts[context_id] = context
+    with _ContextManager._lock:
+        if context_id in _ContextManager._contexts:
+            raise ContextError(
+                f'Such context is already present: {context_id}')
+        _ContextManager._contexts[context_id] = context
 
 
 def unregister_context(context_id):
-    if context_id not in _ContextManager._contexts:
-        raise ContextNotFoundError(
-            f'Such context is not registered: {context_id}')
+    with _ContextManager._lock:
+        if _ContextManager._contexts.pop(context_id, None) is None:
+            raise ContextNotFoundError(
+                f'Such context is not registered: {context_id}')
 
-    _ContextManager._contexts.pop(context_id)
+
+def discard_context(context_id):
+    """Unregister the context if it is still registered."""
+    with _ContextManager._lock:
+        _ContextManager._contexts.pop(context_id, None)
 
 
 def get_context(context_id):
@@ -44,35 +59,49 @@ def get_context(context_id):
     return context
 
 
-# TODO: regenerate when conflict occures
 def generate_id():
-    context_id = ''.join(
-        _ISOLATED_RANDOM.choice(string.ascii_lowercase) for _ in range(8))
-    return context_id
+    """Return a new context id. Ids are taken from a process-wide counter, so
+    they never repeat within the process, but every process counts from the
+    same start: ids of games in different processes are not unique.
+    """
+    with _ContextManager._lock:
+        number = next(_ContextManager._ids)
+
+    return f'{number:08x}'
 
 
-def search_context():
-    """Find the nearest caller object posed as "self" with game context
-    (if exists) and return its context.
-    Otherwise, return None.
+def current_context():
+    """Return the game context active in the current thread or asynchronous
+    task, or None if there is no active context.
     """
-    frame = inspect.currentframe()
-    try:
-        while frame is not None:
-            if 'self' not in frame.f_locals:
-                frame = frame.f_back
-                continue
+    return _CURRENT_CONTEXT.get()
 
-            calling_object = frame.f_locals['self']
-            if hasattr(calling_object, '_ctx'):
-                ctx = calling_object._ctx
-                return ctx
 
-            frame = frame.f_back
+@contextmanager
+def game_context(ctx):
+    """Make the game context active for the code inside the `with` block, so
+    game objects created there are attached to it.
+    """
+    token = _CURRENT_CONTEXT.set(ctx)
+    try:
+        yield ctx
     finally:
-        del frame
+        _CURRENT_CONTEXT.reset(token)
+
+
+def within_context(method):
+    """Decorate a method of a context holder so that the holder context is
+    active while the method runs.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        token = _CURRENT_CONTEXT.set(self._ctx)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _CURRENT_CONTEXT.reset(token)
 
-    return None
+    return wrapper
 
 
 class ContextRegistrationMeta(type):
@@ -92,7 +121,7 @@ def __call__(cls, *args, **kwargs):
 
         context_id = generate_id()
         on_obj_delete = (lambda ref, ctx_id=context_id:
-                         unregister_context(ctx_id))
+                         discard_context(ctx_id))
         ctx = {
             cls._ctx_name: weakref.ref(obj, on_obj_delete),
             'id': context_id,
@@ -0,0 +1,211 @@
+"""Typed game events.
+
+Game objects report what happens in the game by emitting events instead of
+ready-made message strings. An event keeps its data in plain fields (names,
+colours, numbers), so programmatic clients can read it directly, and its
+text is rendered only when a consumer asks for it (see `Event.render`).
+"""
+from .utils import StringEnum
+
+
+class EventTypes(StringEnum):
+    MESSAGE = 'message'
+    INFECTED = 'infected'
+    OUTBREAK = 'outbreak'
+    EPIDEMIC = 'epidemic'
+    INFECTION_RATE = 'infection_rate'
+    TURN_STARTED = 'turn_started'
+    MOVED = 'moved'
+    LAB_BUILT = 'lab_built'
+    TREATED = 'treated'
+    CURED = 'cured'
+    SHARED = 'shared'
+    DREW_CARD = 'drew_card'
+    DISCARDED = 'discarded'
+    PLAYED_CARD = 'played_card'
+    PASSED = 'passed'
+    COALESCED = 'coalesced'
+
+
+class Event:
+    """Base class for every game event.
+    Subclasses list their data in `fields` (which also serve as their slots)
+    and describe their text with a `str.format` template over these fields.
+    """
+    __slots__ = ()
+    type = None
+    fields = ()
+    template = ''
+
+    def __init__(self, *values):
+        if len(values) != len(self.fields):
+            raise TypeError(
+                f'{type(self).__name__} takes {len(self.fields)} values '
+                f'({", ".join(self.fields)}), got {len(values)}.')
+        for name, value in zip(self.fields, values):
+            setattr(self, name, value)
+
+    def render(self):
+        return self.template.format_map(self.to_dict())
+
+    def to_dict(self):
+        data = {'type': self.type}
+        for name in self.fields:
+            data[name] = getattr(self, name)
+
+        return data
+
+    def __str__(self):
+        return self.render()
+
+    def __repr__(self):
+        values = ', '.join(repr(getattr(self, name)) for name in self.fields)
+        return f'{type(self).__name__}({values})'
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+
+class Message(Event):
+    """Free-form event. Like in `logging`, the message is a %-format string
+    which is merged with `args` only when the event is rendered.
+    """
+    __slots__ = fields = ('message', 'args')
+    type = EventTypes.MESSAGE
+
+    def render(self):
+        if self.args:
+            return self.message % self.args
+        return self.message
+
+    def to_dict(self):
+        return {'type': self.type, 'message': self.render()}
+
+
+class Infected(Event):
+    __slots__ = fields = ('city', 'colour', 'level')
+    type = EventTypes.INFECTED
+    template = 'Infected {city} with {colour} disease (reached level {level}).'
+
+
+class Outbreak(Event):
+    __slots__ = fields = ('city', 'colour', 'outbreak_count')
+    type = EventTypes.OUTBREAK
+    template = ('Outbreak in {city} ({colour} disease). '
+                'Outbreak level is now {outbreak_count}.')
+
+
+class Epidemic(Event):
+    __slots__ = fields = ('city', 'colour')
+    type = EventTypes.EPIDEMIC
+    template = 'Starting epidemic in {city} ({colour} disease).'
+
+
+class InfectionRateChanged(Event):
+    __slots__ = fields = ('infection_rate',)
+    type = EventTypes.INFECTION_RATE
+    template = 'Infection rate incremented (now {infection_rate}).'
+
+
+class TurnStarted(Event):
+    __slots__ = fields = ('character',)
+    type = EventTypes.TURN_STARTED
+    template = '{character} now plays.'
+
+
+class Moved(Event):
+    """Movement of a character; `kind` is the way of travel, e.g.
+    "standard move" or "shuttle flight".
+    """
+    __slots__ = fields = ('character', 'kind', 'origin', 'destination')
+    type = EventTypes.MOVED
+    template = '{character}: Performed {kind} from {origin} to {destination}.'
+
+
+class LabBuilt(Event):
+    """Laboratory built by a character or, if `character` is None, by an
+    action card.
+    """
+    __slots__ = fields = ('character', 'city')
+    type = EventTypes.LAB_BUILT
+
+    def render(self):
+        if self.character is None:
+            return f'Action: Built a lab in {self.city}.'
+        return f'{self.character}: Built laboratory in {self.city}.'
+
+
+class Treated(Event):
+    __slots__ = fields = ('character', 'city', 'colour', 'level', 'effective')
+    type = EventTypes.TREATED
+
+    def render(self):
+        effectively = ' (effectively)' if self.effective else ''
+        return (f'{self.character}: Treated {self.colour} disease in '
+                f'{self.city}{effectively}. Now {self.city} has {self.level} '
+                f'level of {self.colour} disease.')
+
+
+class Cured(Event):
+    __slots__ = fields = ('character', 'city', 'colour')
+    type = EventTypes.CURED
+    template = '{character}: Cured {colour} disease in {city}.'
+
+
+class Shared(Event):
+    __slots__ = fields = ('character', 'card', 'other_character')
+    type = EventTypes.SHARED
+    template = '{character}: Shared knowledge {card} with {other_character}.'
+
+
+class DrewCard(Event):
+    __slots__ = fields = ('character', 'card')
+    type = EventTypes.DREW_CARD
+    template = '{character} drew {card}.'
+
+
+class Discarded(Event):
+    __slots__ = fields = ('character', 'card')
+    type = EventTypes.DISCARDED
+    template = '{character}: discarded {card}.'
+
+
+class PlayedCard(Event):
+    __slots__ = fields = ('character', 'card', 'args')
+    type = EventTypes.PLAYED_CARD
+    template = '{character}: Playing {card}.'
+
+
+class Passed(Event):
+    __slots__ = fields = ('character',)
+    type = EventTypes.PASSED
+    template = '{character}: made magic pass.'
+
+
+class Coalesced(Event):
+    """Summary of the events that did not fit into a full signal buffer.
+    `counts` maps event types to the numbers of the summarized events.
+    """
+    __slots__ = fields = ('counts',)
+    type = EventTypes.COALESCED
+
+    def render(self):
+        total = sum(self.counts.values())
+        details = ', '.join(f'{event_type.value}: {count}'
+                            for event_type, count in self.counts.items())
+        return f'... and {total} more events ({details}).'
+
+
+def make_event(message, args):
+    """Return the event to emit for `emit_signal` arguments: an event class
+    is instantiated with `args`, a string becomes a `Message`.
+    """
+    if isinstance(message, str):
+        return Message(message, args)
+    if isinstance(message, Event):
+        return message
+    return message(*args)
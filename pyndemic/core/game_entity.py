@@ -1,23 +1,23 @@
 import logging
 
-from .context import ContextError, search_context
-from . import api
+from .context import ContextError, current_context
+from ..log import logger
 
 
 class GameEntityCreationMeta(type):
-    """This class builder ensures that the object created as an instance of
-    that class will get access to the context kept by the object that caused
-    the creation of this instance.
-    If caller object context is not present, the instance context will also be
-    undefined.
+    """This class builder attaches every created instance to a game context:
+    the one passed explicitly as the `ctx` keyword argument or else the one
+    that is currently active (see `context.game_context`).
+    If there is no such context, the instance context will be undefined.
     """
-    def __call__(cls, *args, **kwargs):
+    def __call__(cls, *args, ctx=None, **kwargs):
         obj = super().__call__(*args, **kwargs)
 
-        ctx = search_context()
+        if ctx is None:
+            ctx = current_context()
         if not ctx:
-            logging.warning(
-                f'Creating game object "{obj}" with no context attached.')
+            logger.warning(
+                'Creating game object "%s" with no context attached.', obj)
             ctx = {}
 
         obj._ctx = ctx
@@ -25,9 +25,28 @@ def __call__(cls, *args, **kwargs):
         return obj
 
 
-class GameEntity(metaclass=GameEntityCreationMeta):
-    """Base class for every game object."""
-    signals_enabled = True
+class BaseGameEntity(metaclass=GameEntityCreationMeta):
+    """Base class for every game object: access to its game context.
+    It keeps the context in a slot and has no instance dict, so that
+    objects made in large numbers (see `city.BoardCity`) can derive from it
+    with slots of their own.
+    """
+    __slots__ = ('_ctx',)
+
+    @property
+    def headless(self):
+        """True if the object belongs to a game running in headless mode.
+        Headless games do not build informational signals nor debug log
+        records.
+        """
+        return self._ctx.get('headless', False)
+
+    @property
+    def journal(self):
+        """Action journal of the game or None if the game actions are not
+        journaled.
+        """
+        return self._ctx.get('journal')
 
     def assert_has_context(self):
         try:
@@ -38,11 +57,40 @@ def assert_has_context(self):
                  'procedure but is outside any game context or has invalid '
                  'context.'))
 
-    def emit_signal(self, message, log_level=logging.INFO):
+
+class GameEntity(BaseGameEntity):
+    """Base class for the game objects that send signals."""
+    signals_enabled = True
+
+    def shallow_clone(self, ctx):
+        """Return a shallow copy of the object attached to the given context.
+        The copy skips `__init__` and the context search of regular object
+        creation; mutable attributes are shared until they are replaced.
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__ = self.__dict__.copy()
+        clone._ctx = ctx
+
+        return clone
+
+    def emit_signal(self, message, *args, log_level=logging.INFO):
+        """Send an event to the sinks subscribed to the controller of the
+        game (see `sinks.SignalDispatcher`).
+        The message is either an event class, which is instantiated with
+        `args` only when the signal is actually emitted, or a %-format string
+        for a generic `events.Message`. Headless objects without a controller
+        (e.g. game clones) drop all their signals.
+        """
+        if self._ctx.get('headless') and \
+                (log_level is None or log_level < logging.WARNING or
+                 'controller' not in self._ctx):
+            return
+
         if not self.signals_enabled:
-            logging.debug(
-                (f'Attempting to send a message ({message}) from {self}, '
-                 'however, signal emitting is disabled.'))
+            logger.debug(
+                ('Attempting to send a message (%s) from %s, '
+                 'however, signal emitting is disabled.'),
+                message, self)
             return
 
         self.assert_has_context()
@@ -53,13 +101,4 @@ def emit_signal(self, message, log_level=logging.INFO):
                  'game context is empty.'))
 
         controller = self._ctx['controller']()
-
-        if isinstance(message, str):
-            signal = api.message_response(message)
-        else:
-            signal = message
-
-        if log_level is not None:
-            logging.log(log_level, signal)
-
-        controller.signals.append(signal)
+        controller.sinks.emit(message, args, log_level)
@@ -0,0 +1,215 @@
+"""Signal sinks: subscribers to the game events of a controller.
+
+Every sink may be limited to some event types and to a minimum level. The
+controller dispatcher routes each signal only to the sinks interested in
+it; if there are none, the event object is not even created.
+"""
+import logging
+import threading
+from collections import Counter
+
+from . import events
+from .. import log
+from .utils import StringEnum
+
+
+class OverflowPolicies(StringEnum):
+    DROP_OLDEST = 'drop_oldest'
+    COALESCE = 'coalesce'
+    BLOCK = 'block'
+
+
+class Sink:
+    """Base class for event receivers.
+
+    :param types: event types to receive (see `events.EventTypes`),
+        None for all types
+    :param level: minimum logging level of the received signals
+    """
+    def __init__(self, types=None, level=logging.NOTSET):
+        self.types = None if types is None else frozenset(types)
+        self.level = level
+
+    def accepts(self, event_type, level):
+        if level < self.level:
+            return False
+        return self.types is None or event_type in self.types
+
+    def handle(self, event, level):
+        raise NotImplementedError
+
+
+class BufferSink(Sink):
+    """Keep events in a deque, e.g. until the controller sends them in
+    a response.
+
+    The buffer is unbounded unless `maxlen` is given. Then the `overflow`
+    policy decides what happens to the events that do not fit:
+    "drop_oldest" drops the oldest buffered event, "coalesce" keeps
+    a `Coalesced` summary of the extra events in the last place of the buffer
+    and "block" makes the emitting thread wait until another thread drains
+    the buffer, at most `timeout` seconds, after which the event is dropped.
+    `dropped` counts the events lost or summarized because of overflow.
+    """
+    def __init__(self, buffer, types=None, level=logging.NOTSET,
+                 maxlen=None, overflow=OverflowPolicies.DROP_OLDEST,
+                 timeout=None):
+        super().__init__(types, level)
+        self.buffer = buffer
+        self.maxlen = maxlen
+        self.overflow = OverflowPolicies(overflow)
+        self.timeout = timeout
+        self.dropped = 0
+        self._drained = threading.Condition()
+
+    def handle(self, event, level):
+        buffer = self.buffer
+        if self.maxlen is None or len(buffer) < self.maxlen:
+            buffer.append(event)
+        elif self.overflow is OverflowPolicies.DROP_OLDEST:
+            buffer.popleft()
+            buffer.append(event)
+            self.dropped += 1
+        elif self.overflow is OverflowPolicies.COALESCE:
+            self._coalesce(event)
+        else:
+            self._wait_and_append(event)
+
+    def _coalesce(self, event):
+        buffer = self.buffer
+        last = buffer[-1] if buffer else None
+        if isinstance(last, events.Coalesced):
+            last.counts[event.type] += 1
+            self.dropped += 1
+            return
+
+        counts = Counter()
+        if last is not None:
+            counts[last.type] += 1
+            self.dropped += 1
+        counts[event.type] += 1
+        self.dropped += 1
+        if buffer:
+            buffer[-1] = events.Coalesced(counts)
+        else:
+            buffer.append(events.Coalesced(counts))
+
+    def _wait_and_append(self, event):
+        buffer = self.buffer
+        with self._drained:
+            if self._drained.wait_for(lambda: len(buffer) < self.maxlen,
+                                      self.timeout):
+                buffer.append(event)
+            else:
+                self.dropped += 1
+
+    def drain(self):
+        """Remove and return the list of all the buffered events, waking up
+        the threads blocked on the full buffer.
+        """
+        buffer = self.buffer
+        drained = []
+        with self._drained:
+            while buffer:
+                drained.append(buffer.popleft())
+            self._drained.notify_all()
+
+        return drained
+
+
+class LogSink(Sink):
+    """Log events with their levels. The event text is rendered only if the
+    logger actually handles the record.
+
+    :param logger: logger to log the events to, the game logger
+        (`log.logger`) by default
+    """
+    def __init__(self, logger=None, types=None, level=logging.NOTSET):
+        super().__init__(types, level)
+        self.logger = logger
+
+    def handle(self, event, level):
+        logger = self.logger if self.logger is not None else log.logger
+        logger.log(level, '%s', event)
+
+
+class StreamSink(Sink):
+    """Write rendered events to a text stream, e.g. the console or a file."""
+    def __init__(self, stream, types=None, level=logging.NOTSET):
+        super().__init__(types, level)
+        self.stream = stream
+
+    def handle(self, event, level):
+        self.stream.write(f'{event}\n')
+
+
+class CounterSink(Sink):
+    """Count events by their types without keeping them."""
+    def __init__(self, types=None, level=logging.NOTSET):
+        super().__init__(types, level)
+        self.counts = Counter()
+
+    def handle(self, event, level):
+        self.counts[event.type] += 1
+
+
+class CallbackSink(Sink):
+    """Pass events to a function, e.g. to a bot or a replay recorder."""
+    def __init__(self, callback, types=None, level=logging.NOTSET):
+        super().__init__(types, level)
+        self.callback = callback
+
+    def handle(self, event, level):
+        self.callback(event, level)
+
+
+class SignalDispatcher:
+    """Set of sinks subscribed to the signals of a controller.
+    Sinks interested in each pair of an event type and a level are looked up
+    once and cached until the subscriptions change.
+    """
+    def __init__(self):
+        self.sinks = []
+        self._routes = {}
+
+    def subscribe(self, sink):
+        self.sinks.append(sink)
+        self._routes.clear()
+
+        return sink
+
+    def unsubscribe(self, sink):
+        self.sinks.remove(sink)
+        self._routes.clear()
+
+    def route(self, event_type, level):
+        """Return a tuple of the sinks interested in the signal."""
+        try:
+            return self._routes[event_type, level]
+        except KeyError:
+            sinks = tuple(sink for sink in self.sinks
+                          if sink.accepts(event_type, level))
+            self._routes[event_type, level] = sinks
+            return sinks
+
+    def emit(self, message, args, level=logging.INFO):
+        """Create the event of `emit_signal` arguments (see
+        `events.make_event`) and pass it to the interested sinks.
+        Return the event or None if no sink wants it.
+        """
+        if level is None:
+            level = logging.NOTSET
+        if isinstance(message, str):
+            event_type = events.EventTypes.MESSAGE
+        else:
+            event_type = message.type
+
+        sinks = self.route(event_type, level)
+        if not sinks:
+            return None
+
+        event = events.make_event(message, args)
+        for sink in sinks:
+            sink.handle(event, level)
+
+        return event
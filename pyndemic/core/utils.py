@@ -3,3 +3,46 @@
 
 class StringEnum(str, Enum):
     pass
+
+
+class VisitedSet:
+    """Reusable set of small non-negative integers backed by a byte array.
+
+    Membership tests and insertions are O(1); clearing costs only as much as
+    the number of items added since the last clear, so the same instance can
+    be reused across many short traversals.
+    """
+    def __init__(self, size=0):
+        self._flags = bytearray(size)
+        self._members = []
+
+    def __contains__(self, item):
+        return 0 <= item < len(self._flags) and self._flags[item] == 1
+
+    def __len__(self):
+        return len(self._members)
+
+    def __iter__(self):
+        return iter(self._members)
+
+    def resize(self, size):
+        self._flags = bytearray(size)
+        self._members = []
+
+    def add(self, item):
+        if not self._flags[item]:
+            self._flags[item] = 1
+            self._members.append(item)
+
+    def copy(self):
+        visited = VisitedSet.__new__(VisitedSet)
+        visited._flags = self._flags[:]
+        visited._members = self._members[:]
+
+        return visited
+
+    def clear(self):
+        flags = self._flags
+        for item in self._members:
+            flags[item] = 0
+        self._members.clear()
@@ -1,11 +1,12 @@
 import random
-from itertools import cycle, chain
-import logging
+from collections import deque
 
 from .exceptions import GameCrisisException
 from .core import GameEntity
 from .action_card import ACTION_CARDS
 from .card import CityCard, InfectCard, EpidemicCard
+from .journal import set_state
+from .log import logger
 
 
 class ExhaustedPlayerDeckException(GameCrisisException):
@@ -14,9 +15,18 @@ def __str__(self):
 
 
 class Deck(GameEntity):
-    def __init__(self):
-        self.cards = []
+    """Base deck class.
+    Cards are kept in a deque with the top of the deck on the left, so that
+    drawing from either end and putting cards on top take constant time.
+
+    :param rng: random number generator used for shuffling, normally the one
+        of the game that owns the deck. If not given, the global `random`
+        module generator is used.
+    """
+    def __init__(self, rng=None):
+        self.cards = deque()
         self.discard = []
+        self.rng = rng if rng is not None else random
 
     def __str__(self):
         return f'{self.__class__.__name__}'
@@ -27,25 +37,65 @@ def info(self):
         return result
 
     def clear(self):
-        self.cards = []
+        self.cards = deque()
         self.discard = []
 
     def take_top_card(self):
-        return self.cards.pop(0)
+        card = self.cards.popleft()
+        journal = self._ctx.get('journal')
+        if journal is not None:
+            journal.record_remove(self.cards, 0, card)
+        return card
+
+    def take_top_cards(self, number):
+        """Take up to `number` cards from the top of the deck at once."""
+        take_card = self.cards.popleft
+        cards = [take_card() for _ in range(min(number, len(self.cards)))]
+        journal = self._ctx.get('journal')
+        if journal is not None:
+            for card in cards:
+                journal.record_remove(self.cards, 0, card)
+        return cards
 
     def take_bottom_card(self):
-        return self.cards.pop()
+        card = self.cards.pop()
+        journal = self._ctx.get('journal')
+        if journal is not None:
+            journal.record_remove(self.cards, len(self.cards), card)
+        return card
 
     def add_card(self, new_card):
         self.cards.append(new_card)
+        journal = self._ctx.get('journal')
+        if journal is not None:
+            journal.record_insert(self.cards, len(self.cards) - 1, new_card)
+
+    def put_on_top(self, cards):
+        """Put the cards on top of the deck keeping their order, so the first
+        of them becomes the top card.
+        """
+        self.cards.extendleft(reversed(cards))
+        journal = self._ctx.get('journal')
+        if journal is not None:
+            for card in reversed(cards):
+                journal.record_insert(self.cards, 0, card)
 
     def add_discard(self, discarded_card, *, on_discard=True):
         if on_discard:
             discarded_card.on_discard()
         self.discard.append(discarded_card)
+        journal = self._ctx.get('journal')
+        if journal is not None:
+            journal.record_insert(
+                self.discard, len(self.discard) - 1, discarded_card)
 
     def shuffle(self):
-        random.shuffle(self.cards)
+        cards = list(self.cards)
+        journal = self._ctx.get('journal')
+        if journal is not None:
+            journal.record_random_state(self.rng)
+        self.rng.shuffle(cards)
+        set_state(self, 'cards', deque(cards))
 
     def draw_card(self, drawing_character, *, on_draw=True):
         """Draws a card from the deck.
@@ -77,26 +127,25 @@ def prepare(self, cities):
             new_card = card_class()
             self.add_card(new_card)
 
-        logging.debug(
-            f'{self} prepared.')
+        logger.debug(
+            '%s prepared.', self)
 
     def add_epidemics(self, number_epidemics):
-        card_piles = [[] for i in range(number_epidemics)]
-        random.shuffle(self.cards)
-
-        for pile in cycle(card_piles):
-            pile.append(self.cards.pop())
-            if not self.cards:
-                break
-
-        for pile in card_piles:
-            epidemic_card = EpidemicCard()
-            place_to_insert = random.randint(0, len(pile))
-            pile.insert(place_to_insert, epidemic_card)
-
-        self.cards = list(chain(*card_piles))
-        logging.debug(
-            f'Added {number_epidemics} Epidemics to {self}.')
+        cards = list(self.cards)
+        self.rng.shuffle(cards)
+        # Cards are dealt from the bottom of the shuffled deck into the piles
+        # in turn, so the pile `i` gets every `number_epidemics`-th card.
+        cards.reverse()
+
+        self.cards = deque()
+        for pile_number in range(number_epidemics):
+            pile = cards[pile_number::number_epidemics]
+            place_to_insert = self.rng.randint(0, len(pile))
+            pile.insert(place_to_insert, EpidemicCard())
+            self.cards.extend(pile)
+
+        logger.debug(
+            'Added %s Epidemics to %s.', number_epidemics, self)
 
     def on_deck_exhausted(self, drawing_character):
         raise ExhaustedPlayerDeckException
@@ -109,12 +158,17 @@ def prepare(self, cities):
             new_card = InfectCard(city.name, city.colour)
             self.add_card(new_card)
 
-        logging.debug(
-            f'{self} prepared.')
+        logger.debug(
+            '%s prepared.', self)
 
     def shuffle_discard_to_top(self):
-        random.shuffle(self.discard)
-        self.cards = self.discard + self.cards
-        self.discard = []
-        logging.debug(
-            f'Shuffled infect discard and placed on top of {self}.')
+        discard = list(self.discard)
+        journal = self._ctx.get('journal')
+        if journal is not None:
+            journal.record_random_state(self.rng)
+        self.rng.shuffle(discard)
+        self.put_on_top(discard)
+        set_state(self, 'discard', [])
+        if not self.headless:
+            logger.debug(
+                'Shuffled infect discard and placed on top of %s.', self)
@@ -1,7 +1,7 @@
-import logging
-
 from .exceptions import GameCrisisException
 from .core import GameEntity
+from .journal import set_state
+from .log import logger
 
 
 class NoHealthException(GameCrisisException):
@@ -36,12 +36,13 @@ def increase_resistance(self, change_size):
         :param change_size: Int
         """
 
-        self.public_health += change_size
+        set_state(self, 'public_health', self.public_health + change_size)
 
-        logging.debug(
-            (f'Public health resistance to {self.colour} disease is now '
-             f'{self.public_health}.'),
-        )
+        if not self.headless:
+            logger.debug(
+                'Public health resistance to %s disease is now %s.',
+                self.colour, self.public_health,
+            )
 
     def decrease_resistance(self, change_size):
         """
@@ -51,9 +52,15 @@ def decrease_resistance(self, change_size):
         if change_size >= self.public_health:
             raise NoHealthException(self.colour)
         else:
+            journal = self._ctx.get('journal')
+            if journal is not None:
+                journal.record_attribute(
+                    self, 'public_health', self.public_health,
+                    self.public_health - change_size)
             self.public_health -= change_size
 
-            logging.debug(
-                (f'Public health resistance to {self.colour} disease is now '
-                 f'{self.public_health}.'),
-            )
+            if not self.headless:
+                logger.debug(
+                    'Public health resistance to %s disease is now %s.',
+                    self.colour, self.public_health,
+                )
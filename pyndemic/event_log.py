@@ -0,0 +1,208 @@
+"""Structured game event log: one JSON object per line.
+
+Every record carries the game id, the turn number, the sequence number of
+the event within the game, the time, the level and the event fields, e.g.
+
+    {"game": "9f1c0b6e...", "turn": 3, "seq": 118, "time": 1700000000.5,
+     "level": "INFO", "event": {"type": "outbreak", "city": "Paris", ...}}
+
+Records are serialized and written by a background thread, which syncs the
+file to disk once per batch of records and rotates it by size. All the games
+of a process that log to the same file share its writer, see `open_writer`.
+"""
+import os
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+import itertools
+import weakref
+import uuid
+
+from .core.sinks import Sink
+
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 4
+
+_open_writers = weakref.WeakSet()
+_shared_writers = {}
+_shared_writers_lock = threading.Lock()
+
+
+class EventLogWriter:
+    """Append JSON lines to a file from a background thread.
+
+    :param filename: path of the log file
+    :param max_bytes: size after which the file is rotated, 0 to never
+        rotate it
+    :param backup_count: number of rotated files kept as `filename.1`,
+        `filename.2` and so on
+    """
+    _STOP = object()
+
+    def __init__(self, filename, max_bytes=DEFAULT_MAX_BYTES,
+                 backup_count=DEFAULT_BACKUP_COUNT):
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.written = 0
+        self._queue = queue.SimpleQueue()
+        self._file = None
+        self._thread = threading.Thread(
+            target=self._run, name='pyndemic-event-log', daemon=True)
+
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._open()
+        self._thread.start()
+        _open_writers.add(self)
+        atexit.unregister(_close_open_writers)
+        atexit.register(_close_open_writers)
+
+    def write(self, record):
+        """Queue a record: a tuple of the game id, the turn, the sequence
+        number, the time, the level and the event.
+        """
+        self._queue.put(record)
+
+    def close(self):
+        """Write all the queued records and close the file."""
+        if self._file is None:
+            return
+
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._file.close()
+        self._file = None
+        _open_writers.discard(self)
+
+    def _open(self):
+        self._file = open(self.filename, 'a', encoding='utf-8')
+        self._file.seek(0, os.SEEK_END)
+        self.written = self._file.tell()
+
+    def _rotate(self):
+        self._file.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f'{self.filename}.{index}'
+            if os.path.exists(source):
+                os.replace(source, f'{self.filename}.{index + 1}')
+        if self.backup_count > 0:
+            os.replace(self.filename, f'{self.filename}.1')
+        else:
+            os.remove(self.filename)
+        self._open()
+
+    def _run(self):
+        log_queue = self._queue
+        while True:
+            record = log_queue.get()
+            lines = []
+            while record is not self._STOP:
+                lines.append(self._serialize(record))
+                try:
+                    record = log_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            for line in lines:
+                if self.max_bytes and self.written and \
+                        self.written + len(line) > self.max_bytes:
+                    self._sync()
+                    self._rotate()
+                self._file.write(line)
+                self.written += len(line)
+            self._sync()
+
+            if record is self._STOP:
+                return
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    @staticmethod
+    def _serialize(record):
+        game_id, turn, sequence, created, level, event = record
+        data = {
+            'game': game_id,
+            'turn': turn,
+            'seq': sequence,
+            'time': created,
+            'level': logging.getLevelName(level),
+            'event': event.to_dict(),
+        }
+        return json.dumps(data, separators=(',', ':'), default=str) + '\n'
+
+
+def open_writer(filename, max_bytes=DEFAULT_MAX_BYTES):
+    """Return the writer of an event log file, shared by all the users of
+    the file in the process, so that the file is rotated by one writer only.
+    The writer is created by the first call (with its `max_bytes`); every
+    call must be paired with a `release_writer` call.
+    """
+    filename = os.path.abspath(filename)
+    with _shared_writers_lock:
+        shared = _shared_writers.get(filename)
+        if shared is None:
+            shared = _shared_writers[filename] = [
+                EventLogWriter(filename, max_bytes=max_bytes), 0]
+        shared[1] += 1
+
+        return shared[0]
+
+
+def release_writer(writer):
+    """Release a writer returned by `open_writer`, closing it when it has no
+    more users.
+    """
+    with _shared_writers_lock:
+        shared = _shared_writers.get(writer.filename)
+        if shared is not None and shared[0] is writer:
+            shared[1] -= 1
+            if shared[1] > 0:
+                return
+            del _shared_writers[writer.filename]
+        writer.close()
+
+
+def new_game_id():
+    """Return a game id for the event log records, unique across processes
+    (unlike the ids of game contexts).
+    """
+    return uuid.uuid4().hex
+
+
+class EventLogSink(Sink):
+    """Send the events of one game to an event log writer.
+
+    :param writer: `EventLogWriter`, it may be shared by several games
+    :param game_id: id of the game in the records, see `new_game_id`
+    :param turn: function returning the current turn number
+    """
+    def __init__(self, writer, game_id, turn, types=None,
+                 level=logging.NOTSET):
+        super().__init__(types, level)
+        self.writer = writer
+        self.game_id = game_id
+        self.turn = turn
+        self._sequence = itertools.count(1)
+
+    def handle(self, event, level):
+        self.writer.write((self.game_id, self.turn(), next(self._sequence),
+                           time.time(), level, event))
+
+
+def read_event_log(filename):
+    """Return the list of the records of an event log file."""
+    with open(filename, encoding='utf-8') as log_file:
+        return [json.loads(line) for line in log_file]
+
+
+def _close_open_writers():
+    for writer in list(_open_writers):
+        writer.close()
@@ -1,12 +1,18 @@
-import logging
-
-from collections import OrderedDict
+import random
 
 from .exceptions import GameCrisisException
-from .core import GameEntity
-from .city import City
+from .core import GameEntity, events
+from .core.context import within_context
+from .core.utils import VisitedSet
+from .city import BoardCity, CityMap
+from .board import InfectionBoard
+from .topology import get_topology
 from .deck import PlayerDeck, InfectDeck
 from .disease import Disease
+from .journal import ActionJournal, set_state
+from .config import GameSettings
+from .log import logger
+from .tracing import traced, traced_outbreaks
 
 
 class DeathOutbreakLevelException(GameCrisisException):
@@ -14,39 +20,124 @@ def __str__(self):
         return 'Number of outbreaks reached death level!'
 
 
+def _character_span_args(character):
+    return {'character': character.name}
+
+
 class Game(GameEntity):
-    def __init__(self):
+    def __init__(self, random_state=None):
+        self.rng = random.Random(random_state)
         self.starting_epidemics = None
         self.outbreak_count = 0
         self.game_over = False
         self.game_won = False
-        self.city_map = OrderedDict()
+        self.city_map = {}
+        self.topology = None
+        self.city_ids = {}
+        self.cities = []
+        self.board = None
         self.infection_rate = None
         self.infection_rates = []
         self.epidemic_count = 0
         self.diseases = {}
         self.characters = []
         self.turn_number = None
-        self.outbreak_stack = set()
+        self.outbreak_stack = VisitedSet()
+        self.outbreak_death_level = 8
         self.settings = None
         self.active_character = None
         self.skip_infect_phase = False # for Calm Night AC
+        self.batch_infect_phase = False
+
+    def clone(self, ctx=None):
+        """Return an independent copy of a set up game, e.g. for search or
+        what-if analysis.
+
+        The clone shares the immutable parts with this game: settings, map
+        topology and card objects. Infection levels, labs, hands, deck orders,
+        disease states, counters and the random generator state are copied.
+
+        :param ctx: context for the clone and all its objects. By default the
+            clone gets a new headless context without a controller, so it
+            stays silent. Pass `game._ctx` to make the clone report its
+            signals to the controller of this game.
+        """
+        if ctx is None:
+            ctx = {'headless': True}
 
+        clone = self.shallow_clone(ctx)
+        clone.rng = random.Random(0)
+        clone.rng.setstate(self.rng.getstate())
+        clone.outbreak_stack = self.outbreak_stack.copy()
+        clone.board = self.board.copy()
+
+        clone.cities = BoardCity.for_game(clone)
+        clone.city_map = CityMap(clone.city_ids, clone.cities)
+
+        clone.diseases = {colour: disease.shallow_clone(ctx)
+                          for colour, disease in self.diseases.items()}
+
+        clone.characters = []
+        for character in self.characters:
+            new_character = character.shallow_clone(ctx)
+            new_character.game = clone
+            new_character.hand = character.hand.copy()
+            if character.location is not None:
+                new_character.location = clone.cities[
+                    self.city_ids[character.location.name]]
+            clone.characters.append(new_character)
+
+        for deck_name in ('player_deck', 'infect_deck'):
+            deck = getattr(self, deck_name)
+            new_deck = deck.shallow_clone(ctx)
+            new_deck.cards = deck.cards.copy()
+            new_deck.discard = deck.discard.copy()
+            new_deck.rng = clone.rng
+            setattr(clone, deck_name, new_deck)
+
+        return clone
+
+    def enable_journal(self):
+        """Start keeping the action journal of the game, so the actions
+        recorded from now on can be undone and redone.
+        The journal is shared through the game context.
+        """
+        if self.journal is None:
+            self._ctx['journal'] = ActionJournal()
+        return self.journal
+
+    def undo(self):
+        journal = self.journal
+        return journal is not None and journal.undo()
+
+    def redo(self):
+        journal = self.journal
+        return journal is not None and journal.redo()
+
+    @within_context
     def setup_game(self, settings):
+        """Set up the board and the decks from `config.GameSettings` (or
+        from a `ConfigParser`, which is converted to them).
+        """
+        if not isinstance(settings, GameSettings):
+            settings = GameSettings.from_config(settings)
         self.settings = settings
         self.get_infection_rate()
         self.get_new_diseases()
         self.get_new_city_map()
-        self.player_deck = PlayerDeck()
-        self.infect_deck = InfectDeck()
+        self.player_deck = PlayerDeck(rng=self.rng)
+        self.infect_deck = InfectDeck(rng=self.rng)
         self.get_new_decks()
         self.set_starting_epidemics()
+        self.set_outbreak_death_level()
+        self.set_batch_infect_phase()
 
         self.emit_signal('Game ready to begin.')
         self.emit_signal(
-            f'Difficulty level: {self.starting_epidemics} Epidemics.',
+            'Difficulty level: %s Epidemics.', self.starting_epidemics,
         )
 
+    @within_context
     def start_game(self):
         self.shuffle_decks()
         self.initial_infect_phase()
@@ -54,7 +145,7 @@ def start_game(self):
         self.add_epidemics()
         self.emit_signal('Game started.')
 
-        initial_city = self.settings['Other']['initial_city']
+        initial_city = self.settings.initial_city
         for character in self.characters:
             character.set_location(initial_city)
         self.city_map[initial_city].has_lab = True
@@ -71,14 +162,14 @@ def all_diseases_cured(self):
     def add_epidemics(self):
         self.player_deck.add_epidemics(self.starting_epidemics)
         self.emit_signal(
-            f'Added {self.starting_epidemics} Epidemics to a character deck.',
+            'Added %s Epidemics to a character deck.', self.starting_epidemics,
         )
 
     def add_character(self, new_character):
         new_character.game = self
         self.characters.append(new_character)
         self.emit_signal(
-            f'Added new {new_character}.',
+            'Added new %s.', new_character,
         )
 
     def shuffle_decks(self):
@@ -87,47 +178,75 @@ def shuffle_decks(self):
         self.emit_signal('Decks shuffled.')
 
     # TODO: Extend this method for arbitrary change of levels
+    @traced_outbreaks
     def infect_city(self, city_name, colour):
-        infected_city = self.city_map.get(city_name)
-        self.emit_signal(
-            f'Infecting {infected_city} with {colour} disease.',
-        )
+        outbreaks_before = self.outbreak_count
+        if self.headless:
+            self._infect_city_quietly(self.city_ids[city_name], colour)
+        else:
+            worklist = []
+            self._infect_city_by_id(self.city_ids[city_name], colour,
+                                    worklist)
+            self._run_cascade(worklist, colour)
+
+        metrics = self._ctx.get('metrics')
+        if metrics is not None:
+            metrics.record_infection(self.outbreak_count - outbreaks_before)
+
+    @traced_outbreaks
+    def outbreak(self, city_name, colour):
+        worklist = []
+        self._outbreak_by_id(self.city_ids[city_name], colour, worklist)
+        self._run_cascade(worklist, colour)
+
+    def _run_cascade(self, worklist, colour):
+        """Process queued infections of an outbreak cascade.
+
+        The worklist is used as a stack, so cities are visited in the same
+        depth-first order as a recursive cascade would visit them, but the
+        chain length is not bounded by the interpreter recursion limit.
+        Cities that have already broken out are skipped when popped.
+        """
+        outbreak_stack = self.outbreak_stack
+        while worklist:
+            city_id = worklist.pop()
+            if city_id in outbreak_stack:
+                continue
+            self._infect_city_by_id(city_id, colour, worklist)
 
-        if infected_city.infection_levels[colour] < 3:
+    def _infect_city_by_id(self, city_id, colour, worklist):
+        levels = self.board.levels
+        index = self.board.index(city_id, colour)
+        if levels[index] < 3:
             self.diseases[colour].decrease_resistance(1)
-            infected_city.increase_infection_level(colour)
+            levels[index] += 1
+            journal = self._ctx.get('journal')
+            if journal is not None:
+                journal.record_item(levels, index, levels[index] - 1,
+                                    levels[index])
             self.emit_signal(
-                (f'Infected {infected_city} with {colour} disease (reached '
-                 f'level {infected_city.infection_levels[colour]}).'),
+                events.Infected,
+                self.topology.names[city_id], colour, levels[index],
             )
 
         else:
-            self.emit_signal(
-                (f'{infected_city} has already maximum {colour} disease '
-                 'level. Outbreak is coming!'),
-            )
-            self.outbreak(city_name, colour)
+            self._outbreak_by_id(city_id, colour, worklist)
 
-    def outbreak(self, city_name, colour):
-        outbreak_city = self.city_map.get(city_name)
-        if city_name in self.outbreak_stack:
+    def _outbreak_by_id(self, city_id, colour, worklist):
+        if city_id in self.outbreak_stack:
             return
 
+        self.outbreak_stack.add(city_id)
+        set_state(self, 'outbreak_count', self.outbreak_count + 1)
         self.emit_signal(
-            f'Starting outbreak in {outbreak_city} ({colour} disease).',
-        )
-        self.outbreak_stack.add(city_name)
-        self.outbreak_count += 1
-        self.emit_signal(
-            f'Outbreak level is now {self.outbreak_count}.',
+            events.Outbreak,
+            self.topology.names[city_id], colour, self.outbreak_count,
         )
-        if self.outbreak_count == 8:
+        if self.outbreak_count >= self.outbreak_death_level:
             raise DeathOutbreakLevelException
 
-        for connected_city in outbreak_city.connected_cities:
-            if connected_city in self.outbreak_stack:
-                continue
-            self.infect_city(connected_city.name, colour)
+        # Pushed in reverse so that the first neighbour is popped first.
+        worklist.extend(reversed(self.topology.neighbours_of(city_id)))
 
     def initial_infect_phase(self):
         self.emit_signal('Starting initial infect phase.')
@@ -141,31 +260,112 @@ def initial_infect_phase(self):
             levels_to_add -= 1
         self.emit_signal('Initial infect phase finished.')
 
+    @traced('infect_city_phase', 'phase')
     def infect_city_phase(self):
         self.outbreak_stack.clear()
         if self.skip_infect_phase:
             self.emit_signal(
-                f'Infect phase is passed due to the Quiet Night event.',
+                'Infect phase is passed due to the Quiet Night event.',
             )
-            self.skip_infect_phase = False
+            set_state(self, 'skip_infect_phase', False)
             return
         else:
             self.emit_signal(
-                f'Starting infect phase ({self.infection_rate} cities to infect).',
+                'Starting infect phase (%s cities to infect).',
+                self.infection_rate,
             )
 
+            if self.batch_infect_phase:
+                self.run_batched_infect_phase()
+                return
+
             for i in range(self.infection_rate):
-                self.infect_deck.draw_card(self.active_character)
+                self.infect_deck.draw_card(self)
 
             self.emit_signal('Infect phase finished.')
 
-    def start_turn(self, character):
-        character.action_count = 4
+    def run_batched_infect_phase(self):
+        """Draw all the infect cards of the phase at once and apply them
+        directly to the board, emitting a single summary signal instead of a
+        signal per infection and outbreak.
+        """
+        drawn_cards = self.infect_deck.take_top_cards(self.infection_rate)
+        outbreaks_before = self.outbreak_count
+        metrics = self._ctx.get('metrics')
+
+        for card in drawn_cards:
+            card_outbreaks_before = self.outbreak_count
+            self._infect_city_quietly(self.city_ids[card.name], card.colour)
+            self.outbreak_stack.clear()
+            self.infect_deck.add_discard(card)
+            if metrics is not None:
+                metrics.record_infection(
+                    self.outbreak_count - card_outbreaks_before)
+
+        if self.headless:
+            return
+
+        infected = ', '.join(f'{card.name} ({card.colour})'
+                             for card in drawn_cards)
         self.emit_signal(
-            f'{character} now plays.',
+            ('Infect phase finished: infected %s; %s outbreaks, outbreak '
+             'level is now %s.'),
+            infected, self.outbreak_count - outbreaks_before,
+            self.outbreak_count,
         )
+
+    def _infect_city_quietly(self, city_id, colour):
+        """Infect a city and run the whole outbreak cascade it causes in one
+        pass over the board, without emitting signals.
+        """
+        levels = self.board.levels
+        width = self.board.width
+        colour_id = self.board.colour_ids[colour]
+        disease = self.diseases[colour]
+        offsets = self.topology.offsets
+        neighbours = self.topology.neighbours
+        outbreak_stack = self.outbreak_stack
+        journal = self._ctx.get('journal')
+        worklist = [city_id]
+
+        while worklist:
+            city_id = worklist.pop()
+            if city_id in outbreak_stack:
+                continue
+
+            index = city_id * width + colour_id
+            level = levels[index]
+            if level < 3:
+                disease.decrease_resistance(1)
+                levels[index] = level + 1
+                if journal is not None:
+                    journal.record_item(levels, index, level, level + 1)
+                continue
+
+            outbreak_stack.add(city_id)
+            set_state(self, 'outbreak_count', self.outbreak_count + 1)
+            if self.outbreak_count >= self.outbreak_death_level:
+                raise DeathOutbreakLevelException
+            worklist.extend(
+                reversed(neighbours[offsets[city_id]:offsets[city_id + 1]]))
+
+    def legal_actions(self):
+        """Return the commands the active character can perform now, see
+        `Character.legal_actions`.
+        """
+        for character in self.characters:
+            if character.name == self.active_character:
+                return character.legal_actions()
+        return []
+
+    @traced('start_turn', 'turn', _character_span_args)
+    def start_turn(self, character):
+        set_state(self, 'turn_number', (self.turn_number or 0) + 1)
+        set_state(character, 'action_count', 4)
+        self.emit_signal(events.TurnStarted, character.name)
         # TODO test?
 
+    @traced('end_turn', 'turn', _character_span_args)
     def end_turn(self, character):
         self.emit_signal('No actions left. Now getting cards...')
 
@@ -178,88 +378,88 @@ def end_turn(self, character):
         self.emit_signal('Infect phase gone. Starting new turn.')
         # TODO test ?
 
+    @traced('epidemic_phase', 'phase')
     def epidemic_phase(self):
         self.emit_signal('Starting epidemic phase.')
         self.increment_epidemic_count()
+        metrics = self._ctx.get('metrics')
+        if metrics is not None:
+            metrics.count('epidemics')
 
         drawn_card = self.infect_deck.take_bottom_card()
         self.infect_deck.add_discard(drawn_card)
-        city_epidemic = self.city_map.get(drawn_card.name)
+        city_id = self.city_ids[drawn_card.name]
+        city_epidemic = self.cities[city_id]
         self.emit_signal(
-            f'Starting epidemic in {city_epidemic}.',
+            events.Epidemic, city_epidemic.name, city_epidemic.colour,
         )
         for i in range(3):
             self.infect_city(city_epidemic.name, city_epidemic.colour)
-            if city_epidemic in self.outbreak_stack:
+            if city_id in self.outbreak_stack:
                 break
         self.infect_deck.shuffle_discard_to_top()
         self.emit_signal('Infect discard shuffled and returned to deck.')
         self.emit_signal('Epidemic phase finished.')
 
     def set_starting_epidemics(self):
-        self.starting_epidemics = self.settings['Other'].getint('epidemics')
-        logging.debug(
-            f'Set difficulty level to {self.starting_epidemics}.')
+        self.starting_epidemics = self.settings.epidemics
+        logger.debug(
+            'Set difficulty level to %s.', self.starting_epidemics)
+
+    def set_outbreak_death_level(self):
+        if self.settings.outbreak_death_level is not None:
+            self.outbreak_death_level = self.settings.outbreak_death_level
+
+    def set_batch_infect_phase(self):
+        self.batch_infect_phase = self.settings.batch_infect_phase
 
     def get_new_city_map(self):
         self.create_cities()
-        self.connect_cities()
-        logging.debug('Created city graph.')
+        logger.debug('Created city graph.')
 
     def get_new_decks(self):
         # TODO: does not read card set settings yet
         self.player_deck.prepare(self.city_map.values())
         self.infect_deck.prepare(self.city_map.values())
-        logging.debug('Decks prepared.')
+        logger.debug('Decks prepared.')
 
     def get_new_diseases(self):
-        diseases_section = self.settings['Diseases']
-        max_resistance = self.settings['Other'].getint('max_resistance')
-
-        for disease_id in diseases_section:
-            disease_colour = diseases_section[disease_id]
+        max_resistance = self.settings.max_resistance
+        for disease_colour in self.settings.diseases:
             self.diseases[disease_colour] = \
                 Disease(disease_colour, max_resistance)
 
     def create_cities(self):
-        cities_section = self.settings['Cities']
-        city_colours_section = self.settings['City Colours']
+        """Set up the cities on the map topology shared by all the games
+        with the same map. The game keeps only the state of the cities:
+        the board with their infection levels and laboratories, and a small
+        `BoardCity` view per city.
+        """
+        self.topology = get_topology(self.settings)
+        self.city_ids = self.topology.ids
         disease_colours = list(self.diseases.keys())
+        self.board = InfectionBoard(len(self.topology), disease_colours)
+        self.cities = BoardCity.for_game(self)
+        self.city_map = CityMap(self.city_ids, self.cities)
 
-        for city_id in cities_section:
-            city_name = cities_section[city_id]
-            city_colour = city_colours_section[city_id]
-            new_city = City(city_name, city_colour)
-            new_city.init_colours(disease_colours)
-            self.city_map[city_name] = new_city
-
-    def connect_cities(self):
-        cities_section = self.settings['Cities']
-        connections = self.settings['Connections']
-
-        for city_name, city in self.city_map.items():
-            city_connections = connections.get(city_name).split()
-            for id_ in city_connections:
-                added_city_name = cities_section.get('city' + id_)
-                city.add_connection(self.city_map[added_city_name])
+        self.outbreak_stack.resize(len(self.cities))
 
     def get_infection_rate(self):
-        self.infection_rates = self.settings['Other'].get('rate')
-        self.infection_rate = int(self.infection_rates[0])
+        self.infection_rates = self.settings.infection_rates
+        self.infection_rate = self.infection_rates[0]
 
     def increment_epidemic_count(self):
-        self.epidemic_count += 1
-        self.infection_rate = int(self.infection_rates[self.epidemic_count])
-        self.emit_signal(
-            f'Infection rate incremented (now {self.infection_rate}).',
-        )
+        set_state(self, 'epidemic_count', self.epidemic_count + 1)
+        set_state(self, 'infection_rate',
+                  self.infection_rates[self.epidemic_count])
+        self.emit_signal(events.InfectionRateChanged, self.infection_rate)
 
     def draw_initial_hands(self):
         num_cards_by_characters = {4: 2, 3: 3, 2: 4}
         num_characters = len(self.characters)
         cards_to_draw = num_cards_by_characters[num_characters]
         self.emit_signal(
-            f'Draw initial character cards ({cards_to_draw} per character).',
+            'Draw initial character cards (%s per character).', cards_to_draw,
         )
 
         for character in self.characters:
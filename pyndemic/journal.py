@@ -0,0 +1,205 @@
+from contextlib import contextmanager
+
+
+class AttributeChange:
+    __slots__ = ('obj', 'name', 'old', 'new')
+
+    def __init__(self, obj, name, old, new):
+        self.obj = obj
+        self.name = name
+        self.old = old
+        self.new = new
+
+    def undo(self):
+        setattr(self.obj, self.name, self.old)
+
+    def redo(self):
+        setattr(self.obj, self.name, self.new)
+
+
+class ItemChange:
+    """Change of a single item of a mutable mapping or sequence, e.g. of an
+    infection level on the board.
+    """
+    __slots__ = ('container', 'key', 'old', 'new')
+
+    def __init__(self, container, key, old, new):
+        self.container = container
+        self.key = key
+        self.old = old
+        self.new = new
+
+    def undo(self):
+        self.container[self.key] = self.old
+
+    def redo(self):
+        self.container[self.key] = self.new
+
+
+class InsertChange:
+    """Insertion of an item into a list or a deque, e.g. of a card into
+    a hand or a deck.
+    """
+    __slots__ = ('sequence', 'index', 'item')
+
+    def __init__(self, sequence, index, item):
+        self.sequence = sequence
+        self.index = index
+        self.item = item
+
+    def undo(self):
+        del self.sequence[self.index]
+
+    def redo(self):
+        self.sequence.insert(self.index, self.item)
+
+
+class RemoveChange(InsertChange):
+    """Removal of an item from a list or a deque."""
+    __slots__ = ()
+
+    def undo(self):
+        self.sequence.insert(self.index, self.item)
+
+    def redo(self):
+        del self.sequence[self.index]
+
+
+class RandomStateChange:
+    __slots__ = ('rng', 'old', 'new')
+
+    def __init__(self, rng, old, new):
+        self.rng = rng
+        self.old = old
+        self.new = new
+
+    def undo(self):
+        self.rng.setstate(self.old)
+
+    def redo(self):
+        self.rng.setstate(self.new)
+
+
+def set_state(obj, name, value):
+    """Set an attribute of a game object that is a part of the game state,
+    recording the change in the action journal of the game.
+    """
+    journal = obj.journal
+    if journal is not None:
+        journal.record_attribute(obj, name, getattr(obj, name), value)
+    setattr(obj, name, value)
+
+
+class ActionJournal:
+    """History of game actions kept as lists of state deltas.
+
+    While an action is recorded, every mutation of the game state appends
+    a small change record with the old and the new value, so the action can
+    be undone and redone without copying the game. Mutations done outside
+    of actions (e.g. game setup) are not recorded.
+    The journal is found by the game objects in their context, see
+    `GameEntity.journal`.
+    """
+    def __init__(self):
+        self.done = []
+        self.undone = []
+        self._changes = None
+        self._random_states = None
+        self._depth = 0
+
+    @property
+    def recording(self):
+        return self._changes is not None
+
+    def begin(self):
+        """Start recording an action. Actions started while another action
+        is recorded become part of it.
+        """
+        self._depth += 1
+        if self._depth == 1:
+            self._changes = []
+            self._random_states = {}
+
+    def commit(self):
+        self._depth -= 1
+        if self._depth:
+            return
+
+        changes = self._changes
+        for rng, old_state in self._random_states.values():
+            changes.append(RandomStateChange(rng, old_state, rng.getstate()))
+        self._changes = None
+        self._random_states = None
+
+        if changes:
+            self.done.append(changes)
+            self.undone.clear()
+
+    @contextmanager
+    def action(self):
+        """Record everything done in the `with` block as a single action.
+        The action is kept even if the block raises, as the game state has
+        been changed anyway.
+        """
+        self.begin()
+        try:
+            yield self
+        finally:
+            self.commit()
+
+    def record_attribute(self, obj, name, old, new):
+        if self._changes is not None:
+            self._changes.append(AttributeChange(obj, name, old, new))
+
+    def record_item(self, container, key, old, new):
+        if self._changes is not None:
+            self._changes.append(ItemChange(container, key, old, new))
+
+    def record_insert(self, sequence, index, item):
+        if self._changes is not None:
+            self._changes.append(InsertChange(sequence, index, item))
+
+    def record_remove(self, sequence, index, item):
+        if self._changes is not None:
+            self._changes.append(RemoveChange(sequence, index, item))
+
+    def record_random_state(self, rng):
+        """Remember the state of a random generator before it is used for
+        the first time in the current action.
+        """
+        if self._changes is not None and id(rng) not in self._random_states:
+            self._random_states[id(rng)] = (rng, rng.getstate())
+
+    def can_undo(self):
+        return not self.recording and bool(self.done)
+
+    def can_redo(self):
+        return not self.recording and bool(self.undone)
+
+    def undo(self):
+        """Revert the last recorded action.
+        Return False if there is nothing to undo.
+        """
+        if not self.can_undo():
+            return False
+
+        changes = self.done.pop()
+        for change in reversed(changes):
+            change.undo()
+        self.undone.append(changes)
+
+        return True
+
+    def redo(self):
+        """Repeat the last undone action.
+        Return False if there is nothing to redo.
+        """
+        if not self.can_redo():
+            return False
+
+        changes = self.undone.pop()
+        for change in changes:
+            change.redo()
+        self.done.append(changes)
+
+        return True
@@ -1,8 +1,8 @@
-import sys
 import os
+import atexit
+import queue
 import logging
-from logging import StreamHandler, Formatter
-from logging.handlers import RotatingFileHandler
+from logging import Formatter
 
 from . import config
 
@@ -11,24 +11,89 @@
 LOG_FILENAME = os.path.join(LOG_DIR, 'game.log')
 
 
-logger = logging.getLogger('PYNDEMIC')
-logger.setLevel('DEBUG')
+class GameLogger(logging.Logger):
+    """Logger of the game. The game log format does not show where the
+    records come from, so the logger skips looking up the caller (and does
+    not collect stack information).
+    """
+    def findCaller(self, stack_info=False, stacklevel=1):
+        return '(unknown file)', 0, '(unknown function)', None
+
+
+_logger_class = logging.getLoggerClass()
+logging.setLoggerClass(GameLogger)
+try:
+    logger = logging.getLogger('PYNDEMIC')
+finally:
+    logging.setLoggerClass(_logger_class)
+
+# Keeps the module-level logging functions from adding a console handler
+# when the file log is off.
+logger.addHandler(logging.NullHandler())
 formatter = Formatter('%(name)s %(levelname)s: %(message)s')
 
+_writer = None
+_queue_handler = None
+_configured = False
 
-settings = config.get_settings()
-file_log_enabled = settings['Log'].getboolean('enable_log')
 
+def start_file_log(filename=LOG_FILENAME, level='DEBUG'):
+    """Write the game log to a rotating file from a background thread.
+    The records are passed to the thread through a queue and the queue is
+    flushed on interpreter exit, see `stop_file_log`.
+    """
+    from .log_writer import DeferredQueueHandler, BatchFileHandler, LogWriter
 
-if file_log_enabled:
-    os.makedirs(LOG_DIR, exist_ok=True)
-    file_handler = RotatingFileHandler(LOG_FILENAME, backupCount=4, delay=True)
+    global _writer, _queue_handler
+    stop_file_log()
+
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    file_handler = BatchFileHandler(filename, backupCount=4, delay=True)
     file_handler.setFormatter(formatter)
-    file_handler.setLevel('DEBUG')
-    if os.path.exists(LOG_FILENAME):
+    file_handler.setLevel(level)
+    if os.path.exists(filename):
         file_handler.doRollover()
 
-    logger.addHandler(file_handler)
+    log_queue = queue.SimpleQueue()
+    _queue_handler = DeferredQueueHandler(log_queue)
+    _writer = LogWriter(log_queue, file_handler)
+    _writer.start()
+    logger.addHandler(_queue_handler)
+
+    atexit.unregister(stop_file_log)
+    atexit.register(stop_file_log)
+
+
+def stop_file_log():
+    """Write all the queued records, stop the writer thread and close the
+    log file.
+    """
+    global _writer, _queue_handler
+    if _writer is None:
+        return
+
+    logger.removeHandler(_queue_handler)
+    _writer.stop()
+    _writer.handler.close()
+    _writer = None
+    _queue_handler = None
+
+
+def setup_logging(settings=None):
+    """Configure the game log from the [Log] settings section and start
+    the file log if it is enabled.
+    Importing the package does not touch logging nor the disk: this is done
+    by the first game controller, and the later calls do nothing. Call it
+    before creating controllers to configure the log explicitly.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
 
+    if settings is None:
+        settings = config.get_settings()
 
-logging.root = logger
+    logger.setLevel(settings.log_level)
+    if settings.log_enabled:
+        start_file_log(level=logger.level)
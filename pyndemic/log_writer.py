@@ -0,0 +1,65 @@
+"""Background writing of the game log file, see `log.start_file_log`.
+Kept apart from `log` because `logging.handlers` is slow to import and
+only needed once the file log is started.
+"""
+import queue
+import threading
+from logging.handlers import RotatingFileHandler, QueueHandler
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting of the records to the writer
+    thread, so logging costs the game thread only the record creation.
+    The logged arguments must not change after the call, which holds for
+    game events and for the names and numbers logged by game objects.
+    Records with exception info are still formatted at once.
+    """
+    def prepare(self, record):
+        if record.exc_info:
+            return super().prepare(record)
+        return record
+
+
+class BatchFileHandler(RotatingFileHandler):
+    """Rotating file handler that is flushed by the writer thread after
+    every batch of records instead of after every record.
+    """
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        super().flush()
+
+
+class LogWriter(threading.Thread):
+    """Background thread that writes the queued records to a file handler.
+    It takes all the records waiting in the queue at once and flushes the
+    file after each such batch.
+    """
+    _STOP = object()
+
+    def __init__(self, log_queue, handler):
+        super().__init__(name='pyndemic-log-writer', daemon=True)
+        self.queue = log_queue
+        self.handler = handler
+
+    def run(self):
+        log_queue = self.queue
+        handler = self.handler
+        while True:
+            record = log_queue.get()
+            while record is not self._STOP:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+                try:
+                    record = log_queue.get_nowait()
+                except queue.Empty:
+                    break
+            handler.flush_batch()
+            if record is self._STOP:
+                return
+
+    def stop(self):
+        """Write all the queued records and wait for the thread to end."""
+        self.queue.put(self._STOP)
+        self.join()
@@ -0,0 +1,179 @@
+"""Compact map files, an alternative to the map sections of `settings.cfg`.
+
+A JSON map file keeps the cities in parallel lists indexed by city id:
+
+    {
+        "version": 1,
+        "colours": ["Blue", "Yellow"],
+        "names": ["Atlanta", "Miami", ...],
+        "city_colours": [0, 1, ...],
+        "connections": [[1, 5, 6], [0, 4, 22], ...]
+    }
+
+`colours` lists the colour names, `city_colours` gives the colour index of
+every city and `connections` the ids of the neighbours of every city, in
+the order outbreaks spread to them. Files with the ".board" extension are
+read in the binary format of the board cache instead (see
+`Topology.to_bytes`).
+"""
+import os
+import json
+from itertools import accumulate, chain
+
+from .topology import Topology
+
+
+FORMAT_VERSION = 1
+
+_LOADED_MAPS = {}
+
+
+class MapFormatError(ValueError):
+    pass
+
+
+def topology_from_dict(data):
+    """Build a topology from the data of a JSON map file, checking in one
+    pass that every connection is listed once for each of its cities. Raise
+    MapFormatError if the map is invalid.
+    """
+    try:
+        if data['version'] != FORMAT_VERSION:
+            raise MapFormatError(
+                f'Unsupported map format version {data["version"]}.')
+        colours = data['colours']
+        names = data['names']
+        city_colours = data['city_colours']
+        connections = data['connections']
+    except (KeyError, TypeError) as e:
+        raise MapFormatError(f'Missing map data: {e}.') from None
+
+    for key, value in (('colours', colours), ('names', names),
+                       ('city_colours', city_colours),
+                       ('connections', connections)):
+        if not isinstance(value, list):
+            raise MapFormatError(f'The {key} of the map must be a list.')
+    if not all(isinstance(name, str) for name in chain(colours, names)):
+        raise MapFormatError('Colour and city names must be strings.')
+
+    city_count = len(names)
+    if len(city_colours) != city_count or len(connections) != city_count:
+        raise MapFormatError(
+            'The names, city_colours and connections lists must have one '
+            'item per city.')
+    if len(set(names)) != city_count:
+        raise MapFormatError('Duplicate city names.')
+
+    if not all(isinstance(colour_id, int) and
+               not isinstance(colour_id, bool) and
+               0 <= colour_id < len(colours) for colour_id in city_colours):
+        raise MapFormatError('Invalid colour index.')
+    colours_of_cities = [colours[colour_id] for colour_id in city_colours]
+
+    # Cities are visited in the order of ids, so a connection to a city with
+    # a greater id waits in `pending` until that city lists it back.
+    pending = set()
+    for city_id, neighbours in enumerate(connections):
+        if not isinstance(neighbours, list):
+            raise MapFormatError(
+                f'Connections of {names[city_id]} must be a list.')
+        for neighbour_id in neighbours:
+            if not isinstance(neighbour_id, int) or \
+                    isinstance(neighbour_id, bool) or \
+                    not 0 <= neighbour_id < city_count or \
+                    neighbour_id == city_id:
+                raise MapFormatError(
+                    f'Invalid connection of {names[city_id]}: '
+                    f'{neighbour_id!r}.')
+            if neighbour_id > city_id:
+                connection = city_id * city_count + neighbour_id
+                if connection in pending:
+                    raise MapFormatError(
+                        f'Duplicate connection of {names[city_id]} to '
+                        f'{names[neighbour_id]}.')
+                pending.add(connection)
+            else:
+                try:
+                    pending.remove(neighbour_id * city_count + city_id)
+                except KeyError:
+                    raise MapFormatError(
+                        f'{names[city_id]} is connected to '
+                        f'{names[neighbour_id]}, but not once the other way '
+                        'round.') from None
+
+    if pending:
+        city_id, neighbour_id = divmod(min(pending), city_count)
+        raise MapFormatError(
+            f'{names[city_id]} is connected to {names[neighbour_id]}, but '
+            'not the other way round.')
+
+    offsets = accumulate(chain((0,), map(len, connections)))
+    return Topology(names, colours_of_cities, offsets,
+                    chain.from_iterable(connections))
+
+
+def topology_to_dict(topology):
+    colours = list(dict.fromkeys(topology.colours))
+    colour_ids = {colour: i for i, colour in enumerate(colours)}
+
+    return {
+        'version': FORMAT_VERSION,
+        'colours': colours,
+        'names': list(topology.names),
+        'city_colours': [colour_ids[colour] for colour in topology.colours],
+        'connections': [list(topology.neighbours_of(city_id))
+                        for city_id in range(len(topology))],
+    }
+
+
+def load_map(filename):
+    """Return the topology of a JSON or ".board" map file."""
+    if filename.endswith('.board'):
+        with open(filename, 'rb') as map_file:
+            try:
+                return Topology.from_bytes(map_file.read())
+            except ValueError as e:
+                raise MapFormatError(
+                    f'Invalid board map file {filename}: {e}') from None
+
+    with open(filename, encoding='utf-8') as map_file:
+        try:
+            data = json.load(map_file)
+        except ValueError as e:
+            raise MapFormatError(f'Invalid JSON map file: {e}.') from None
+
+    return topology_from_dict(data)
+
+
+def dump_map(topology, filename):
+    """Write the topology to a JSON or ".board" map file, e.g. to convert
+    the map of a settings file.
+    """
+    if filename.endswith('.board'):
+        with open(filename, 'wb') as map_file:
+            map_file.write(topology.to_bytes())
+        return
+
+    with open(filename, 'w', encoding='utf-8') as map_file:
+        json.dump(topology_to_dict(topology), map_file,
+                  separators=(',', ':'))
+
+
+def get_map_topology(filename, diseases):
+    """Return the topology of a map file, loading it once per process as long
+    as the file does not change. Raise MapFormatError if some city colours
+    are not among `diseases`.
+    """
+    status = os.stat(filename)
+    key = (os.path.abspath(filename), status.st_mtime_ns, status.st_size)
+    topology = _LOADED_MAPS.get(key)
+    if topology is None:
+        topology = load_map(filename)
+        unknown = set(topology.colours).difference(diseases)
+        if unknown:
+            raise MapFormatError(
+                f'Colours of {filename} missing in the [Diseases] settings: '
+                f'{", ".join(sorted(unknown))}.')
+        _LOADED_MAPS[key] = topology
+
+    return topology
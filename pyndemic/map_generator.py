@@ -0,0 +1,131 @@
+"""Synthetic maps of any size, e.g. for stress tests and benchmarks.
+
+Cities are laid out on a square grid; every city is connected to its
+horizontal and vertical neighbours, and some grid cells get one of their
+diagonals, so the graph stays planar and connected with 4 to 6 connections
+per city on average, like the stock map. The disease colours split the grid
+into vertical stripes of columns.
+
+Maps are generated in the `settings.cfg` format and can be saved with
+`ConfigParser.write`, or from the command line, also as JSON or ".board" map
+files (see `map_format`):
+
+    python3 -m pyndemic.map_generator 1000 --colours 6 -o big_map.cfg
+    python3 -m pyndemic.map_generator 100000 -o big_map.json
+"""
+import argparse
+import math
+import random
+from configparser import ConfigParser
+
+from . import config
+from .map_format import dump_map
+from .topology import Topology
+
+
+STOCK_COLOURS = ('Blue', 'Red', 'Yellow', 'Black')
+
+
+def colour_names(colour_count):
+    """Return the disease colour names of a map with so many colours."""
+    names = list(STOCK_COLOURS[:colour_count])
+    names.extend(f'Colour{i + 1}'
+                 for i in range(len(names), colour_count))
+    return names
+
+
+def generate_map(city_count, colour_count=4, seed=None, base_settings=None):
+    """Return a `ConfigParser` with a random map of `city_count` cities and
+    `colour_count` disease colours.
+
+    :param seed: random state of the diagonal connections
+    :param base_settings: `ConfigParser` to take the [Log] and [Other]
+        sections from, the stock settings file by default
+    """
+    if city_count < 1:
+        raise ValueError('A map needs at least one city.')
+    side = math.ceil(math.sqrt(city_count))
+    if not 1 <= colour_count <= side:
+        raise ValueError(
+            f'A map of {city_count} cities can have from 1 to {side} '
+            'colours.')
+
+    rng = random.Random(seed)
+    neighbours = [[] for _ in range(city_count)]
+
+    def connect(city_id, other_id):
+        neighbours[city_id].append(other_id)
+        neighbours[other_id].append(city_id)
+
+    for city_id in range(city_count):
+        column = city_id % side
+        right = city_id + 1 if column + 1 < side else None
+        below = city_id + side
+        if right is not None and right < city_count:
+            connect(city_id, right)
+        if below < city_count:
+            connect(city_id, below)
+        if right is None or below + 1 >= city_count or rng.random() < 0.5:
+            continue
+        if rng.random() < 0.5:
+            connect(city_id, below + 1)
+        else:
+            connect(right, below)
+
+    colours = colour_names(colour_count)
+    names = [f'City{city_id}' for city_id in range(city_count)]
+    settings = ConfigParser()
+    settings['Cities'] = {f'city{city_id}': name
+                          for city_id, name in enumerate(names)}
+    settings['City Colours'] = {
+        f'city{city_id}': colours[city_id % side * colour_count // side]
+        for city_id in range(city_count)}
+    settings['Connections'] = {
+        name: ' '.join(map(str, sorted(neighbours[city_id])))
+        for city_id, name in enumerate(names)}
+    settings['Diseases'] = {f'disease{i + 1}': colour
+                            for i, colour in enumerate(colours)}
+
+    if base_settings is None:
+        base_settings = config.read_config()
+    for section in ('Log', 'Other'):
+        if base_settings.has_section(section):
+            settings[section] = base_settings[section]
+    if not settings.has_section('Other'):
+        settings['Other'] = {}
+    settings['Other']['initial_city'] = names[0]
+
+    return settings
+
+
+def generate_settings(city_count, colour_count=4, seed=None):
+    """Return `config.GameSettings` with a random map, see `generate_map`."""
+    return config.GameSettings.from_config(
+        generate_map(city_count, colour_count, seed))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='Generate a random map settings file.')
+    parser.add_argument('cities', type=int, help='number of cities')
+    parser.add_argument('--colours', type=int, default=4,
+                        help='number of disease colours')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('-o', '--output', required=True,
+                        help=('settings file to write, or a map file if it '
+                              'has the ".json" or ".board" extension'))
+    options = parser.parse_args(args)
+
+    settings = generate_map(options.cities, options.colours, options.seed)
+    if options.output.endswith(('.json', '.board')):
+        topology = Topology.from_settings(
+            config.GameSettings.from_config(settings))
+        dump_map(topology, options.output)
+        return
+
+    with open(options.output, 'w', encoding='utf-8') as settings_file:
+        settings.write(settings_file)
+
+
+if __name__ == '__main__':
+    main()
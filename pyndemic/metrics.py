@@ -0,0 +1,89 @@
+"""Runtime metrics of a game: counters and histograms.
+
+The controller keeps a `Metrics` object in the game context, where the game
+records its own figures (infections, outbreak chains, epidemics); the
+controller adds command and formatter durations, in microseconds.
+The metrics are returned by the "stats" request, see `core.api`.
+"""
+import math
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+
+class Histogram:
+    """Summary of observed values with power of two buckets: the bucket
+    `n` counts the values greater than `n / 2` and not greater than `n`,
+    the bucket 1 counts all the values up to 1 and the bucket 0 counts zeros
+    and negative values.
+    """
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.buckets = Counter()
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if value > 0:
+            self.buckets[1 << (math.ceil(value) - 1).bit_length()] += 1
+        else:
+            self.buckets[0] += 1
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'buckets': dict(sorted(self.buckets.items())),
+        }
+
+
+class Metrics:
+    """Named counters and histograms of one game."""
+    def __init__(self):
+        self.counters = Counter()
+        self.histograms = {}
+
+    def count(self, name, value=1):
+        self.counters[name] += value
+
+    def observe(self, name, value):
+        try:
+            histogram = self.histograms[name]
+        except KeyError:
+            histogram = self.histograms[name] = Histogram()
+        histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name):
+        """Observe the duration of the block in microseconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - start) * 1e6)
+
+    def record_infection(self, outbreaks):
+        """Count an infection and the outbreaks of the cascade it caused."""
+        self.counters['infect_calls'] += 1
+        if outbreaks:
+            self.counters['outbreak_chains'] += 1
+            self.observe('outbreak_chain_length', outbreaks)
+
+    def to_dict(self):
+        return {
+            'counters': dict(self.counters),
+            'histograms': {name: histogram.to_dict() for name, histogram
+                           in sorted(self.histograms.items())},
+        }
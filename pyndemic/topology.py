@@ -0,0 +1,315 @@
+import os
+import hashlib
+import contextlib
+import marshal
+import operator
+import tempfile
+from array import array
+from collections import deque
+from types import MappingProxyType
+
+from .config import SettingsSection, section_digest
+from .log import logger
+
+
+FORMAT_VERSION = 1
+MAX_DISTANCE_TABLE_CITIES = 1024
+UNREACHABLE = 255
+MAP_SECTIONS = ('Cities', 'City Colours', 'Connections')
+
+_COMPILED_TOPOLOGIES = {}
+
+
+class Topology:
+    """Immutable city graph compiled from game settings.
+
+    Cities are numbered in the order of the [Cities] settings section.
+    The graph is kept in compressed sparse row form: the neighbours of the
+    city `i` are `neighbours[offsets[i]:offsets[i + 1]]`.
+
+    :param names: tuple of city names, indexed by city id
+    :param colours: tuple of city colours, indexed by city id
+    :param offsets: tuple of ints, len(names) + 1 items
+    :param neighbours: tuple of neighbour city ids
+    """
+    __slots__ = ('names', 'colours', 'ids', 'offsets', 'neighbours',
+                 '_distances')
+
+    def __init__(self, names, colours, offsets, neighbours):
+        self.names = tuple(names)
+        self.colours = tuple(colours)
+        self.ids = MappingProxyType(
+            {name: city_id for city_id, name in enumerate(self.names)})
+        self.offsets = tuple(offsets)
+        self.neighbours = tuple(neighbours)
+        self._distances = None
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_settings(cls, settings):
+        cities_section = settings['Cities']
+        city_colours_section = settings['City Colours']
+        connections = settings['Connections']
+
+        setting_ids = {}
+        names = []
+        colours = []
+        for setting_id in cities_section:
+            setting_ids[setting_id] = len(names)
+            names.append(cities_section[setting_id])
+            colours.append(city_colours_section[setting_id])
+
+        offsets = [0]
+        neighbours = []
+        for name in names:
+            for id_ in connections.get(name).split():
+                neighbours.append(setting_ids['city' + id_])
+            offsets.append(len(neighbours))
+
+        return cls(names, colours, offsets, neighbours)
+
+    def to_bytes(self):
+        """Return the compiled topology in the board cache format: city
+        colours are stored as ids, the graph as packed integer arrays and,
+        for maps of at most `MAX_DISTANCE_TABLE_CITIES` cities, with the
+        table of distances between all cities.
+        """
+        colours = tuple(dict.fromkeys(self.colours))
+        colour_ids = {colour: i for i, colour in enumerate(colours)}
+        distances = None
+        if len(self) <= MAX_DISTANCE_TABLE_CITIES:
+            distances = self.distance_table()
+
+        return marshal.dumps({
+            'version': FORMAT_VERSION,
+            'names': self.names,
+            'colours': colours,
+            'colour_ids': array(
+                'H', [colour_ids[colour] for colour in self.colours]
+            ).tobytes(),
+            'offsets': array('i', self.offsets).tobytes(),
+            'neighbours': array('i', self.neighbours).tobytes(),
+            'distances': distances,
+        })
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Load a topology compiled by `to_bytes`. Raise ValueError if the
+        data is not a compiled topology of the current format.
+        """
+        try:
+            compiled = marshal.loads(data)
+            if compiled['version'] != FORMAT_VERSION:
+                raise ValueError(
+                    f'Unsupported board format {compiled["version"]}.')
+
+            colours = compiled['colours']
+            colour_ids = array('H')
+            colour_ids.frombytes(compiled['colour_ids'])
+            offsets = array('i')
+            offsets.frombytes(compiled['offsets'])
+            neighbours = array('i')
+            neighbours.frombytes(compiled['neighbours'])
+            topology = cls(compiled['names'],
+                           [colours[i] for i in colour_ids],
+                           offsets, neighbours)
+        except (EOFError, TypeError, KeyError, IndexError) as e:
+            raise ValueError('Damaged compiled board.') from e
+
+        if not topology.is_consistent():
+            raise ValueError('Damaged compiled board.')
+        distances = compiled['distances']
+        if distances is not None and len(distances) != len(topology) ** 2:
+            raise ValueError('Damaged compiled board.')
+        topology._distances = distances
+
+        return topology
+
+    def is_consistent(self):
+        """Return True if the topology arrays fit together: a colour per
+        city, unique city names, increasing offsets and neighbour ids of
+        existing cities.
+        """
+        city_count = len(self.names)
+        offsets = self.offsets
+        neighbours = self.neighbours
+        if len(self.colours) != city_count or \
+                len(self.ids) != city_count or \
+                len(offsets) != city_count + 1 or offsets[0] != 0 or \
+                offsets[-1] != len(neighbours):
+            return False
+        if any(map(operator.gt, offsets, offsets[1:])):
+            return False
+
+        return not neighbours or \
+            (min(neighbours) >= 0 and max(neighbours) < city_count)
+
+    def neighbours_of(self, city_id):
+        return self.neighbours[self.offsets[city_id]:self.offsets[city_id + 1]]
+
+    def degree(self, city_id):
+        return self.offsets[city_id + 1] - self.offsets[city_id]
+
+    def are_connected(self, city_id, other_id):
+        neighbours = self.neighbours
+        for i in range(self.offsets[city_id], self.offsets[city_id + 1]):
+            if neighbours[i] == other_id:
+                return True
+        return False
+
+    def distances_from(self, city_id):
+        """Return a list of move distances from the city to every city.
+        Unreachable cities get -1.
+        """
+        offsets = self.offsets
+        neighbours = self.neighbours
+        distances = [-1] * len(self.names)
+        distances[city_id] = 0
+        queue = deque([city_id])
+
+        while queue:
+            current = queue.popleft()
+            next_distance = distances[current] + 1
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbour = neighbours[i]
+                if distances[neighbour] < 0:
+                    distances[neighbour] = next_distance
+                    queue.append(neighbour)
+
+        return distances
+
+    def distance_table(self):
+        """Return the distances between all cities as bytes: the distance
+        from the city `i` to the city `j` is at `i * len(self) + j`.
+        Unreachable cities (and cities 255 moves away or farther) get
+        `UNREACHABLE`. The table is computed on the first call.
+        """
+        if self._distances is None:
+            table = bytearray()
+            for city_id in range(len(self.names)):
+                table.extend(
+                    distance if 0 <= distance < UNREACHABLE else UNREACHABLE
+                    for distance in self.distances_from(city_id))
+            self._distances = bytes(table)
+
+        return self._distances
+
+    def distance(self, city_id, other_id):
+        """Return the move distance between two cities or -1 if there is
+        no path. The distance table is used if it is available.
+        """
+        if self._distances is not None:
+            distance = self._distances[city_id * len(self.names) + other_id]
+            if distance != UNREACHABLE:
+                return distance
+
+        return self.distances_from(city_id)[other_id]
+
+    def shortest_path(self, city_id, other_id):
+        """Return a list of city ids of a shortest path between two cities
+        (both included) or None if there is no path.
+        """
+        offsets = self.offsets
+        neighbours = self.neighbours
+        previous = [-1] * len(self.names)
+        previous[city_id] = city_id
+        queue = deque([city_id])
+
+        while queue and previous[other_id] < 0:
+            current = queue.popleft()
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbour = neighbours[i]
+                if previous[neighbour] < 0:
+                    previous[neighbour] = current
+                    queue.append(neighbour)
+
+        if previous[other_id] < 0:
+            return None
+
+        path = [other_id]
+        while path[-1] != city_id:
+            path.append(previous[path[-1]])
+        path.reverse()
+
+        return path
+
+
+def _settings_key(settings):
+    key = []
+    for name in MAP_SECTIONS:
+        section = settings[name]
+        if isinstance(section, SettingsSection):
+            key.append(section.digest())
+        else:
+            key.append(section_digest(section))
+
+    return tuple(key)
+
+
+def settings_hash(settings):
+    """Return the hash of the map settings content, the name of the map
+    in the board cache.
+    """
+    content = repr((FORMAT_VERSION, _settings_key(settings)))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def load_compiled(settings, cache_dir):
+    """Return the topology of the settings map from the board cache
+    directory, compiling and storing it there if it is missing or damaged.
+    """
+    filename = os.path.join(cache_dir, f'{settings_hash(settings)}.board')
+    try:
+        with open(filename, 'rb') as board_file:
+            return Topology.from_bytes(board_file.read())
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning('Recompiling board cache file %s: %s', filename, e)
+
+    topology = Topology.from_settings(settings)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        descriptor, temp_filename = tempfile.mkstemp(
+            dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as board_file:
+                board_file.write(topology.to_bytes())
+            os.replace(temp_filename, filename)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_filename)
+            raise
+    except OSError as e:
+        logger.warning('Cannot write board cache file %s: %s', filename, e)
+
+    return topology
+
+
+def get_topology(settings):
+    """Return the compiled topology of the settings map.
+    Topologies are compiled once and shared between all games with the same
+    map settings. If the "board_cache" setting names a directory, compiled
+    topologies are also kept there, so other processes load them with
+    a single read instead of compiling them. If the "map_file" setting is
+    set, the map is read from that file instead of the settings sections,
+    see `map_format`.
+    """
+    map_file = getattr(settings, 'map_file', None)
+    if map_file:
+        from .map_format import get_map_topology
+        return get_map_topology(map_file, settings.diseases)
+
+    key = _settings_key(settings)
+    topology = _COMPILED_TOPOLOGIES.get(key)
+    if topology is None:
+        cache_dir = getattr(settings, 'board_cache', None)
+        if cache_dir:
+            topology = load_compiled(settings, cache_dir)
+        else:
+            topology = Topology.from_settings(settings)
+        _COMPILED_TOPOLOGIES[key] = topology
+
+    return topology
@@ -0,0 +1,136 @@
+"""Optional span tracing of game phases in Chrome trace event format.
+
+Traced games keep a `Tracer` in their context. The phase methods of the
+game classes are decorated with `traced` (or `traced_outbreaks`), which
+records a span only if the context of the object has a tracer, so the games
+that are not traced pay just a dictionary lookup per call.
+The exported file can be opened in chrome://tracing or in Perfetto.
+"""
+import os
+import json
+import time
+import threading
+import functools
+from contextlib import contextmanager
+
+
+class Tracer:
+    """Collection of spans, i.e. complete ("X") trace events."""
+    def __init__(self, name=None):
+        self.name = name
+        self.events = []
+        self._pid = os.getpid()
+        self._tid = threading.get_ident()
+        self._origin = time.perf_counter()
+
+    def now(self):
+        """Return the time since the tracer creation in microseconds."""
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def add_span(self, name, start, end, category='game', args=None):
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': start,
+            'dur': end - start,
+            'pid': self._pid,
+            'tid': self._tid,
+        }
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    @contextmanager
+    def span(self, name, category='game', args=None):
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.add_span(name, start, self.now(), category, args)
+
+    def to_dict(self):
+        events = list(self.events)
+        if self.name is not None:
+            events.insert(0, {
+                'name': 'thread_name', 'ph': 'M', 'pid': self._pid,
+                'tid': self._tid, 'args': {'name': self.name},
+            })
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export(self, filename):
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filename, 'w', encoding='utf-8') as trace_file:
+            json.dump(self.to_dict(), trace_file, default=str)
+
+
+def traced(name, category='game', get_args=None):
+    """Decorate a method of a game object to record a span of every call in
+    the tracer of the object context, if there is one.
+
+    :param name: span name, or a function returning it for the method
+        arguments
+    :param get_args: function returning the dict of the span arguments for
+        the method arguments
+    """
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(self, *args, **kwargs):
+            tracer = self._ctx.get('tracer')
+            if tracer is None:
+                return function(self, *args, **kwargs)
+
+            span_name = name(*args, **kwargs) if callable(name) else name
+            span_args = None
+            if get_args is not None:
+                span_args = get_args(*args, **kwargs)
+            with tracer.span(span_name, category, span_args):
+                return function(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def traced_outbreaks(function):
+    """Decorate an infection method of a game to record a span only if the
+    call starts an outbreak cascade.
+    """
+    @functools.wraps(function)
+    def wrapper(self, city_name, colour):
+        tracer = self._ctx.get('tracer')
+        if tracer is None:
+            return function(self, city_name, colour)
+
+        outbreaks_before = self.outbreak_count
+        start = tracer.now()
+        try:
+            return function(self, city_name, colour)
+        finally:
+            outbreaks = self.outbreak_count - outbreaks_before
+            if outbreaks:
+                tracer.add_span(
+                    'outbreak', start, tracer.now(), 'infection',
+                    {'city': city_name, 'colour': colour,
+                     'outbreaks': outbreaks})
+
+    return wrapper
+
+
+def enable_tracing(ctx, name=None):
+    """Start tracing the game of the context and return its tracer."""
+    tracer = ctx.get('tracer')
+    if tracer is None:
+        tracer = ctx['tracer'] = Tracer(name)
+
+    return tracer
+
+
+def disable_tracing(ctx):
+    """Stop tracing the game of the context and return its tracer, or None
+    if the game was not traced.
+    """
+    return ctx.pop('tracer', None)
@@ -1,5 +1,6 @@
 """Console User Interface for Pyndemic"""
 import sys
+import shlex
 from queue import Queue
 
 from ..core import api
@@ -53,8 +54,8 @@ def process_response(self, response):
         if 'message_list' in response:
             io_response = '\n'.join(response['message_list'])
             self.io.send(io_response)
-        if 'message' in response:
-            io_response = response['message']
+        if 'message' in response or 'events' in response:
+            io_response = api.response_text(response)
             self.io.send(io_response)
 
 
@@ -135,6 +136,19 @@ def _update_share_command(request, input_request):
     }
 
 
+def _update_play_command(request, input_request):
+    # Card names have spaces, so the card and its arguments may be quoted,
+    # e.g. play "Government Grant" London
+    try:
+        card, *card_args = shlex.split(' '.join(input_request[1:]))
+    except ValueError:
+        raise LookupError('No card or unbalanced quotes.') from None
+    request['args'] = {
+        'card': card,
+        'card_args': card_args,
+    }
+
+
 update_command = {
     GameplayCommands.MOVE: _update_move_command,
     GameplayCommands.FLY: _update_move_command,
@@ -144,5 +158,8 @@ def _update_share_command(request, input_request):
     GameplayCommands.TREAT: _update_treat_command,
     GameplayCommands.CURE: _update_cure_command,
     GameplayCommands.SHARE: _update_share_command,
+    GameplayCommands.PLAY: _update_play_command,
     GameplayCommands.PASS: _update_no_args_command,
+    GameplayCommands.UNDO: _update_no_args_command,
+    GameplayCommands.REDO: _update_no_args_command,
 }
@@ -1,6 +1,5 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
-from .test_helpers import construct_mock_context
 
 from pyndemic.action_card import (GovernmentGrantActionCard,
                                   OneQuietNightActionCard)
@@ -8,8 +7,7 @@
 
 class GovernmentGrantActionCardCase(TestCase):
     def setUp(self):
-        self._ctx = construct_mock_context()
-        self.mock_game = self._ctx['controller']().game
+        self.mock_game = MagicMock()
 
     def test_init(self):
         card = GovernmentGrantActionCard()
@@ -20,32 +18,31 @@ def test_check_playable(self):
         card = GovernmentGrantActionCard()
 
         self.mock_game.city_map = {}
-        playable = card.check_playable("London")
+        playable = card.check_playable(self.mock_game, "London")
         self.assertFalse(playable)
 
         self.mock_game.city_map["London"] = MagicMock()
         self.mock_game.city_map["London"].has_lab = True
-        playable = card.check_playable("London")
+        playable = card.check_playable(self.mock_game, "London")
         self.assertFalse(playable)
 
         self.mock_game.city_map["London"] = MagicMock()
         self.mock_game.city_map["London"].has_lab = False
-        playable = card.check_playable("London")
+        playable = card.check_playable(self.mock_game, "London")
         self.assertTrue(playable)
 
     def test_on_play(self):
         card = GovernmentGrantActionCard()
         self.mock_game.city_map = {"London": MagicMock()}
         self.mock_game.city_map["London"].has_lab = False
-        result = card.on_play("London")
+        result = card.on_play(self.mock_game, "London")
         self.assertTrue(result)
         self.mock_game.city_map["London"].build_lab.assert_called()
 
 
 class OneQuietNightActionCardCase(TestCase):
     def setUp(self):
-        self._ctx = construct_mock_context()
-        self.mock_game = self._ctx['controller']().game
+        self.mock_game = MagicMock()
 
     def test_init(self):
         card = OneQuietNightActionCard()
@@ -54,13 +51,13 @@ def test_init(self):
 
     def test_check_playable(self):
         card = OneQuietNightActionCard()
-        playable = card.check_playable()
+        playable = card.check_playable(self.mock_game)
         self.assertTrue(playable)
 
     def test_on_play(self):
         card = OneQuietNightActionCard()
         self.mock_game.skip_infect_phase = False
-        card.on_play()
+        card.on_play(self.mock_game)
         mode = self.mock_game.skip_infect_phase
         self.assertTrue(mode)
 
@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+from pyndemic.board import InfectionBoard
+from pyndemic.city import City
+
+
+class InfectionBoardTestCase(TestCase):
+    def setUp(self):
+        self.board = InfectionBoard(3, ['Blue', 'Red'])
+
+    def test_init(self):
+        self.assertEqual(3, len(self.board))
+        self.assertEqual(('Blue', 'Red'), self.board.colours)
+        self.assertEqual(bytearray(6), self.board.levels)
+
+    def test_get_set_level(self):
+        self.board.set_level(1, 'Red', 2)
+        self.assertEqual(2, self.board.get_level(1, 'Red'))
+        self.assertEqual(2, self.board.levels[3])
+        self.assertEqual(0, self.board.get_level(1, 'Blue'))
+
+    def test_total_level(self):
+        self.board.set_level(0, 'Blue', 3)
+        self.board.set_level(2, 'Blue', 1)
+        self.board.set_level(2, 'Red', 2)
+        self.assertEqual(4, self.board.total_level('Blue'))
+        self.assertEqual(2, self.board.total_level('Red'))
+
+    def test_cities_at_level(self):
+        self.board.set_level(0, 'Blue', 3)
+        self.board.set_level(2, 'Blue', 3)
+        self.assertEqual([0, 2], self.board.cities_at_level('Blue', 3))
+        self.assertEqual([1], self.board.cities_at_level('Blue', 0))
+
+    def test_copy(self):
+        self.board.set_level(0, 'Red', 1)
+        board_copy = self.board.copy()
+        board_copy.set_level(0, 'Red', 2)
+        board_copy.labs[2] = True
+
+        self.assertEqual(1, self.board.get_level(0, 'Red'))
+        self.assertEqual(2, board_copy.get_level(0, 'Red'))
+        self.assertEqual(bytearray(3), self.board.labs)
+        self.assertEqual(1, board_copy.labs[2])
+
+    def test_snapshot_restore(self):
+        self.board.set_level(1, 'Blue', 2)
+        snapshot = self.board.snapshot()
+        self.board.clear()
+        self.assertEqual(0, self.board.get_level(1, 'Blue'))
+
+        self.board.restore(snapshot)
+        self.assertEqual(2, self.board.get_level(1, 'Blue'))
+
+
+class InfectionLevelsTestCase(TestCase):
+    def setUp(self):
+        self.board = InfectionBoard(2, ['Blue', 'Red'])
+        self.city = City('London', 'Blue')
+        self.city.bind_board(self.board, 1)
+
+    def test_view(self):
+        levels = self.city.infection_levels
+        self.assertEqual(['Blue', 'Red'], list(levels))
+        self.assertEqual(2, len(levels))
+        self.assertIn('Red', levels)
+        self.assertNotIn('Black', levels)
+        with self.assertRaises(KeyError):
+            levels['Black']
+
+    def test_writes_go_to_board(self):
+        self.city.increase_infection_level('Red')
+        self.assertEqual(1, self.board.get_level(1, 'Red'))
+
+        self.board.set_level(1, 'Blue', 3)
+        self.assertEqual(3, self.city.nullify_infection_level('Blue'))
+        self.assertEqual(0, self.board.get_level(1, 'Blue'))
+
+    def test_copy(self):
+        self.board.set_level(1, 'Red', 2)
+        levels_copy = self.city.infection_levels.copy()
+        self.assertEqual({'Blue': 0, 'Red': 2}, levels_copy)
+        self.assertEqual(levels_copy, self.city.infection_levels)
@@ -1,10 +1,9 @@
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 from pyndemic.card import (Card, PlayerCard, CityCard, EpidemicCard,
                            ActionCard, InfectCard)
 from pyndemic.character import Character
-from .test_helpers import construct_mock_context
 
 
 class CardTestCase(TestCase):
@@ -30,8 +29,8 @@ class CityCardTestCase(TestCase):
 
 class EpidemicCardTestCase(TestCase):
     def setUp(self):
-        self._ctx = construct_mock_context()
-        self.mock_game = self._ctx['controller']().game
+        self.mock_character = MagicMock()
+        self.mock_game = self.mock_character.game
 
     def test_init(self):
         card = EpidemicCard()
@@ -40,7 +39,7 @@ def test_init(self):
 
     def test_on_draw(self):
         card = EpidemicCard()
-        card.on_draw('Fake character')
+        card.on_draw(self.mock_character)
 
         self.mock_game.epidemic_phase.assert_called()
 
@@ -54,19 +53,18 @@ def test_init(self):
 
 class InfectCardTestCase(TestCase):
     def setUp(self):
-        self._ctx = construct_mock_context()
-        self.mock_game = self._ctx['controller']().game
+        self.mock_game = MagicMock()
 
     @patch.object(InfectCard, 'on_play')
     def test_on_draw(self, mock_method):
         card = InfectCard('London', 'Blue')
-        card.on_draw('Fake character')
+        card.on_draw(self.mock_game)
 
-        mock_method.assert_called_with('Fake character')
+        mock_method.assert_called_with(self.mock_game)
 
     def test_on_play(self):
         card = InfectCard('London', 'Blue')
-        card.on_play('Fake character')
+        card.on_play(self.mock_game)
 
         self.mock_game.infect_city.assert_called_with(card.name, card.colour)
         self.mock_game.outbreak_stack.clear.assert_called()
@@ -457,3 +457,58 @@ def test_play_action_card(self, mock_method):
         self.assertTrue(result)
         self.assertTrue('Quiet Night', self.game.player_deck.discard[-1])
 
+
+    def test_legal_actions(self):
+        self.character.set_location('London')
+        self.other_character.set_location('London')
+        self.character.action_count = 1
+        self.character.hand = [
+            CityCard(name, 'Blue') for name in
+            ['London', 'Oxford', 'Cambridge', 'Brighton', 'Southampton']]
+        self.character.hand.append(OneQuietNightActionCard())
+        self.game.city_map['London'].has_lab = True
+        self.game.city_map['Oxford'].has_lab = True
+        self.game.city_map['Oxford'].infection_levels['Red'] = 1
+        self.game.city_map['London'].infection_levels['Red'] = 2
+
+        actions = self.character.legal_actions()
+        commands = {action['command'] for action in actions}
+        self.assertEqual({'move', 'fly', 'charter', 'shuttle', 'treat',
+                          'cure', 'share', 'play', 'pass'}, commands)
+
+        self.assertIn({'command': 'move', 'args': {'destination': 'Oxford'}},
+                      actions)
+        self.assertIn({'command': 'treat', 'args': {'colour': 'Red'}},
+                      actions)
+        self.assertIn({'command': 'share',
+                       'args': {'card': 'London', 'player': 'Bob'}}, actions)
+        self.assertIn({'command': 'play',
+                       'args': {'card': 'Quiet Night', 'card_args': []}},
+                      actions)
+        shuttles = [action['args']['destination'] for action in actions
+                    if action['command'] == 'shuttle']
+        self.assertEqual(['London', 'Oxford'], shuttles)
+        cures = [action for action in actions if action['command'] == 'cure']
+        self.assertEqual(1, len(cures))
+
+        self.character.action_count = 0
+        self.assertEqual(['play', 'pass'],
+                         [action['command']
+                          for action in self.character.legal_actions()])
+
+    def test_legal_actions_cache(self):
+        self.character.set_location('London')
+        self.character.action_count = 2
+
+        actions = self.character.legal_actions()
+        self.assertIs(actions, self.character.legal_actions())
+
+        self.game.city_map['London'].infection_levels['Blue'] = 1
+        new_actions = self.character.legal_actions()
+        self.assertIsNot(actions, new_actions)
+        self.assertIn({'command': 'treat', 'args': {'colour': 'Blue'}},
+                      new_actions)
+
+        self.character.standard_move('London', 'Oxford')
+        self.assertNotIn({'command': 'treat', 'args': {'colour': 'Blue'}},
+                         self.character.legal_actions())
@@ -1,7 +1,9 @@
 from unittest import TestCase
 
 from pyndemic.exceptions import *
-from pyndemic.city import City
+from pyndemic.city import City, BoardCity
+from pyndemic.game import Game
+from .test_helpers import MockController, activate_context
 
 
 class CityTestCase(TestCase):
@@ -59,3 +61,49 @@ def test_add_connection(self):
         another_city = City('New York', 'Yellow')
         self.city.add_connection(another_city)
         self.assertIn(another_city, self.city.connected_cities)
+
+
+class BoardCityTestCase(TestCase):
+    def setUp(self):
+        controller = MockController()
+        activate_context(self, controller._ctx)
+        self.game = Game()
+        self.game.settings = controller.settings
+        self.game.get_new_diseases()
+        self.game.create_cities()
+        self.city = self.game.city_map['London']
+
+    def test_view(self):
+        self.assertIsInstance(self.city, BoardCity)
+        self.assertEqual(0, self.city.city_id)
+        self.assertEqual('London', self.city.name)
+        self.assertEqual('Blue', self.city.colour)
+        self.assertEqual('City London (Blue)', str(self.city))
+        self.assertIs(self.game._ctx, self.city._ctx)
+        self.assertFalse(hasattr(self.city, '__dict__'))
+
+    def test_views_kept(self):
+        self.assertIs(self.city.infection_levels, self.city.infection_levels)
+        self.assertIs(self.city.connected_cities, self.city.connected_cities)
+        self.assertIn(self.game.city_map['Oxford'], self.city.connected_cities)
+
+    def test_state_on_board(self):
+        self.city.increase_infection_level('Red')
+        self.assertEqual(1, self.game.board.get_level(0, 'Red'))
+
+        self.assertTrue(self.city.build_lab())
+        self.assertEqual(1, self.game.board.labs[0])
+        self.game.board.labs[0] = False
+        self.assertFalse(self.city.has_lab)
+
+    def test_build_lab_undo(self):
+        journal = self.game.enable_journal()
+        with journal.action():
+            self.city.build_lab()
+
+        self.game.undo()
+        self.assertFalse(self.city.has_lab)
+
+    def test_add_connection(self):
+        with self.assertRaises(TypeError):
+            self.city.add_connection(self.game.city_map['Oxford'])
@@ -29,15 +29,53 @@ def test_refresh_settings(self):
     def test_get_settings(self):
         settings = config.get_settings(SETTINGS_LOCATION)
 
-        self.assertIsNotNone(config._CACHED_SETTINGS)
-        self.assertIsNot(config._CACHED_SETTINGS, settings)
-        self.assertEqual(config._CACHED_SETTINGS, settings)
-
-        settings_again = config.get_settings(SETTINGS_LOCATION)
-        self.assertEqual(settings, settings_again)
+        self.assertIsInstance(settings, config.GameSettings)
+        self.assertIs(config._CACHED_SETTINGS, settings)
+        self.assertIs(settings, config.get_settings(SETTINGS_LOCATION))
 
         settings_reloaded = config.get_settings(SETTINGS_LOCATION, refresh=True)
-        self.assertEqual(config._CACHED_SETTINGS, settings_reloaded)
+        self.assertIs(config._CACHED_SETTINGS, settings_reloaded)
         self.assertIsNot(settings_reloaded, settings)
         self.assertEqual(settings['Cities']['city9'],
                          settings_reloaded['Cities']['city9'])
+
+
+class GameSettingsTestCase(TestCase):
+    def setUp(self):
+        self.settings = config.GameSettings.from_config(
+            config.read_config(SETTINGS_LOCATION))
+
+    def test_typed_options(self):
+        self.assertEqual((2, 2, 2, 2, 3, 3, 4), self.settings.infection_rates)
+        self.assertEqual(4, self.settings.epidemics)
+        self.assertEqual('London', self.settings.initial_city)
+        self.assertEqual(('Blue', 'Red', 'Yellow', 'Black'),
+                         self.settings.diseases)
+        self.assertEqual(('Alpha', 'Bravo', 'Charlie', 'Delta'),
+                         self.settings.players)
+        self.assertIsNone(self.settings.random_state)
+        self.assertFalse(self.settings.headless)
+        self.assertEqual(4, self.settings['Other'].getint('epidemics'))
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.settings.epidemics = 5
+        with self.assertRaises(TypeError):
+            self.settings['Other']['epidemics'] = '5'
+
+    def test_replace(self):
+        settings = self.settings.replace(
+            players=['A', 'B'], random_state=42, headless=True, trace=None)
+
+        self.assertEqual(('A', 'B'), settings.players)
+        self.assertEqual(42, settings.random_state)
+        self.assertTrue(settings.headless)
+        self.assertEqual('', settings.trace)
+        self.assertIs(self.settings['Cities'], settings['Cities'])
+        self.assertIsNone(self.settings.random_state)
+
+    def test_invalid_value(self):
+        with self.assertRaises(config.SettingsError):
+            self.settings.replace(epidemics='many')
+        with self.assertRaises(config.SettingsError):
+            self.settings.replace(rate='2,2,3')
@@ -3,12 +3,18 @@
 
 from io import StringIO
 import os.path as op
+import random
+import threading
 
+from pyndemic.config import SettingsError
 from pyndemic.deck import ExhaustedPlayerDeckException
 from pyndemic.character import LastDiseaseCuredException
-from pyndemic.core import api
+from pyndemic.core import api, GameEntity
+from pyndemic.core.events import EventTypes
+from pyndemic.core.sinks import CallbackSink
 from pyndemic.ui.console import ConsoleUI
 from pyndemic.controller import GameController
+from pyndemic.formatter import BaseFormatter
 from pyndemic.core.context import _ContextManager
 
 
@@ -46,6 +52,18 @@ def test_start_game(self, game_class):
         # test that character list is filled
         self.assertEqual(["A", "B"], list(self.controller.character_names))
 
+    def test_start_game_random_state(self):
+        random.seed(0)
+        global_state = random.getstate()
+        self.controller.start_game()
+        self.assertEqual(global_state, random.getstate())
+
+        other_controller = GameController(random_state=42)
+        other_controller.start_game()
+        self.assertEqual(
+            [card.name for card in self.controller.game.player_deck.cards],
+            [card.name for card in other_controller.game.player_deck.cards])
+
     @patch('pyndemic.controller.Game')
     def test_send(self, game_class):
         with patch("pyndemic.controller.GameController.emit_signal") as emit:
@@ -86,7 +104,7 @@ def test_send(self, game_class):
                        'message': 'some text'}
             result = self.controller.send(request)
             self.assertEqual(api.RequestTypes.MESSAGE, result['type'])
-            self.assertEqual("", result['message'])
+            self.assertEqual([], result['events'])
 
     @patch('pyndemic.controller.Game')
     def test_switch_player(self, game_class):
@@ -101,6 +119,218 @@ def test_switch_player(self, game_class):
         self.assertEqual(new_player.name, self.controller.game.active_character)
 
 
+class SinksGameControllerTestCase(TestCase):
+    def test_subscribe(self):
+        GameEntity.signals_enabled = True
+        self.addCleanup(setattr, GameEntity, 'signals_enabled', False)
+        controller = GameController(random_state=42, players=['A', 'B'])
+        controller.sinks.unsubscribe(controller.response_sink)
+        received = []
+        controller.sinks.subscribe(CallbackSink(
+            lambda event, level: received.append(event),
+            types=[EventTypes.INFECTED]))
+
+        controller.start_game()
+
+        self.assertFalse(controller.signals)
+        self.assertEqual(18, len(received))
+        self.assertTrue(all(event.type == EventTypes.INFECTED
+                            for event in received))
+
+    def test_bounded_signal_buffer(self):
+        GameEntity.signals_enabled = True
+        self.addCleanup(setattr, GameEntity, 'signals_enabled', False)
+        controller = GameController(
+            random_state=42, players=['A', 'B'], signal_buffer_size=10,
+            signal_overflow='coalesce')
+
+        controller.start_game()
+        game = controller.game
+        for _ in range(3):
+            game.infect_city_phase()
+
+        self.assertEqual(10, len(controller.signals))
+        self.assertEqual(EventTypes.COALESCED, controller.signals[-1].type)
+        self.assertGreater(controller.response_sink.dropped, 0)
+
+        self.assertEqual(10, len(controller._flush_signals()))
+        self.assertFalse(controller.signals)
+
+    def test_blocking_signal_buffer(self):
+        GameEntity.signals_enabled = True
+        self.addCleanup(setattr, GameEntity, 'signals_enabled', False)
+        controller = GameController(
+            random_state=42, players=['A', 'B'], signal_buffer_size=5,
+            signal_overflow='block', signal_block_timeout=0.001)
+
+        game_thread = threading.Thread(target=controller.start_game,
+                                       daemon=True)
+        game_thread.start()
+        game_thread.join(10)
+
+        self.assertFalse(game_thread.is_alive())
+        self.assertEqual(5, len(controller.signals))
+        self.assertGreater(controller.response_sink.dropped, 0)
+
+    def test_blocking_signal_buffer_needs_timeout(self):
+        controller = GameController(
+            random_state=42, players=['A', 'B'], signal_buffer_size=5,
+            signal_overflow='block')
+
+        with self.assertRaises(SettingsError):
+            controller.start_game()
+
+
+class StatsGameControllerTestCase(TestCase):
+    def test_stats_request(self):
+        GameEntity.signals_enabled = True
+        self.addCleanup(setattr, GameEntity, 'signals_enabled', False)
+        controller = GameController(random_state=42, players=['A', 'B'])
+        pass_request = {'type': api.RequestTypes.COMMAND,
+                        'command': api.GameplayCommands.PASS, 'args': {}}
+        with controller:
+            initial_stats = controller.stats()
+            for _ in range(4):
+                controller.send(pass_request)
+            response = controller.send(api.stats_request())
+
+        self.assertEqual(18, initial_stats['counters']['infect_calls'])
+        self.assertEqual(18, initial_stats['signals']['types']['infected'])
+        self.assertEqual(api.ResponseTypes.STATS, response['type'])
+        stats = response['stats']
+        self.assertEqual(4, stats['histograms']['command.pass']['count'])
+        self.assertEqual(4, stats['histograms']['formatter']['count'])
+        self.assertGreater(stats['counters']['infect_calls'], 18)
+        self.assertEqual(sum(stats['signals']['types'].values()),
+                         stats['signals']['total'])
+
+    def test_unknown_command_metric(self):
+        controller = GameController(random_state=42, players=['A', 'B'])
+        with controller:
+            for command in ('dance', 'sing', None):
+                controller.send({'type': api.RequestTypes.COMMAND,
+                                 'command': command, 'args': {}})
+            controller.send({'type': api.RequestTypes.COMMAND,
+                             'command': 'pass', 'args': {}})
+            histograms = controller.stats()['histograms']
+
+        self.assertEqual(3, histograms['command.unknown']['count'])
+        self.assertEqual(1, histograms['command.pass']['count'])
+        self.assertEqual({'command.unknown', 'command.pass'},
+                         {name for name in histograms
+                          if name.startswith('command.')})
+
+
+class HeadlessGameControllerTestCase(TestCase):
+    def setUp(self):
+        self.controller = GameController(random_state=42, headless=True,
+                                         players=['A', 'B'])
+
+    def tearDown(self):
+        del self.controller
+
+    def test_start_game(self):
+        self.controller.start_game()
+
+        self.assertTrue(self.controller._ctx['headless'])
+        self.assertTrue(self.controller.game.headless)
+        self.assertFalse(self.controller.signals)
+        self.assertEqual(9, len(self.controller.game.infect_deck.discard))
+
+    def test_game_session(self):
+        pass_request = {'type': api.RequestTypes.COMMAND,
+                        'command': 'pass', 'args': {}}
+
+        with self.controller:
+            for _ in range(100):
+                response = self.controller.send(pass_request)
+                if response['type'] == api.ResponseTypes.TERMINATION:
+                    break
+                self.assertEqual([], response['events'])
+            else:
+                self.fail('Game has not finished.')
+
+        self.assertIn('Game lost!', api.response_text(response))
+        self.assertNotIn(self.controller._ctx['id'],
+                         _ContextManager._contexts)
+
+
+class JournalGameControllerTestCase(TestCase):
+    def setUp(self):
+        self.controller = GameController(
+            random_state=42, journal=True, players=['A', 'B'],
+            max_resistance=1000, outbreak_death_level=1000)
+        self.controller.run()
+
+    def tearDown(self):
+        self.controller.stop()
+        del self.controller
+
+    def game_state(self):
+        game = self.controller.game
+        state = BaseFormatter.game_to_dict(game)
+        state['player_deck'] = [card.name for card in game.player_deck.cards]
+        state['infect_deck'] = [card.name for card in game.infect_deck.cards]
+        state['outbreak_count'] = game.outbreak_count
+        state['random_state'] = game.rng.getstate()
+
+        return state
+
+    def send_command(self, command):
+        request = {'type': api.RequestTypes.COMMAND,
+                   'command': command, 'args': {}}
+        return self.controller.send(request)
+
+    def test_undo_redo(self):
+        states = [self.game_state()]
+        for _ in range(12):
+            self.send_command('pass')
+            states.append(self.game_state())
+        self.assertGreater(self.controller.game.epidemic_count, 0)
+
+        for state in reversed(states[:-1]):
+            self.send_command('undo')
+            self.assertEqual(state, self.game_state())
+        self.assertEqual('A', self.controller.current_character.name)
+
+        for state in states[1:]:
+            self.send_command('redo')
+            self.assertEqual(state, self.game_state())
+
+    def test_legal_actions(self):
+        response = self.controller.send({'type': api.RequestTypes.CHECK})
+        actions = response['legal_actions']
+        self.assertIs(actions, self.controller.game.legal_actions())
+
+        state = self.game_state()
+        for action in actions:
+            with self.subTest(action=action):
+                request = dict(action, type=api.RequestTypes.COMMAND)
+                response = self.controller.send(request)
+                self.assertNotIn('cannot', api.response_text(response))
+                self.send_command('undo')
+                self.assertEqual(state, self.game_state())
+
+    def test_new_command_after_undo(self):
+        self.send_command('pass')
+        self.send_command('undo')
+        self.send_command('pass')
+        self.assertEqual('B', self.controller.current_character.name)
+
+        response = self.send_command('redo')
+        self.assertIn('nothing to redo', api.response_text(response))
+        self.send_command('pass')
+        self.assertEqual('A', self.controller.current_character.name)
+
+    def test_revert_command_enum(self):
+        response = self.send_command(api.GameplayCommands.UNDO)
+        self.assertIn('There is nothing to undo.', api.response_text(response))
+
+        self.send_command('pass')
+        response = self.send_command(api.GameplayCommands.UNDO)
+        self.assertIn('Performed undo.', api.response_text(response))
+
+
 # TODO: expand test case, remove the hardcoded exit message
 # TODO: reconstruct after all cards are added
 @skip('Broken by action card integration')
@@ -1,7 +1,9 @@
 import unittest
 from pyndemic.core.api import (RequestTypes, ResponseTypes, GameplayCommands,
                                termination_request, empty_response,
-                               final_response, message_response)
+                               final_response, message_response,
+                               event_response, response_text)
+from pyndemic.core import events
 
 
 class APITestCase(unittest.TestCase):
@@ -28,3 +30,17 @@ def test_message_response(self):
         required_type = ResponseTypes.MESSAGE
         self.assertEqual(response['type'], required_type)
         self.assertEqual(response['message'], message)
+
+    def test_event_response(self):
+        event_list = [events.Passed('Evie'), events.Message('Game lost!', ())]
+        response = event_response(event_list)
+        self.assertEqual(response['type'], ResponseTypes.MESSAGE)
+        self.assertIs(response['events'], event_list)
+        self.assertEqual('Evie: made magic pass.\nGame lost!',
+                         response_text(response))
+
+    def test_response_text(self):
+        response = final_response("see ya", [events.Passed('Evie')])
+        self.assertEqual('see ya\nEvie: made magic pass.',
+                         response_text(response))
+        self.assertEqual("see ya", response_text(final_response("see ya")))
@@ -1,9 +1,12 @@
 from unittest import TestCase
 import gc
+import threading
 
 from pyndemic.core.context import (ContextError, ContextNotFoundError,
                                    register_context, unregister_context,
-                                   get_context, generate_id, search_context,
+                                   discard_context,
+                                   get_context, generate_id, current_context,
+                                   game_context, within_context,
                                    ContextRegistrationMeta, _ContextManager)
 
 
@@ -45,6 +48,12 @@ def test_unregister_context(self):
         with self.assertRaises(ContextNotFoundError):
             unregister_context(42)
 
+    def test_discard_context(self):
+        self.contexts[42] = self.mock_context
+        discard_context(42)
+        self.assertNotIn(42, self.contexts)
+        discard_context(42)
+
     def test_generate_id(self):
         ctx_id_1 = generate_id()
         self.assertIsNotNone(ctx_id_1)
@@ -53,22 +62,64 @@ def test_generate_id(self):
         ctx_id_2 = generate_id()
         self.assertNotEqual(ctx_id_1, ctx_id_2)
 
+    def test_concurrent_registration(self):
+        thread_ids = [[] for _ in range(8)]
+        errors = []
+
+        def register_many(ids):
+            try:
+                for _ in range(500):
+                    context_id = generate_id()
+                    register_context(context_id, self.mock_context)
+                    ids.append(context_id)
+                for context_id in ids[::2]:
+                    unregister_context(context_id)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=register_many, args=(ids,))
+                   for ids in thread_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertFalse(errors)
+        all_ids = [context_id for ids in thread_ids for context_id in ids]
+        self.assertEqual(len(all_ids), len(set(all_ids)))
+        self.assertEqual(len(all_ids) // 2, len(self.contexts))
+
+
+class CurrentContextTestCase(TestCase):
+    mock_context = {'id': 'mock'}
+
+    def test_game_context(self):
+        self.assertIsNone(current_context())
+
+        with game_context(self.mock_context) as ctx:
+            self.assertIs(self.mock_context, ctx)
+
+            # Imitating a call from a free function
+            proxy_caller = (lambda: current_context())
+            self.assertIs(self.mock_context, proxy_caller())
+
+            other_context = {'id': 'other'}
+            with game_context(other_context):
+                self.assertIs(other_context, current_context())
+            self.assertIs(self.mock_context, current_context())
 
-class SearchContextTestCase(TestCase):
-    def test_search_context(self):
-        self._ctx = 'mock_string_instead_of_an_object'
+        self.assertIsNone(current_context())
 
-        # Imitating nested scopes
-        proxy_caller = (lambda: search_context())
+    def test_within_context(self):
+        class MockHolder:
+            _ctx = self.mock_context
 
-        for function in [search_context, proxy_caller]:
-            with self.subTest(function=function):
-                ctx = function()
-                self.assertEqual(self._ctx, ctx)
+            @within_context
+            def method(self):
+                return current_context()
 
-        del self._ctx
-        ctx = search_context()
-        self.assertIsNone(ctx)
+        self.assertIs(self.mock_context, MockHolder().method())
+        self.assertIsNone(current_context())
 
 
 class ContextRegistrationMetaTestCase(TestCase):
@@ -0,0 +1,46 @@
+from unittest import TestCase
+
+from pyndemic.core import events
+
+
+class EventTestCase(TestCase):
+    def test_render(self):
+        event = events.Moved('Evie', 'standard move', 'London', 'Brighton')
+        self.assertEqual(
+            'Evie: Performed standard move from London to Brighton.',
+            str(event))
+
+    def test_to_dict(self):
+        event = events.Infected('London', 'Blue', 2)
+        self.assertEqual(
+            {'type': events.EventTypes.INFECTED, 'city': 'London',
+             'colour': 'Blue', 'level': 2},
+            event.to_dict())
+
+    def test_wrong_number_of_values(self):
+        with self.assertRaises(TypeError):
+            events.Infected('London', 'Blue')
+
+    def test_message_is_rendered_lazily(self):
+        class Rendered:
+            count = 0
+
+            def __str__(self):
+                Rendered.count += 1
+                return 'London'
+
+        event = events.Message('Infected %s.', (Rendered(),))
+        self.assertEqual(0, Rendered.count)
+        self.assertEqual('Infected London.', event.render())
+        self.assertEqual(
+            {'type': events.EventTypes.MESSAGE, 'message': 'Infected London.'},
+            event.to_dict())
+
+    def test_make_event(self):
+        self.assertEqual(events.Message('Game lost!', ()),
+                         events.make_event('Game lost!', ()))
+        self.assertEqual(events.Passed('Evie'),
+                         events.make_event(events.Passed, ('Evie',)))
+
+        event = events.Passed('Evie')
+        self.assertIs(event, events.make_event(event, ()))
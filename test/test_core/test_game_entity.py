@@ -1,9 +1,11 @@
 from unittest import TestCase
 from collections import deque
 import weakref
+import logging
 
-from pyndemic.core.context import ContextError
-from pyndemic.core import api
+from pyndemic.core.context import ContextError, game_context
+from pyndemic.core import events
+from pyndemic.core.sinks import SignalDispatcher, BufferSink
 
 from pyndemic.core.game_entity import GameEntity, GameEntityCreationMeta
 
@@ -17,29 +19,36 @@ class DumbEntity(metaclass=GameEntityCreationMeta):
         self.test_class = DumbEntity
 
     def test_call(self):
-        """Testing that every class created through GameEntityCreationMeta will
-        perform context search for the instance. Here we use TestCase instance
-        as a context holder and caller.
+        """Testing that every instance of a class created through
+        GameEntityCreationMeta gets the active context.
         """
         test_class = self.test_class
-        instance = test_class()
+        with game_context(self._ctx):
+            instance = test_class()
         self.assertTrue(hasattr(instance, '_ctx'))
         self.assertIs(instance._ctx, self._ctx)
 
-        del self._ctx
         instance = test_class()
         self.assertTrue(hasattr(instance, '_ctx'))
         self.assertEqual(instance._ctx, {})
 
+    def test_call_with_explicit_context(self):
+        other_ctx = {'id': 'bar'}
+        with game_context(self._ctx):
+            instance = self.test_class(ctx=other_ctx)
+        self.assertIs(instance._ctx, other_ctx)
+
 
 class GameEntityTestCase(TestCase):
     def construct_controller_mock_class(self):
         """Help method for providing Controller-like class with "signals"
-        attribute.
+        and "sinks" attributes.
         """
         class MockController:
             def __init__(self):
                 self.signals = deque()
+                self.sinks = SignalDispatcher()
+                self.sinks.subscribe(BufferSink(self.signals))
 
         return MockController
 
@@ -50,7 +59,7 @@ def setUp(self):
                      'controller': weakref.ref(self.controller)}
 
     def test_assert_has_context(self):
-        entity = GameEntity()
+        entity = GameEntity(ctx=self._ctx)
         entity.assert_has_context()
 
         del self._ctx
@@ -59,7 +68,7 @@ def test_assert_has_context(self):
             entity.assert_has_context()
 
     def test_emit_signal(self):
-        entity = GameEntity()
+        entity = GameEntity(ctx=self._ctx)
 
         entity.signals_enabled = False
         entity.emit_signal("message")
@@ -68,8 +77,33 @@ def test_emit_signal(self):
         entity.signals_enabled = True
         entity.emit_signal("message")
         received = self.controller.signals.popleft()
-        required = api.message_response("message")
-        self.assertEqual(required, received)
+        self.assertEqual(events.Message("message", ()), received)
+        self.assertEqual("message", received.render())
+
+    def test_emit_signal_with_arguments(self):
+        entity = GameEntity(ctx=self._ctx)
+        entity.signals_enabled = True
+
+        entity.emit_signal('%s drew %s.', 'Bob', 'London')
+        received = self.controller.signals.popleft()
+        self.assertEqual('Bob drew London.', str(received))
+
+        entity.emit_signal(events.DrewCard, 'Bob', 'London')
+        received = self.controller.signals.popleft()
+        self.assertEqual(events.DrewCard('Bob', 'London'), received)
+
+    def test_emit_signal_headless(self):
+        self._ctx['headless'] = True
+        entity = GameEntity(ctx=self._ctx)
+        entity.signals_enabled = True
+        self.assertTrue(entity.headless)
+
+        entity.emit_signal('%s drew %s.', 'Bob', 'London')
+        self.assertFalse(self.controller.signals)
+
+        entity.emit_signal('Game lost!', log_level=logging.WARNING)
+        received = self.controller.signals.popleft()
+        self.assertEqual('Game lost!', str(received))
 
     def test_emit_signal_without_context(self):
         del self._ctx
@@ -0,0 +1,136 @@
+from unittest import TestCase
+from unittest.mock import Mock
+from collections import deque
+from io import StringIO
+import logging
+import threading
+
+from pyndemic.core import events
+from pyndemic.core.events import EventTypes
+from pyndemic.core.sinks import (SignalDispatcher, BufferSink, StreamSink,
+                                 CounterSink, CallbackSink, OverflowPolicies)
+
+
+class SinkTestCase(TestCase):
+    def test_accepts(self):
+        sink = CounterSink(types=[EventTypes.OUTBREAK], level=logging.INFO)
+        self.assertTrue(sink.accepts(EventTypes.OUTBREAK, logging.INFO))
+        self.assertFalse(sink.accepts(EventTypes.OUTBREAK, logging.DEBUG))
+        self.assertFalse(sink.accepts(EventTypes.INFECTED, logging.INFO))
+
+        sink = CounterSink()
+        self.assertTrue(sink.accepts(EventTypes.INFECTED, logging.NOTSET))
+
+    def test_stream_sink(self):
+        stream = StringIO()
+        StreamSink(stream).handle(events.Passed('Evie'), logging.INFO)
+        self.assertEqual('Evie: made magic pass.\n', stream.getvalue())
+
+
+class BufferSinkTestCase(TestCase):
+    def setUp(self):
+        self.buffer = deque()
+
+    def emit(self, sink, count):
+        for i in range(count):
+            sink.handle(events.Infected('London', 'Blue', i), logging.INFO)
+
+    def test_unbounded(self):
+        sink = BufferSink(self.buffer)
+        self.emit(sink, 10)
+        self.assertEqual(10, len(self.buffer))
+        self.assertEqual(0, sink.dropped)
+
+    def test_drop_oldest(self):
+        sink = BufferSink(self.buffer, maxlen=3)
+        self.emit(sink, 10)
+        self.assertEqual([7, 8, 9], [event.level for event in self.buffer])
+        self.assertEqual(7, sink.dropped)
+
+    def test_coalesce(self):
+        sink = BufferSink(self.buffer, maxlen=3,
+                          overflow=OverflowPolicies.COALESCE)
+        self.emit(sink, 10)
+        sink.handle(events.Passed('Evie'), logging.INFO)
+
+        self.assertEqual(3, len(self.buffer))
+        self.assertEqual([0, 1], [event.level for event in list(self.buffer)[:2]])
+        summary = self.buffer[-1]
+        self.assertEqual(EventTypes.COALESCED, summary.type)
+        self.assertEqual({EventTypes.INFECTED: 8, EventTypes.PASSED: 1},
+                         summary.counts)
+        self.assertEqual(9, sink.dropped)
+
+    def test_block(self):
+        sink = BufferSink(self.buffer, maxlen=2,
+                          overflow=OverflowPolicies.BLOCK)
+        self.emit(sink, 2)
+        drained = []
+        emitter = threading.Thread(target=self.emit, args=(sink, 1))
+        emitter.start()
+        emitter.join(0.05)
+        self.assertTrue(emitter.is_alive())
+
+        drained.extend(sink.drain())
+        emitter.join()
+        self.assertEqual(2, len(drained))
+        self.assertEqual(1, len(self.buffer))
+        self.assertEqual(0, sink.dropped)
+
+    def test_block_timeout(self):
+        sink = BufferSink(self.buffer, maxlen=2,
+                          overflow=OverflowPolicies.BLOCK, timeout=0.01)
+        self.emit(sink, 3)
+        self.assertEqual(2, len(self.buffer))
+        self.assertEqual(1, sink.dropped)
+
+
+class SignalDispatcherTestCase(TestCase):
+    def setUp(self):
+        self.dispatcher = SignalDispatcher()
+        self.buffer = deque()
+        self.counter = CounterSink()
+
+    def test_emit(self):
+        self.dispatcher.subscribe(BufferSink(self.buffer))
+        self.dispatcher.subscribe(self.counter)
+
+        event = self.dispatcher.emit(events.Passed, ('Evie',))
+        self.assertEqual(events.Passed('Evie'), event)
+        self.assertEqual([event], list(self.buffer))
+        self.assertEqual(1, self.counter.counts[EventTypes.PASSED])
+
+        self.dispatcher.emit('%s drew %s.', ('Bob', 'London'))
+        self.assertEqual('Bob drew London.', str(self.buffer[-1]))
+
+    def test_filters(self):
+        outbreaks = []
+        self.dispatcher.subscribe(CallbackSink(
+            lambda event, level: outbreaks.append(event),
+            types=[EventTypes.OUTBREAK, EventTypes.EPIDEMIC]))
+        self.dispatcher.subscribe(
+            BufferSink(self.buffer, level=logging.WARNING))
+
+        self.dispatcher.emit(events.Infected, ('London', 'Blue', 1))
+        self.dispatcher.emit(events.Outbreak, ('London', 'Blue', 1))
+        self.dispatcher.emit('Game lost!', (), logging.WARNING)
+
+        self.assertEqual([events.Outbreak('London', 'Blue', 1)], outbreaks)
+        self.assertEqual(['Game lost!'], [str(event) for event in self.buffer])
+
+    def test_no_interested_sinks(self):
+        self.dispatcher.subscribe(CounterSink(types=[EventTypes.OUTBREAK]))
+        event_class = Mock(type=EventTypes.INFECTED)
+
+        self.assertIsNone(self.dispatcher.emit(event_class, ('London',)))
+        event_class.assert_not_called()
+
+    def test_unsubscribe(self):
+        self.dispatcher.subscribe(self.counter)
+        self.dispatcher.emit(events.Passed, ('Evie',))
+        self.dispatcher.unsubscribe(self.counter)
+        self.dispatcher.emit(events.Passed, ('Evie',))
+
+        self.assertEqual(1, self.counter.counts[EventTypes.PASSED])
+        self.assertEqual((), self.dispatcher.route(EventTypes.PASSED,
+                                                   logging.INFO))
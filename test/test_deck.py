@@ -2,6 +2,7 @@
 from unittest.mock import patch, MagicMock
 
 import random
+from collections import deque
 
 from pyndemic.city import City
 from pyndemic.card import PlayerCard, CityCard, InfectCard
@@ -18,11 +19,11 @@ def setUp(self):
             CityCard('Moscow', 'Black'),
             CityCard('New York', 'Yellow'),
         ]
-        self.deck.cards = self.test_cards.copy()
+        self.deck.cards = deque(self.test_cards)
 
     def test_clear(self):
         self.deck.clear()
-        self.assertEqual([], self.deck.cards)
+        self.assertEqual(deque(), self.deck.cards)
         self.assertEqual([], self.deck.discard)
 
     def test_take_top_card(self):
@@ -32,6 +33,24 @@ def test_take_top_card(self):
         next_card = self.deck.take_top_card()
         self.assertEqual('Yellow', next_card.colour)
 
+    def test_take_top_cards(self):
+        cards = self.deck.take_top_cards(2)
+        self.assertEqual(['London', 'Washington'], [c.name for c in cards])
+        self.assertEqual(3, len(self.deck.cards))
+
+        cards = self.deck.take_top_cards(5)
+        self.assertEqual(3, len(cards))
+        self.assertEqual(0, len(self.deck.cards))
+
+    def test_put_on_top(self):
+        new_cards = [CityCard('Tula', 'Black'), CityCard('Tver', 'Black')]
+        self.deck.put_on_top(new_cards)
+
+        self.assertEqual(7, len(self.deck.cards))
+        self.assertEqual('Tula', self.deck.take_top_card().name)
+        self.assertEqual('Tver', self.deck.take_top_card().name)
+        self.assertEqual('London', self.deck.take_top_card().name)
+
     def test_take_bottom_card(self):
         card = self.deck.take_bottom_card()
         self.assertEqual('Yellow', card.colour)
@@ -67,12 +86,23 @@ def test_shuffle(self):
 
         random.seed(42)
         self.deck.shuffle()
-        self.assertEqual(self.test_cards, self.deck.cards)
+        self.assertEqual(self.test_cards, list(self.deck.cards))
+
+    def test_shuffle_with_own_generator(self):
+        self.deck = Deck(rng=random.Random(42))
+        self.deck.cards = deque(self.test_cards)
+        random.Random(42).shuffle(self.test_cards)
+
+        random.seed(0)
+        global_state = random.getstate()
+        self.deck.shuffle()
+        self.assertEqual(self.test_cards, list(self.deck.cards))
+        self.assertEqual(global_state, random.getstate())
 
     def test_draw_card(self):
         card = MagicMock()
         drawing_character = 'Bob'
-        self.deck.cards = [card]
+        self.deck.cards = deque([card])
 
         drawn_card = self.deck.draw_card(drawing_character)
         self.assertIs(card, drawn_card)
@@ -81,7 +111,7 @@ def test_draw_card(self):
     def test_draw_card_without_callback(self):
         card = MagicMock()
         drawing_character = 'Bob'
-        self.deck.cards = [card]
+        self.deck.cards = deque([card])
 
         drawn_card = self.deck.draw_card(drawing_character, on_draw=False)
         self.assertIs(card, drawn_card)
@@ -0,0 +1,108 @@
+from unittest import TestCase
+
+import logging
+import os
+import os.path as op
+import tempfile
+
+from pyndemic.core import api, events, GameEntity
+from pyndemic.controller import GameController
+from pyndemic.event_log import (EventLogWriter, EventLogSink,
+                                read_event_log, open_writer, release_writer)
+
+
+class EventLogTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.filename = op.join(self.directory, 'events.jsonl')
+
+    def test_write(self):
+        writer = EventLogWriter(self.filename)
+        sink = EventLogSink(writer, 'game', lambda: 3)
+        sink.handle(events.Infected('London', 'Blue', 2), logging.INFO)
+        sink.handle(events.Message('Game %s!', ('lost',)), logging.WARNING)
+        writer.close()
+
+        first, second = read_event_log(self.filename)
+        self.assertEqual('game', first['game'])
+        self.assertEqual(3, first['turn'])
+        self.assertEqual([1, 2], [first['seq'], second['seq']])
+        self.assertEqual('INFO', first['level'])
+        self.assertEqual({'type': 'infected', 'city': 'London',
+                          'colour': 'Blue', 'level': 2}, first['event'])
+        self.assertEqual({'type': 'message', 'message': 'Game lost!'},
+                         second['event'])
+
+    def test_rotate(self):
+        writer = EventLogWriter(self.filename, max_bytes=1000,
+                                backup_count=2)
+        sink = EventLogSink(writer, 'game', lambda: 1)
+        for _ in range(50):
+            sink.handle(events.Passed('Evie'), logging.INFO)
+        writer.close()
+
+        self.assertTrue(op.exists(self.filename + '.1'))
+        self.assertTrue(op.exists(self.filename + '.2'))
+        self.assertFalse(op.exists(self.filename + '.3'))
+        self.assertLessEqual(os.path.getsize(self.filename), 1000)
+        sequence = [record['seq'] for record in
+                    read_event_log(self.filename)]
+        self.assertEqual(50, sequence[-1])
+
+    def test_controller_event_log(self):
+        GameEntity.signals_enabled = True
+        self.addCleanup(setattr, GameEntity, 'signals_enabled', False)
+        controller = GameController(random_state=42, players=['A', 'B'],
+                                    event_log=self.filename)
+        pass_request = {'type': api.RequestTypes.COMMAND,
+                        'command': 'pass', 'args': {}}
+        with controller:
+            controller.send(pass_request)
+            game_id = controller.event_log_sink.game_id
+
+        records = read_event_log(self.filename)
+        self.assertTrue(all(record['game'] == game_id for record in records))
+        self.assertEqual(list(range(1, len(records) + 1)),
+                         [record['seq'] for record in records])
+        self.assertIn('infected',
+                      {record['event']['type'] for record in records})
+        self.assertEqual(2, records[-1]['turn'])
+        self.assertIsNone(controller.event_log_sink)
+
+    def test_shared_writer(self):
+        writer = open_writer(self.filename)
+        self.assertIs(writer, open_writer(op.join(
+            self.directory, '.', 'events.jsonl')))
+
+        release_writer(writer)
+        self.assertIsNotNone(writer._file)
+        release_writer(writer)
+        self.assertIsNone(writer._file)
+        self.assertIsNot(writer, open_writer(self.filename))
+        release_writer(open_writer(self.filename))
+
+    def test_controllers_share_writer(self):
+        GameEntity.signals_enabled = True
+        self.addCleanup(setattr, GameEntity, 'signals_enabled', False)
+        controllers = [
+            GameController(random_state=random_state, players=['A', 'B'],
+                           event_log=self.filename)
+            for random_state in range(2)]
+        for controller in controllers:
+            controller.run()
+
+        first, second = (controller.event_log_sink
+                         for controller in controllers)
+        self.assertIs(first.writer, second.writer)
+        self.assertNotEqual(first.game_id, second.game_id)
+
+        controllers[0].stop()
+        self.assertIsNotNone(second.writer._file)
+        controllers[1].stop()
+        self.assertIsNone(second.writer._file)
+
+        game_ids = {record['game'] for record in
+                    read_event_log(self.filename)}
+        self.assertEqual({first.game_id, second.game_id}, game_ids)
@@ -1,7 +1,5 @@
 import unittest
 
-import random
-
 from pyndemic.game import Game
 from pyndemic.city import City
 from pyndemic.disease import Disease
@@ -9,18 +7,17 @@
 from pyndemic.deck import Deck
 from pyndemic.character import Character
 from pyndemic.formatter import BaseFormatter
-from .test_helpers import MockController
+from .test_helpers import MockController, activate_context
 
 
 class GameStateSerialisationCase(unittest.TestCase):
     def setUp(self):
         self.controller = MockController()
-        self._ctx = self.controller._ctx
+        activate_context(self, self.controller._ctx)
 
-        random.seed(42)
         self.character1 = Character('Evie')
         self.character2 = Character('Amelia')
-        self.pg = Game()
+        self.pg = Game(random_state=42)
         self.pg.add_character(self.character1)
         self.pg.add_character(self.character2)
 
@@ -138,10 +135,9 @@ def test_disease_to_dict(self):
 class CharacterSerialisationTestCase(unittest.TestCase):
     def setUp(self):
         self.controller = MockController()
-        self._ctx = self.controller._ctx
+        activate_context(self, self.controller._ctx)
 
-        random.seed(42)
-        self.game = Game()
+        self.game = Game(random_state=42)
         self.character = Character('Alice')
         self.game.add_character(self.character)
         self.controller.game = self.game
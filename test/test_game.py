@@ -1,20 +1,25 @@
 import unittest
 from unittest import TestCase
 
+import logging
 import os.path as op
 import random
+import sys
+from configparser import ConfigParser
 
 from pyndemic.exceptions import *
+from pyndemic.config import GameSettings
 from pyndemic.deck import PlayerDeck, InfectDeck
+from pyndemic.core import GameEntity, events
 from pyndemic.game import Game
 from pyndemic.character import Character
-from .test_helpers import MockController
+from .test_helpers import MockController, activate_context
 
 
 class GameSetupTestCase(TestCase):
     def setUp(self):
         self.controller = MockController()
-        self._ctx = self.controller._ctx
+        activate_context(self, self.controller._ctx)
 
         self.pg = Game()
         self.controller.game = self.pg
@@ -56,8 +61,13 @@ def test_get_new_city_map(self):
         self.assertNotIn(self.pg.city_map['Liverpool'], city.connected_cities)
 
     def test_create_cities(self):
+        self.pg.get_new_diseases()
         self.pg.create_cities()
 
+        self.assertEqual(40, len(self.pg.board))
+        self.pg.city_map['Oxford'].infection_levels['Red'] = 2
+        self.assertEqual(2, self.pg.board.get_level(1, 'Red'))
+
         self.assertEqual(40, len(self.pg.city_map))
         self.assertIn('London', self.pg.city_map)
 
@@ -66,14 +76,28 @@ def test_create_cities(self):
         self.assertEqual('Blue', city.colour)
         self.assertEqual('Yellow', self.pg.city_map['Washington'].colour)
 
-    def test_connect_cities(self):
+    def test_connected_cities(self):
         self.pg.create_cities()
-        self.pg.connect_cities()
         city = self.pg.city_map['London']
 
         self.assertEqual(6, len(city.connected_cities))
         self.assertIn(self.pg.city_map['Washington'], city.connected_cities)
         self.assertNotIn(self.pg.city_map['Liverpool'], city.connected_cities)
+        self.assertIs(self.pg.city_map['Oxford'], city.connected_cities[0])
+
+    def test_topology_is_shared(self):
+        self.pg.get_new_city_map()
+        other_game = Game()
+        other_game.settings = self.settings
+        other_game.get_new_city_map()
+
+        self.assertIs(self.pg.topology, other_game.topology)
+        self.assertIsNot(self.pg.city_map['London'],
+                         other_game.city_map['London'])
+
+        self.pg.city_map['London'].build_lab()
+        self.assertTrue(self.pg.city_map['London'].has_lab)
+        self.assertFalse(other_game.city_map['London'].has_lab)
 
     def test_get_new_decks(self):
         self.pg.player_deck = PlayerDeck()
@@ -141,13 +165,12 @@ class GameTestCase(unittest.TestCase):
 
     def setUp(self):
         self.controller = MockController()
-        self._ctx = self.controller._ctx
+        activate_context(self, self.controller._ctx)
         self.settings = self.controller.settings
 
-        random.seed(42)
         self.character1 = Character('Evie')
         self.character2 = Character('Amelia')
-        self.pg = Game()
+        self.pg = Game(random_state=42)
         self.pg.add_character(self.character1)
         self.pg.add_character(self.character2)
 
@@ -222,6 +245,42 @@ def test_infect_city_phase_ouitbreak_stack(self):
         self.assertEqual(2, self.pg.city_map['Bristol'].infection_levels['Blue'])
         self.assertEqual(3, self.pg.city_map['Cambridge'].infection_levels['Blue'])
 
+    def test_batched_infect_city_phase(self):
+        self.pg.batch_infect_phase = True
+        self.pg.infect_city_phase()
+        self.assertEqual(1, self.pg.city_map['London'].infection_levels['Blue'])
+        self.assertEqual(1, self.pg.city_map['Oxford'].infection_levels['Blue'])
+        self.assertEqual(2, len(self.pg.infect_deck.discard))
+        self.assertEqual('London', self.pg.infect_deck.discard[0].name)
+        self.assertEqual('Cambridge', self.pg.infect_deck.cards[0].name)
+        self.assertEqual(28, self.pg.diseases['Blue'].public_health)
+        self.assertEqual(0, len(self.pg.outbreak_stack))
+
+    def test_batched_infect_city_phase_matches_card_by_card(self):
+        london = self.pg.city_map['London']
+        oxford = self.pg.city_map['Oxford']
+        london.infection_levels['Blue'] = 3
+        oxford.infection_levels['Blue'] = 3
+        initial_levels = self.pg.board.snapshot()
+
+        self.pg.infect_city_phase()
+        expected_levels = self.pg.board.snapshot()
+        expected_outbreaks = self.pg.outbreak_count
+        expected_health = self.pg.diseases['Blue'].public_health
+
+        self.pg.board.restore(initial_levels)
+        self.pg.outbreak_count = 0
+        self.pg.diseases['Blue'].public_health = 30
+        self.pg.infect_deck.put_on_top(self.pg.infect_deck.discard)
+        self.pg.infect_deck.discard = []
+
+        self.pg.batch_infect_phase = True
+        self.pg.infect_city_phase()
+        self.assertEqual(expected_levels, self.pg.board.snapshot())
+        self.assertEqual(expected_outbreaks, self.pg.outbreak_count)
+        self.assertEqual(expected_health,
+                         self.pg.diseases['Blue'].public_health)
+
     def test_epidemic_phase(self):
         self.pg.epidemic_phase()
         self.assertEqual(3, self.pg.city_map['Belgorod'].infection_levels['Black'])
@@ -266,6 +325,95 @@ def test_shuffle(self):
         self.pg.infect_deck.shuffle()
         self.assertNotEqual('Oxford', self.pg.infect_deck.take_top_card().name)
 
+    def test_own_random_generator(self):
+        other_game = Game(random_state=42)
+        other_game.setup_game(self.settings)
+
+        random.seed(0)
+        global_state = random.getstate()
+        self.pg.shuffle_decks()
+        other_game.shuffle_decks()
+
+        self.assertEqual(global_state, random.getstate())
+        self.assertIs(self.pg.rng, self.pg.player_deck.rng)
+        self.assertIs(self.pg.rng, self.pg.infect_deck.rng)
+        self.assertEqual([card.name for card in self.pg.infect_deck.cards],
+                         [card.name for card in other_game.infect_deck.cards])
+
+    def test_clone(self):
+        self.pg.start_game()
+        clone = self.pg.clone()
+
+        self.assertIs(self.pg.topology, clone.topology)
+        self.assertIs(self.pg.settings, clone.settings)
+        self.assertEqual(self.pg.board.snapshot(), clone.board.snapshot())
+        self.assertEqual([card.name for card in self.pg.player_deck.cards],
+                         [card.name for card in clone.player_deck.cards])
+        self.assertIs(self.pg.infect_deck.cards[0], clone.infect_deck.cards[0])
+        self.assertIs(clone.rng, clone.infect_deck.rng)
+        self.assertTrue(clone.city_map['London'].has_lab)
+
+        clone_character = clone.characters[0]
+        self.assertIs(clone, clone_character.game)
+        self.assertIs(clone.city_map['London'], clone_character.location)
+        self.assertIs(clone.city_map['Oxford'],
+                      clone.city_map['London'].connected_cities[0])
+
+        clone.infect_city('London', 'Red')
+        clone.city_map['Oxford'].build_lab()
+        clone.diseases['Blue'].cured = True
+        clone_character.hand.pop()
+        infect_cards = len(self.pg.infect_deck.cards)
+        clone.infect_deck.take_top_card()
+        clone.outbreak_count = 3
+
+        self.assertEqual(0, self.pg.city_map['London'].infection_levels['Red'])
+        self.assertFalse(self.pg.city_map['Oxford'].has_lab)
+        self.assertFalse(self.pg.diseases['Blue'].cured)
+        self.assertEqual(4, len(self.character1.hand))
+        self.assertEqual(infect_cards, len(self.pg.infect_deck.cards))
+        self.assertEqual(0, self.pg.outbreak_count)
+
+    def test_clone_random_state(self):
+        clone = self.pg.clone()
+        self.pg.shuffle_decks()
+        clone.shuffle_decks()
+
+        self.assertEqual([card.name for card in self.pg.infect_deck.cards],
+                         [card.name for card in clone.infect_deck.cards])
+
+    def test_clone_is_silent(self):
+        GameEntity.signals_enabled = True
+        self.addCleanup(setattr, GameEntity, 'signals_enabled', False)
+        self.controller.signals.clear()
+
+        clone = self.pg.clone()
+        clone.infect_city('London', 'Blue')
+        self.assertEqual(0, len(self.controller.signals))
+
+        clone = self.pg.clone(self.pg._ctx)
+        clone.emit_signal('Clone signal', log_level=logging.WARNING)
+        self.assertEqual(1, len(self.controller.signals))
+
+    def test_infect_city_events(self):
+        GameEntity.signals_enabled = True
+        self.addCleanup(setattr, GameEntity, 'signals_enabled', False)
+        self.controller.signals.clear()
+
+        self.pg.infect_city('London', 'Blue')
+        self.assertEqual([events.Infected('London', 'Blue', 1)],
+                         list(self.controller.signals))
+
+        self.controller.signals.clear()
+        self.pg.city_map['London'].set_infection_level('Blue', 3)
+        self.pg.infect_city('London', 'Blue')
+        outbreak = self.controller.signals[0]
+        self.assertEqual(events.EventTypes.OUTBREAK, outbreak.type)
+        self.assertEqual(
+            {'type': 'outbreak', 'city': 'London', 'colour': 'Blue',
+             'outbreak_count': 1},
+            outbreak.to_dict())
+
     def test_start_game(self):
         self.pg.start_game()
         self.top_player_card = self.pg.player_deck.take_top_card()
@@ -302,7 +450,7 @@ def test_initial_infect_phase(self):
         self.assertEqual(12, self.pg.diseases['Blue'].public_health)
 
     def test_draw_initial_hands(self):
-        test_cards = self.pg.player_deck.cards[:8]
+        test_cards = list(self.pg.player_deck.cards)[:8]
         self.pg.draw_initial_hands()
 
         for i, character in enumerate(self.pg.characters):
@@ -317,5 +465,80 @@ def test_get_new_disease(self):
         self.assertTrue(self.pg.diseases['Blue'].cured)
 
 
+class OutbreakCascadeTestCase(TestCase):
+    """Cascades over a long chain of cities must not depend on the
+    interpreter recursion limit.
+    """
+    def setUp(self):
+        self.controller = MockController()
+        activate_context(self, self.controller._ctx)
+
+        self.chain_length = sys.getrecursionlimit() * 2
+        self.settings = self.construct_chain_settings(self.chain_length)
+        self.pg = Game()
+        self.controller.game = self.pg
+        self.pg.settings = self.settings
+
+        self.pg.get_new_diseases()
+        self.pg.get_new_city_map()
+        self.pg.set_outbreak_death_level()
+
+    def tearDown(self):
+        del self.controller
+
+    @staticmethod
+    def construct_chain_settings(chain_length):
+        settings = ConfigParser()
+        settings['Cities'] = {f'city{i}': f'City{i}'
+                              for i in range(chain_length)}
+        settings['City Colours'] = {f'city{i}': 'Blue'
+                                    for i in range(chain_length)}
+
+        connections = {}
+        for i in range(chain_length):
+            neighbours = [j for j in (i - 1, i + 1) if 0 <= j < chain_length]
+            connections[f'City{i}'] = ' '.join(map(str, neighbours))
+        settings['Connections'] = connections
+
+        settings['Diseases'] = {'disease1': 'Blue'}
+        settings['Other'] = {
+            'max_resistance': str(chain_length * 4),
+            'outbreak_death_level': str(chain_length + 1),
+        }
+        return GameSettings.from_config(settings)
+
+    def test_outbreak_chain(self):
+        for city in self.pg.city_map.values():
+            city.infection_levels['Blue'] = 3
+
+        self.pg.infect_city('City0', 'Blue')
+
+        self.assertEqual(self.chain_length, self.pg.outbreak_count)
+        self.assertEqual(self.chain_length, len(self.pg.outbreak_stack))
+        self.assertEqual(
+            3, self.pg.city_map[f'City{self.chain_length - 1}']
+                   .infection_levels['Blue'])
+
+    def test_outbreak_chain_stops_at_calm_city(self):
+        for city in self.pg.city_map.values():
+            city.infection_levels['Blue'] = 3
+        self.pg.city_map['City10'].infection_levels['Blue'] = 1
+
+        self.pg.infect_city('City0', 'Blue')
+
+        self.assertEqual(10, self.pg.outbreak_count)
+        self.assertEqual(2, self.pg.city_map['City10'].infection_levels['Blue'])
+        self.assertNotIn(self.pg.city_ids['City10'], self.pg.outbreak_stack)
+
+    def test_outbreak_death_level(self):
+        self.pg.outbreak_death_level = 5
+        for city in self.pg.city_map.values():
+            city.infection_levels['Blue'] = 3
+
+        with self.assertRaises(GameCrisisException):
+            self.pg.infect_city('City0', 'Blue')
+        self.assertEqual(5, self.pg.outbreak_count)
+
+
 if __name__ == '__main__':
     unittest.main()
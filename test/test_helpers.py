@@ -2,20 +2,32 @@
 from collections import deque
 from unittest.mock import MagicMock
 
-from pyndemic.core.context import ContextRegistrationMeta
+from pyndemic.core.context import ContextRegistrationMeta, game_context
+from pyndemic.core.sinks import SignalDispatcher, BufferSink
 from pyndemic import config
 
 
 SETTINGS_LOCATION = op.join(op.dirname(__file__), 'test_settings.cfg')
 
 
+def activate_context(test_case, ctx):
+    """Keep the game context active until the end of the test."""
+    context = game_context(ctx)
+    context.__enter__()
+    test_case.addCleanup(context.__exit__, None, None, None)
+
+
 def construct_mock_context():
     return {'id': 'foo', 'controller': MagicMock()}
 
 
 class MockController(metaclass=ContextRegistrationMeta,
                      ctx_name='controller'):
-    """Help Controller-like class with "signals" and "_ctx" attributes."""
+    """Help Controller-like class with "signals", "sinks" and "_ctx"
+    attributes.
+    """
     def __init__(self):
         self.signals = deque()
+        self.sinks = SignalDispatcher()
+        self.sinks.subscribe(BufferSink(self.signals))
         self.settings = config.get_settings(SETTINGS_LOCATION, refresh=True)
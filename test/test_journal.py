@@ -0,0 +1,172 @@
+from unittest import TestCase
+
+import random
+from collections import deque
+
+from pyndemic.journal import ActionJournal
+from pyndemic.game import Game
+from pyndemic.character import Character
+from .test_helpers import MockController, activate_context
+
+
+class ActionJournalTestCase(TestCase):
+    def setUp(self):
+        self.journal = ActionJournal()
+        self.sequence = deque([1, 2, 3])
+        self.mapping = {'Blue': 0}
+
+    def test_not_recording_outside_action(self):
+        self.journal.record_item(self.mapping, 'Blue', 0, 1)
+        self.assertFalse(self.journal.recording)
+        self.assertFalse(self.journal.undo())
+
+    def test_undo_redo(self):
+        with self.journal.action():
+            self.mapping['Blue'] = 1
+            self.journal.record_item(self.mapping, 'Blue', 0, 1)
+            self.sequence.popleft()
+            self.journal.record_remove(self.sequence, 0, 1)
+            self.sequence.append(4)
+            self.journal.record_insert(self.sequence, len(self.sequence) - 1, 4)
+
+        self.assertTrue(self.journal.undo())
+        self.assertEqual({'Blue': 0}, self.mapping)
+        self.assertEqual(deque([1, 2, 3]), self.sequence)
+        self.assertFalse(self.journal.undo())
+
+        self.assertTrue(self.journal.redo())
+        self.assertEqual({'Blue': 1}, self.mapping)
+        self.assertEqual(deque([2, 3, 4]), self.sequence)
+        self.assertFalse(self.journal.redo())
+
+    def test_nested_actions(self):
+        with self.journal.action():
+            with self.journal.action():
+                self.journal.record_item(self.mapping, 'Blue', 0, 1)
+            self.assertTrue(self.journal.recording)
+            self.journal.record_item(self.mapping, 'Blue', 1, 2)
+
+        self.assertEqual(1, len(self.journal.done))
+        self.assertEqual(2, len(self.journal.done[0]))
+
+    def test_empty_action(self):
+        with self.journal.action():
+            pass
+        self.assertFalse(self.journal.done)
+
+    def test_new_action_clears_redo(self):
+        for level in range(2):
+            with self.journal.action():
+                self.journal.record_item(
+                    self.mapping, 'Blue', level, level + 1)
+        self.journal.undo()
+        self.assertTrue(self.journal.can_redo())
+
+        with self.journal.action():
+            self.journal.record_item(self.mapping, 'Blue', 1, 3)
+        self.assertFalse(self.journal.can_redo())
+
+    def test_random_state(self):
+        rng = random.Random(42)
+        state = rng.getstate()
+        with self.journal.action():
+            self.journal.record_random_state(rng)
+            rng.random()
+            self.journal.record_random_state(rng)
+            rng.random()
+        new_state = rng.getstate()
+
+        self.journal.undo()
+        self.assertEqual(state, rng.getstate())
+        self.journal.redo()
+        self.assertEqual(new_state, rng.getstate())
+
+
+class JournaledGameTestCase(TestCase):
+    def setUp(self):
+        self.controller = MockController()
+        activate_context(self, self.controller._ctx)
+        self.settings = self.controller.settings
+
+        self.character1 = Character('Evie')
+        self.character2 = Character('Amelia')
+        self.pg = Game(random_state=42)
+        self.pg.add_character(self.character1)
+        self.pg.add_character(self.character2)
+
+        self.controller.game = self.pg
+        self.pg.setup_game(self.settings)
+        self.pg.start_game()
+        self.journal = self.pg.enable_journal()
+
+    def tearDown(self):
+        del self.controller
+
+    def test_enable_journal(self):
+        self.assertIs(self.journal, self.pg.enable_journal())
+        self.assertIs(self.journal, self.character1.journal)
+        self.assertIs(self.journal, self.pg.city_map['London'].journal)
+
+    def test_character_actions(self):
+        self.character1.action_count = 4
+        hand = list(self.character2.hand)
+        card = next(card for card in self.character2.hand
+                    if card.name in self.pg.city_map)
+        self.character1.set_location(card.name)
+        self.character2.set_location(card.name)
+
+        with self.journal.action():
+            self.character1.share_knowledge(card.name, self.character2)
+        with self.journal.action():
+            self.character1.build_lab()
+
+        self.assertTrue(self.pg.city_map[card.name].has_lab)
+        self.assertEqual(2, self.character1.action_count)
+        self.assertTrue(self.pg.undo())
+        self.assertTrue(self.pg.undo())
+
+        self.assertFalse(self.pg.city_map[card.name].has_lab)
+        self.assertEqual(4, self.character1.action_count)
+        self.assertEqual(hand, self.character2.hand)
+        self.assertNotIn(card, self.character1.hand)
+        self.assertFalse(self.pg.player_deck.discard)
+
+    def test_treat_disease(self):
+        city = self.pg.city_map['Brighton']
+        self.character1.location = city
+        self.character1.action_count = 4
+        public_health = self.pg.diseases['Blue'].public_health
+
+        with self.journal.action():
+            self.character1.treat_disease('Blue')
+        self.assertEqual(2, city.infection_levels['Blue'])
+
+        self.pg.undo()
+        self.assertEqual(3, city.infection_levels['Blue'])
+        self.assertEqual(public_health, self.pg.diseases['Blue'].public_health)
+        self.pg.redo()
+        self.assertEqual(2, city.infection_levels['Blue'])
+
+    def test_epidemic(self):
+        levels = self.pg.board.snapshot()
+        infect_cards = list(self.pg.infect_deck.cards)
+        infect_discard = list(self.pg.infect_deck.discard)
+        random_state = self.pg.rng.getstate()
+
+        with self.journal.action():
+            self.pg.epidemic_phase()
+            self.pg.infect_city_phase()
+        self.assertEqual(1, self.pg.epidemic_count)
+        levels_after = self.pg.board.snapshot()
+        infect_cards_after = list(self.pg.infect_deck.cards)
+
+        self.pg.undo()
+        self.assertEqual(0, self.pg.epidemic_count)
+        self.assertEqual(levels, self.pg.board.snapshot())
+        self.assertEqual(infect_cards, list(self.pg.infect_deck.cards))
+        self.assertEqual(infect_discard, self.pg.infect_deck.discard)
+        self.assertEqual(random_state, self.pg.rng.getstate())
+
+        self.pg.redo()
+        self.assertEqual(levels_after, self.pg.board.snapshot())
+        self.assertEqual(infect_cards_after, list(self.pg.infect_deck.cards))
@@ -0,0 +1,98 @@
+from unittest import TestCase
+
+import logging
+import os.path as op
+import queue
+import subprocess
+import sys
+import tempfile
+
+from pyndemic import log, log_writer
+
+
+class ImportTestCase(TestCase):
+    def test_import_has_no_side_effects(self):
+        code = '\n'.join([
+            'import logging',
+            'root = logging.root',
+            'class HostLogger(logging.Logger): pass',
+            'logging.setLoggerClass(HostLogger)',
+            'import pyndemic.controller',
+            'from pyndemic import config, log',
+            'assert logging.root is root',
+            'assert logging.getLoggerClass() is HostLogger',
+            'assert isinstance(log.logger, log.GameLogger)',
+            'assert config._CACHED_SETTINGS is None',
+            'assert not log._configured and log._writer is None',
+            'import sys',
+            'assert "logging.handlers" not in sys.modules',
+        ])
+        subprocess.run([sys.executable, '-c', code], check=True,
+                       cwd=op.join(op.dirname(__file__), op.pardir))
+
+    def test_setup_keeps_global_logging(self):
+        code = '\n'.join([
+            'import logging',
+            'root = logging.root',
+            'srcfile = logging._srcfile',
+            'from pyndemic import config, log',
+            'log.setup_logging(config.GameSettings({}))',
+            'assert logging.root is root',
+            'assert logging._srcfile == srcfile',
+            'assert logging.logThreads and logging.logProcesses',
+            'assert log.logger.findCaller()[0] == "(unknown file)"',
+        ])
+        subprocess.run([sys.executable, '-c', code], check=True,
+                       cwd=op.join(op.dirname(__file__), op.pardir))
+
+
+class DeferredQueueHandlerTestCase(TestCase):
+    def test_prepare_keeps_arguments(self):
+        handler = log_writer.DeferredQueueHandler(queue.SimpleQueue())
+        record = logging.LogRecord(
+            'PYNDEMIC', logging.INFO, __file__, 1, 'Infected %s.',
+            ('London',), None)
+
+        prepared = handler.prepare(record)
+        self.assertEqual('Infected %s.', prepared.msg)
+        self.assertEqual(('London',), prepared.args)
+
+
+class FileLogTestCase(TestCase):
+    def setUp(self):
+        for name in ('_writer', '_queue_handler', '_configured'):
+            self.addCleanup(setattr, log, name, getattr(log, name))
+        log._writer = None
+        log._queue_handler = None
+        self.addCleanup(log.logger.setLevel, log.logger.level)
+        log.logger.setLevel(logging.DEBUG)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.filename = op.join(self.directory.name, 'game.log')
+        logging.disable(logging.NOTSET)
+        self.addCleanup(logging.disable, logging.CRITICAL)
+
+    def test_stop_flushes_queue(self):
+        log.start_file_log(self.filename, level='INFO')
+        for i in range(100):
+            log.logger.info('Record %s.', i)
+        log.logger.debug('Hidden record.')
+        log.stop_file_log()
+
+        with open(self.filename) as log_file:
+            lines = log_file.read().splitlines()
+        self.assertEqual(100, len(lines))
+        self.assertEqual('PYNDEMIC INFO: Record 99.', lines[-1])
+        self.assertIsNone(log._writer)
+
+    def test_restart_rolls_over(self):
+        log.start_file_log(self.filename)
+        log.logger.info('First game.')
+        log.start_file_log(self.filename)
+        log.logger.info('Second game.')
+        log.stop_file_log()
+
+        with open(self.filename) as log_file:
+            self.assertIn('Second game.', log_file.read())
+        with open(self.filename + '.1') as log_file:
+            self.assertIn('First game.', log_file.read())
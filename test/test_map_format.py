@@ -0,0 +1,121 @@
+from unittest import TestCase
+
+import json
+import os.path as op
+import tempfile
+
+from pyndemic import config
+from pyndemic.controller import GameController
+from pyndemic.map_format import (MapFormatError, topology_from_dict,
+                                 topology_to_dict, load_map, dump_map)
+from pyndemic.topology import Topology
+from .test_helpers import SETTINGS_LOCATION
+
+
+class MapFormatTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.settings = config.GameSettings.from_config(
+            config.read_config())
+        self.topology = Topology.from_settings(self.settings)
+        self.data = {
+            'version': 1,
+            'colours': ['Blue', 'Red'],
+            'names': ['A', 'B', 'C'],
+            'city_colours': [0, 0, 1],
+            'connections': [[1, 2], [0], [0]],
+        }
+
+    def assertSameTopology(self, expected, topology):
+        for field in ('names', 'colours', 'offsets', 'neighbours'):
+            self.assertEqual(getattr(expected, field),
+                             getattr(topology, field))
+
+    def test_topology_from_dict(self):
+        topology = topology_from_dict(self.data)
+        self.assertEqual(('A', 'B', 'C'), topology.names)
+        self.assertEqual(('Blue', 'Blue', 'Red'), topology.colours)
+        self.assertEqual((1, 2), topology.neighbours_of(0))
+        self.assertEqual((0,), topology.neighbours_of(2))
+
+    def test_invalid_maps(self):
+        invalid_connections = {
+            'asymmetric': [[1, 2], [0], []],
+            'duplicate': [[1, 1, 2], [0, 0], [0]],
+            'self': [[0, 1, 2], [0], [0]],
+            'out of range': [[1, 2, 3], [0], [0]],
+            'missing city': [[1, 2], [0]],
+            'bool id': [[True, 2], [0], [0]],
+            'not a list': {'A': [1, 2], 'B': [0], 'C': [0]},
+        }
+        for name, connections in invalid_connections.items():
+            with self.subTest(name):
+                with self.assertRaises(MapFormatError):
+                    topology_from_dict(dict(self.data,
+                                            connections=connections))
+
+        invalid_fields = {
+            'duplicate names': {'names': ['A', 'B', 'A']},
+            'names not a list': {'names': 5},
+            'unhashable names': {'names': [['A'], ['B'], ['C']]},
+            'colours not a list': {'colours': {'x': 1}},
+            'colour not a string': {'colours': ['Blue', 1]},
+            'colour out of range': {'city_colours': [0, 0, 2]},
+            'bool colour': {'city_colours': [0, 0, True]},
+            'city colours not a list': {'city_colours': '001'},
+        }
+        for name, fields in invalid_fields.items():
+            with self.subTest(name):
+                with self.assertRaises(MapFormatError):
+                    topology_from_dict(dict(self.data, **fields))
+        with self.assertRaises(MapFormatError):
+            topology_from_dict(dict(self.data, version=2))
+
+    def test_one_way_connections(self):
+        # The test settings map has connections listed for one city only.
+        topology = Topology.from_settings(
+            config.get_settings(SETTINGS_LOCATION, refresh=True))
+        with self.assertRaises(MapFormatError):
+            topology_from_dict(topology_to_dict(topology))
+
+    def test_dump_and_load(self):
+        for extension in ('json', 'board'):
+            with self.subTest(extension):
+                filename = op.join(self.directory, f'map.{extension}')
+                dump_map(self.topology, filename)
+                self.assertSameTopology(self.topology, load_map(filename))
+
+        with open(op.join(self.directory, 'map.json')) as map_file:
+            self.assertEqual(topology_to_dict(self.topology),
+                             json.load(map_file))
+
+    def test_load_damaged_board(self):
+        filename = op.join(self.directory, 'map.board')
+        dump_map(self.topology, filename)
+        with open(filename, 'r+b') as map_file:
+            data = map_file.read()
+            map_file.seek(0)
+            map_file.write(data[:len(data) // 2])
+            map_file.truncate()
+
+        with self.assertRaises(MapFormatError):
+            load_map(filename)
+
+    def test_play_map_file(self):
+        filename = op.join(self.directory, 'map.json')
+        dump_map(self.topology, filename)
+        controller = GameController(players=['A', 'B'], random_state=0)
+        controller.settings = self.settings.replace(
+            players=['A', 'B'], random_state=0, map_file=filename)
+        controller.start_game()
+
+        self.assertEqual(self.topology.names, controller.game.topology.names)
+
+        with open(filename, 'w') as map_file:
+            json.dump(dict(self.data, colours=['Blue', 'Green']), map_file)
+        other_controller = GameController(players=['A', 'B'])
+        other_controller.settings = controller.settings
+        with self.assertRaises(MapFormatError):
+            other_controller.start_game()
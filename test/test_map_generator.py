@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+from pyndemic import config
+from pyndemic.controller import GameController
+from pyndemic.map_generator import generate_map, generate_settings
+from pyndemic.topology import Topology
+
+
+class MapGeneratorTestCase(TestCase):
+    def test_generate_map(self):
+        settings = config.GameSettings.from_config(
+            generate_map(200, colour_count=6, seed=1))
+        topology = Topology.from_settings(settings)
+
+        self.assertEqual(200, len(topology))
+        self.assertEqual(6, len(settings.diseases))
+        self.assertEqual(set(settings.diseases), set(topology.colours))
+        self.assertEqual('City0', settings.initial_city)
+        for city_id in range(len(topology)):
+            neighbours = topology.neighbours_of(city_id)
+            self.assertEqual(len(neighbours), len(set(neighbours)))
+            self.assertNotIn(city_id, neighbours)
+            for neighbour_id in neighbours:
+                self.assertTrue(topology.are_connected(neighbour_id, city_id))
+        self.assertNotIn(-1, topology.distances_from(0))
+        self.assertLessEqual(len(topology.neighbours), 6 * len(topology))
+
+    def test_seed(self):
+        self.assertEqual(dict(generate_map(50, seed=3)['Connections']),
+                         dict(generate_map(50, seed=3)['Connections']))
+        with self.assertRaises(ValueError):
+            generate_map(4, colour_count=3)
+
+    def test_play_generated_map(self):
+        controller = GameController(players=['A', 'B'], random_state=0)
+        controller.settings = generate_settings(300).replace(
+            players=['A', 'B'], random_state=0)
+        controller.start_game()
+
+        self.assertEqual(300, len(controller.game.cities))
+        self.assertTrue(controller.game.city_map['City0'].has_lab)
@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+from pyndemic.metrics import Histogram, Metrics
+
+
+class HistogramTestCase(TestCase):
+    def test_observe(self):
+        histogram = Histogram()
+        for value in (0, 0.5, 1, 3, 4, 4.5, 100):
+            histogram.observe(value)
+
+        data = histogram.to_dict()
+        self.assertEqual(7, data['count'])
+        self.assertEqual(0, data['min'])
+        self.assertEqual(100, data['max'])
+        self.assertAlmostEqual(113 / 7, data['mean'])
+        self.assertEqual({0: 1, 1: 2, 4: 2, 8: 1, 128: 1}, data['buckets'])
+
+    def test_empty(self):
+        self.assertIsNone(Histogram().to_dict()['mean'])
+
+
+class MetricsTestCase(TestCase):
+    def test_record_infection(self):
+        metrics = Metrics()
+        metrics.record_infection(0)
+        metrics.record_infection(3)
+
+        data = metrics.to_dict()
+        self.assertEqual({'infect_calls': 2, 'outbreak_chains': 1},
+                         data['counters'])
+        self.assertEqual(
+            {4: 1}, data['histograms']['outbreak_chain_length']['buckets'])
+
+    def test_timer(self):
+        metrics = Metrics()
+        with metrics.timer('phase'):
+            pass
+
+        self.assertEqual(1, metrics.histograms['phase'].count)
+        self.assertGreaterEqual(metrics.histograms['phase'].min, 0)
@@ -0,0 +1,167 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from array import array
+from copy import deepcopy
+import marshal
+import os
+import os.path as op
+import tempfile
+
+from pyndemic import config
+from pyndemic.topology import (Topology, get_topology, load_compiled,
+                               settings_hash)
+from .test_helpers import SETTINGS_LOCATION
+
+
+class TopologyTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.settings = config.get_settings(SETTINGS_LOCATION, refresh=True)
+
+    def setUp(self):
+        self.topology = Topology.from_settings(self.settings)
+        self.ids = self.topology.ids
+
+    def test_from_settings(self):
+        self.assertEqual(40, len(self.topology))
+        self.assertEqual('London', self.topology.names[0])
+        self.assertEqual('Belgorod', self.topology.names[39])
+        self.assertEqual('Yellow', self.topology.colours[self.ids['Detroit']])
+        self.assertEqual(41, len(self.topology.offsets))
+        self.assertEqual(self.topology.offsets[-1],
+                         len(self.topology.neighbours))
+
+    def test_ids_are_read_only(self):
+        with self.assertRaises(TypeError):
+            self.topology.ids['Atlantis'] = 40
+
+    def test_neighbours_of(self):
+        neighbours = self.topology.neighbours_of(self.ids['London'])
+        neighbour_names = [self.topology.names[i] for i in neighbours]
+        self.assertEqual(['Oxford', 'Cambridge', 'Brighton', 'Washington',
+                          'Bejing', 'Moscow'], neighbour_names)
+        self.assertEqual(6, self.topology.degree(self.ids['London']))
+
+    def test_are_connected(self):
+        self.assertTrue(self.topology.are_connected(self.ids['London'],
+                                                    self.ids['Brighton']))
+        self.assertFalse(self.topology.are_connected(self.ids['London'],
+                                                     self.ids['Tula']))
+
+    def test_distances_from(self):
+        distances = self.topology.distances_from(self.ids['London'])
+        self.assertEqual(0, distances[self.ids['London']])
+        self.assertEqual(1, distances[self.ids['Moscow']])
+        self.assertEqual(2, distances[self.ids['Tula']])
+        self.assertEqual(2, distances[self.ids['Liverpool']])
+
+    def test_shortest_path(self):
+        path = self.topology.shortest_path(self.ids['London'],
+                                           self.ids['Tula'])
+        self.assertEqual(['London', 'Moscow', 'Tula'],
+                         [self.topology.names[i] for i in path])
+
+        self.assertEqual([self.ids['Tula']], self.topology.shortest_path(
+            self.ids['Tula'], self.ids['Tula']))
+
+    def test_get_topology(self):
+        topology = get_topology(self.settings)
+        self.assertIs(topology, get_topology(deepcopy(self.settings)))
+
+        other_config = config.read_config(SETTINGS_LOCATION)
+        other_config['Connections']['Tula'] = '30 31'
+        other_settings = config.GameSettings.from_config(other_config)
+        self.assertIsNot(topology, get_topology(other_settings))
+
+    def test_distance(self):
+        london, tula = self.ids['London'], self.ids['Tula']
+        self.assertEqual(2, self.topology.distance(london, tula))
+        table = self.topology.distance_table()
+        self.assertEqual(len(self.topology) ** 2, len(table))
+        self.assertEqual(2, table[london * len(self.topology) + tula])
+        self.assertEqual(2, self.topology.distance(london, tula))
+
+
+class BoardCacheTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache_dir = directory.name
+        self.settings = config.get_settings(
+            SETTINGS_LOCATION, refresh=True).replace(
+            board_cache=self.cache_dir)
+        self.topology = Topology.from_settings(self.settings)
+
+    def assertSameTopology(self, expected, topology):
+        for field in ('names', 'colours', 'offsets', 'neighbours'):
+            self.assertEqual(getattr(expected, field),
+                             getattr(topology, field))
+
+    def test_to_bytes(self):
+        loaded = Topology.from_bytes(self.topology.to_bytes())
+        self.assertSameTopology(self.topology, loaded)
+        self.assertEqual(self.topology.distance_table(),
+                         loaded.distance_table())
+
+    def test_from_damaged_bytes(self):
+        data = self.topology.to_bytes()
+        for damaged in (b'', data[:len(data) // 2], b'garbage'):
+            with self.subTest(damaged=damaged[:10]):
+                with self.assertRaises(ValueError):
+                    Topology.from_bytes(damaged)
+
+    def test_from_inconsistent_bytes(self):
+        compiled = marshal.loads(self.topology.to_bytes())
+        city_count = len(self.topology)
+        damaged_fields = {
+            'neighbours': array('i', [city_count] * len(
+                self.topology.neighbours)).tobytes(),
+            'offsets': array('i', reversed(self.topology.offsets)).tobytes(),
+            'names': self.topology.names[:1] * city_count,
+            'colour_ids': compiled['colour_ids'][:-2],
+        }
+        for field, value in damaged_fields.items():
+            with self.subTest(field=field):
+                with self.assertRaises(ValueError):
+                    Topology.from_bytes(
+                        marshal.dumps({**compiled, field: value}))
+
+    def test_load_compiled_write_error(self):
+        with patch('pyndemic.topology.os.replace',
+                   side_effect=OSError('No space left')), \
+                patch('pyndemic.topology.logger.warning') as warning:
+            topology = load_compiled(self.settings, self.cache_dir)
+        warning.assert_called_once()
+        self.assertSameTopology(self.topology, topology)
+        self.assertEqual([], os.listdir(self.cache_dir))
+
+    def test_load_compiled(self):
+        topology = load_compiled(self.settings, self.cache_dir)
+        filename = op.join(self.cache_dir,
+                           f'{settings_hash(self.settings)}.board')
+        self.assertTrue(op.exists(filename))
+        self.assertSameTopology(self.topology, topology)
+
+        with open(filename, 'rb') as board_file:
+            data = board_file.read()
+        self.assertSameTopology(self.topology,
+                                load_compiled(self.settings, self.cache_dir))
+
+        with open(filename, 'wb') as board_file:
+            board_file.write(data[:10])
+        with patch('pyndemic.topology.logger.warning') as warning:
+            topology = load_compiled(self.settings, self.cache_dir)
+        warning.assert_called_once()
+        self.assertSameTopology(self.topology, topology)
+        with open(filename, 'rb') as board_file:
+            self.assertEqual(data, board_file.read())
+
+    def test_settings_hash(self):
+        other_config = config.read_config(SETTINGS_LOCATION)
+        other_config['Connections']['Tula'] = '30 31'
+        other_settings = config.GameSettings.from_config(other_config)
+        self.assertEqual(settings_hash(self.settings),
+                         settings_hash(self.settings.replace(epidemics=6)))
+        self.assertNotEqual(settings_hash(self.settings),
+                            settings_hash(other_settings))
@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+import json
+import os.path as op
+import tempfile
+
+from pyndemic import tracing
+from pyndemic.core import api
+from pyndemic.controller import GameController
+
+
+class TracerTestCase(TestCase):
+    def test_span(self):
+        tracer = tracing.Tracer('game')
+        with tracer.span('phase', 'test', {'x': 1}):
+            pass
+
+        span, = tracer.events
+        self.assertEqual('X', span['ph'])
+        self.assertEqual('phase', span['name'])
+        self.assertEqual({'x': 1}, span['args'])
+        self.assertGreaterEqual(span['dur'], 0)
+        metadata = tracer.to_dict()['traceEvents'][0]
+        self.assertEqual('M', metadata['ph'])
+        self.assertEqual({'name': 'game'}, metadata['args'])
+
+
+class GameTracingTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = op.join(directory.name, 'trace.json')
+
+    def test_controller_trace(self):
+        controller = GameController(random_state=42, players=['A', 'B'],
+                                    trace=self.filename)
+        untraced = GameController(random_state=42, players=['A', 'B'])
+        pass_request = {'type': api.RequestTypes.COMMAND,
+                        'command': api.GameplayCommands.PASS, 'args': {}}
+        with controller, untraced:
+            for _ in range(4):
+                controller.send(pass_request)
+                untraced.send(pass_request)
+            self.assertNotIn('tracer', untraced._ctx)
+
+        with open(self.filename) as trace_file:
+            trace = json.load(trace_file)
+        names = [event['name'] for event in trace['traceEvents']]
+        self.assertLessEqual(
+            {'start_turn', 'end_turn', 'infect_city_phase', 'command: pass'},
+            set(names))
+        self.assertEqual(4, names.count('command: pass'))
+        self.assertNotIn('tracer', controller._ctx)
+
+    def test_outbreak_span(self):
+        controller = GameController(random_state=42, players=['A', 'B'])
+        with controller:
+            tracer = tracing.enable_tracing(controller._ctx)
+            self.addCleanup(tracing.disable_tracing, controller._ctx)
+            for _ in range(4):
+                controller.game.infect_city('Atlanta', 'Blue')
+
+        span, = [event for event in tracer.events
+                 if event['name'] == 'outbreak']
+        self.assertEqual(
+            {'city': 'Atlanta', 'colour': 'Blue', 'outbreaks': 1},
+            span['args'])
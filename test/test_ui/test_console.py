@@ -3,7 +3,8 @@
 from io import StringIO
 
 import os.path as op
-from pyndemic.ui.console import ConsoleIO, ConsoleUI
+from pyndemic.core.api import RequestTypes
+from pyndemic.ui.console import ConsoleIO, ConsoleUI, parse_request
 
 
 INPUT_LOCATION = op.join(op.dirname(__file__), 'test_input.txt')
@@ -46,3 +47,31 @@ def test_context(self, mock_input, mock_stdout):
 # There is a test in test_controller.py that relies on ConsoleUI
 class ConsoleUICase(unittest.TestCase):
     pass
+
+
+class ParseRequestTestCase(unittest.TestCase):
+    def test_move(self):
+        request = parse_request('move London')
+        self.assertEqual(RequestTypes.COMMAND, request['type'])
+        self.assertEqual('move', request['command'])
+        self.assertEqual({'destination': 'London'}, request['args'])
+
+    def test_play(self):
+        request = parse_request('play "Government Grant" London')
+        self.assertEqual('play', request['command'])
+        self.assertEqual(
+            {'card': 'Government Grant', 'card_args': ['London']},
+            request['args'])
+
+        request = parse_request("play 'Quiet Night'")
+        self.assertEqual({'card': 'Quiet Night', 'card_args': []},
+                         request['args'])
+
+        for text in ('play', 'play "Quiet Night'):
+            with self.subTest(text=text):
+                with self.assertRaises(LookupError):
+                    parse_request(text)
+
+    def test_unknown_command(self):
+        with self.assertRaises(LookupError):
+            parse_request('dance')